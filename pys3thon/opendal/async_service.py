@@ -0,0 +1,274 @@
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ..s3.bulk import BulkResult
+from .operator_cache import OperatorCache
+from .service import _IfMatchClient
+
+DEFAULT_CHUNK_SIZE_16MB = 16 * 1024 * 1024
+DEFAULT_MAX_CONCURRENT_TRANSFERS = 16
+
+
+class AsyncOpenDALService:
+    def __init__(
+        self,
+        max_concurrency=DEFAULT_MAX_CONCURRENT_TRANSFERS,
+        download_cache=None,
+        operator_cache=None,
+    ):
+        """
+        Async counterpart of OpenDALService, so that many transfers between
+        S3, Azure Blob, Dropbox and the local filesystem run concurrently in
+        one event loop.
+
+        Clients backed by an OpenDAL Operator are read and written through its
+        AsyncOperator. Other clients, such as OpenDALS3Client, are driven on
+        worker threads so they don't block the loop.
+
+        :param max_concurrency: Number of transfers running at once in each
+            event loop the service is used from, further transfers wait for
+            one to finish.
+        :param download_cache: Optional DownloadCache used by
+            download_to_temporary_file for clients that expose a `bucket` and
+            report an ETag from `stat`.
+        :param operator_cache: OperatorCache the service's async operators are
+            built and reused from. Defaults to a cache owned by the service.
+        """
+        self.max_concurrency = max_concurrency
+        self.download_cache = download_cache
+        self.operator_cache = operator_cache or OperatorCache()
+        # asyncio.Semaphore binds to the loop it first waits in, so each loop
+        # the service is used from gets its own
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    async def copy(
+        self,
+        source_client,
+        source_path,
+        destination_client,
+        destination_path,
+        read_chunk_size=DEFAULT_CHUNK_SIZE_16MB,
+    ):
+        async with self._semaphore():
+            await self._copy(
+                _async_storage(source_client),
+                source_path,
+                _async_storage(destination_client),
+                destination_path,
+                read_chunk_size,
+            )
+
+    async def copy_many(self, copies, read_chunk_size=DEFAULT_CHUNK_SIZE_16MB):
+        """
+        :param copies: Iterable of (source_client, source_path,
+            destination_client, destination_path) tuples.
+        :return: BulkResult with a None result for each successful copy.
+        """
+        return await self._gather(
+            lambda *item: self.copy(*item, read_chunk_size=read_chunk_size), copies
+        )
+
+    def _semaphore(self):
+        return self._semaphores.setdefault(
+            asyncio.get_running_loop(), asyncio.Semaphore(self.max_concurrency)
+        )
+
+    def get_operator(self, scheme, **config):
+        """
+        Long-lived OpenDAL AsyncOperator for `scheme` and `config`, built once
+        and reused by later calls with the same arguments.
+        """
+        return self.operator_cache.get_async(scheme, **config)
+
+    async def download(self, download_client, download_from_path, save_path):
+        await self.copy(
+            download_client,
+            download_from_path,
+            self.get_operator("fs", root="/"),
+            str(save_path),
+        )
+
+    async def download_many(self, downloads):
+        """
+        :param downloads: Iterable of (download_client, download_from_path,
+            save_path) tuples.
+        :return: BulkResult with a None result for each successful download.
+        """
+        return await self._gather(self.download, downloads)
+
+    @asynccontextmanager
+    async def download_to_temporary_file(
+        self, download_client, download_from_path, file_name=None
+    ):
+        download_from_path = str(download_from_path)
+        if file_name is None:
+            file_name = download_from_path.split("/")[-1]
+        if self._is_cacheable(download_client):
+            async with self._download_to_temporary_file_from_cache(
+                download_client, download_from_path, file_name
+            ) as save_path:
+                yield save_path
+            return
+
+        temp_directory = TemporaryDirectory()
+        try:
+            save_path = Path(temp_directory.name) / file_name
+            await self.download(download_client, download_from_path, str(save_path))
+            yield save_path
+        finally:
+            temp_directory.cleanup()
+
+    def _is_cacheable(self, download_client):
+        return (
+            self.download_cache is not None
+            and getattr(download_client, "bucket", None) is not None
+        )
+
+    @asynccontextmanager
+    async def _download_to_temporary_file_from_cache(
+        self, download_client, download_from_path, file_name
+    ):
+        etag = (await _async_storage(download_client).stat(download_from_path)).etag
+        loop = asyncio.get_running_loop()
+
+        def download_fn(path):
+            # DownloadCache.link holds a file lock while it populates the
+            # entry, so it runs on a thread and hands the download back here
+            asyncio.run_coroutine_threadsafe(
+                self.download(
+                    _IfMatchClient(download_client, etag),
+                    download_from_path,
+                    str(path),
+                ),
+                loop,
+            ).result()
+
+        with self.download_cache.temporary_directory() as temp_directory:
+            save_path = temp_directory / file_name
+            await asyncio.to_thread(
+                self.download_cache.link,
+                download_client.bucket,
+                download_from_path,
+                etag,
+                save_path,
+                download_fn,
+            )
+            yield save_path
+
+    @staticmethod
+    async def _copy(
+        source, source_path, destination, destination_path, read_chunk_size
+    ):
+        total_size = (await source.stat(source_path)).content_length
+        bytes_written = 0
+
+        source_file = await source.open(source_path, "rb")
+        try:
+            destination_file = await destination.open(destination_path, "wb")
+            try:
+                # read the next chunk while the previous one is being written
+                chunk = await source_file.read(min(read_chunk_size, total_size))
+                while chunk and bytes_written < total_size:
+                    write = asyncio.ensure_future(destination_file.write(chunk))
+                    bytes_written += len(chunk)
+                    remaining = total_size - bytes_written
+                    try:
+                        chunk = (
+                            await source_file.read(min(read_chunk_size, remaining))
+                            if remaining > 0
+                            else b""
+                        )
+                    finally:
+                        await write
+                if bytes_written != total_size:
+                    raise IOError(
+                        f"Copy incomplete. Expected {total_size} bytes but wrote {bytes_written} bytes"
+                    )
+            except BaseException:
+                # closing would publish the partial object
+                await destination.abort(destination_path, destination_file)
+                raise
+            await destination_file.close()
+        finally:
+            await source_file.close()
+
+    @staticmethod
+    async def _gather(fn, items):
+        items = [tuple(item) for item in items]
+        outcomes = await asyncio.gather(
+            *(fn(*item) for item in items), return_exceptions=True
+        )
+        result = BulkResult()
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                result.failed[item] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                result.results[item] = outcome
+        return result
+
+
+def _async_storage(client):
+    from opendal import AsyncOperator, Operator
+
+    if isinstance(client, AsyncOperator):
+        return _AsyncOperatorStorage(client)
+    if isinstance(client, Operator):
+        return _AsyncOperatorStorage(client.to_async_operator())
+    operator = getattr(client, "operator", None)
+    if isinstance(operator, Operator):
+        return _AsyncOperatorStorage(operator.to_async_operator())
+    return _ThreadedStorage(client)
+
+
+class _AsyncOperatorStorage:
+    def __init__(self, operator):
+        self._operator = operator
+
+    async def stat(self, path):
+        return await self._operator.stat(path)
+
+    async def open(self, path, mode):
+        return await self._operator.open(path, mode)
+
+    async def abort(self, path, file):
+        # OpenDAL writers can't be cancelled, so the written part is removed
+        await file.close()
+        await self._operator.delete(path)
+
+
+class _ThreadedStorage:
+    def __init__(self, client):
+        self._client = client
+
+    async def stat(self, path):
+        return await asyncio.to_thread(self._client.stat, path)
+
+    async def open(self, path, mode):
+        return _ThreadedFile(await asyncio.to_thread(self._client.open, path, mode))
+
+    async def abort(self, path, file):
+        if hasattr(file._file, "abort"):
+            # e.g. S3MultipartWriter, which aborts its multipart upload
+            await asyncio.to_thread(file._file.abort)
+            return
+        await file.close()
+        await asyncio.to_thread(self._client.delete, path)
+
+
+class _ThreadedFile:
+    def __init__(self, file):
+        self._file = file
+
+    async def read(self, size):
+        return await asyncio.to_thread(self._file.read, size)
+
+    async def write(self, data):
+        return await asyncio.to_thread(self._file.write, data)
+
+    async def close(self):
+        await asyncio.to_thread(self._file.close)
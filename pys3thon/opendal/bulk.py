@@ -0,0 +1,231 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, CancelledError, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Thread
+
+from ..s3.bulk import BulkResult, DeleteError
+
+DEFAULT_BULK_CONCURRENCY = 10
+DEFAULT_MAX_BYTES_IN_FLIGHT_256MB = 256 * 1024 * 1024
+DEFAULT_MULTIPART_THRESHOLD_8MB = 8 * 1024 * 1024
+DEFAULT_PART_SIZE_8MB = 8 * 1024 * 1024
+DEFAULT_PART_CONCURRENCY = 4
+_END = object()
+
+
+@dataclass
+class BulkWriteResult:
+    written: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+    bytes_written: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self):
+        return not self.failed
+
+    @property
+    def throughput(self):
+        """Bytes written per second across all items."""
+        return self.bytes_written / self.elapsed if self.elapsed else 0.0
+
+
+def iter_reads(paths, submit_read, concurrency, ordered, max_bytes_in_flight):
+    """
+    Read many objects concurrently and yield (path, bytes) pairs.
+
+    At most `concurrency` reads run at once. No new read is started while
+    the bytes read but not yet yielded reach `max_bytes_in_flight`, so a
+    slow consumer, or a slow object holding back ordered results, bounds
+    memory to about `max_bytes_in_flight` plus `concurrency` objects.
+
+    :param paths: Iterable of paths, consumed lazily.
+    :param submit_read: Called with a path, returns a concurrent.futures
+        Future of its bytes.
+    :param ordered: Yield results in the order of `paths` instead of as they
+        complete.
+    """
+    paths = iter(paths)
+    running = {}
+    ready = {}
+    buffered = 0
+    submitted = 0
+    next_index = 0
+    exhausted = False
+    try:
+        while True:
+            while (
+                not exhausted
+                and len(running) < concurrency
+                and buffered < max_bytes_in_flight
+            ):
+                path = next(paths, _END)
+                if path is _END:
+                    exhausted = True
+                    break
+                running[submit_read(path)] = (submitted, path)
+                submitted += 1
+
+            index = next_index if ordered else next(iter(ready), None)
+            if index in ready:
+                path, data, error = ready.pop(index)
+                if error is not None:
+                    raise error
+                buffered -= len(data)
+                next_index += 1
+                yield path, data
+                continue
+            if not running:
+                return
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, path = running.pop(future)
+                # a failed read is raised in turn, after the results before it
+                if future.cancelled():
+                    error = CancelledError(f"read of {path} was cancelled")
+                else:
+                    error = future.exception()
+                data = b"" if error is not None else future.result()
+                ready[index] = (path, data, error)
+                buffered += len(data)
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def run_writes(items, submit_write, concurrency, max_bytes_in_flight):
+    """
+    Write many objects concurrently, collecting per-item failures instead of
+    stopping at the first one.
+
+    At most `concurrency` writes run at once, and no new write starts while
+    the payloads being written total `max_bytes_in_flight` or more, so
+    `items` can be a lazy iterable of any length.
+
+    :param items: Iterable of (path, data) pairs, consumed lazily.
+    :param submit_write: Called with a path and its data, returns a
+        concurrent.futures Future that completes when the write has.
+    :return: BulkWriteResult.
+    """
+    result = BulkWriteResult()
+    start = time.perf_counter()
+    items = iter(items)
+    running = {}
+    in_flight = 0
+    exhausted = False
+    while True:
+        while (
+            not exhausted
+            and len(running) < concurrency
+            and in_flight < max_bytes_in_flight
+        ):
+            item = next(items, _END)
+            if item is _END:
+                exhausted = True
+                break
+            path, data = item
+            try:
+                with memoryview(data) as view:
+                    size = view.nbytes
+                future = submit_write(path, data)
+            except Exception as e:
+                result.failed[path] = e
+                continue
+            running[future] = (path, size)
+            in_flight += size
+        if not running:
+            break
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            path, size = running.pop(future)
+            in_flight -= size
+            try:
+                future.result()
+            except Exception as e:
+                result.failed[path] = e
+            else:
+                result.written.append(path)
+                result.bytes_written += size
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def run_many(paths, submit, concurrency):
+    """
+    Call `submit(path)` for every path with at most `concurrency` calls
+    running at once.
+
+    :param paths: Iterable of paths, consumed lazily.
+    :param submit: Called with a path, returns a concurrent.futures Future.
+    :return: BulkResult mapping each path to its result or exception.
+    """
+    result = BulkResult()
+    paths = iter(paths)
+    running = {}
+    exhausted = False
+    while True:
+        while not exhausted and len(running) < concurrency:
+            path = next(paths, _END)
+            if path is _END:
+                exhausted = True
+                break
+            running[submit(path)] = path
+        if not running:
+            return result
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            path = running.pop(future)
+            try:
+                result.results[path] = future.result()
+            except Exception as e:
+                result.failed[path] = e
+
+
+def verify_deleted(result, submit_exists, concurrency):
+    """
+    Check that the paths a delete reported as deleted are gone, in one
+    concurrent pass, moving any that still exist to `result.failed`.
+
+    :param submit_exists: Called with a path, returns a concurrent.futures
+        Future of whether it still exists.
+    """
+    checks = run_many(list(result.results), submit_exists, concurrency)
+    for path, exists in checks.results.items():
+        if exists:
+            del result.results[path]
+            result.failed[path] = DeleteError(
+                path, "NotDeleted", "object still exists after delete"
+            )
+    for path, exception in checks.failed.items():
+        del result.results[path]
+        result.failed[path] = exception
+    return result
+
+
+@contextmanager
+def event_loop_thread():
+    """
+    Event loop running on a background thread, so synchronous code can run
+    coroutines on async operators with `asyncio.run_coroutine_threadsafe`.
+    """
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    thread = Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield loop
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        # let reads abandoned by the caller finish cancelling
+        tasks = asyncio.all_tasks(loop)
+        if tasks:
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
@@ -0,0 +1,53 @@
+import io
+import os
+
+
+class EncryptedOpenDALClient:
+    def __init__(self, client, encryption):
+        """
+        Encrypt objects client-side as they are written and decrypt them as
+        they are read, see EnvelopeEncryption for the format.
+
+        :param client: OpenDALClient to store the encrypted objects with.
+        :param encryption: EnvelopeEncryption holding the master key.
+        """
+        self.client = client
+        self.encryption = encryption
+
+    def write(self, path: str, data: bytes):
+        self.write_fileobj(path, io.BytesIO(data))
+
+    def write_fileobj(self, path: str, fileobj):
+        with self.client.open(path, "wb") as f:
+            self.encryption.encrypt_stream(fileobj, f)
+
+    def write_file(self, path: str, local_path):
+        with open(local_path, "rb") as f:
+            self.write_fileobj(path, f)
+
+    def read(self, path: str) -> bytes:
+        decrypted = io.BytesIO()
+        with self.client.open(path, "rb") as f:
+            self.encryption.decrypt_stream(f, decrypted)
+        return decrypted.getvalue()
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes:
+        return self.encryption.decrypt_range(
+            lambda start, size: self.client.read_range(path, start, size),
+            self.client.stat(path).content_length,
+            offset,
+            length,
+        )
+
+    def download(self, path: str, local_path):
+        """
+        Stream and decrypt an object into `local_path`. The file is removed if
+        the object fails to decrypt.
+        """
+        try:
+            with self.client.open(path, "rb") as src, open(local_path, "wb") as dst:
+                self.encryption.decrypt_stream(src, dst)
+        except BaseException:
+            if os.path.exists(local_path):
+                os.remove(local_path)
+            raise
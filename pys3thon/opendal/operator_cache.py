@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from threading import Lock
+
+DEFAULT_MAX_OPERATORS = 64
+
+
+class OperatorCache:
+    def __init__(self, max_size=DEFAULT_MAX_OPERATORS):
+        """
+        Thread-safe cache of OpenDAL operators keyed by (scheme, config), so
+        that long-lived workers build each operator once instead of per
+        transfer. Operators are safe to share between threads.
+
+        :param max_size: Number of operators kept, the least recently used is
+            dropped beyond it.
+        """
+        self.max_size = max_size
+        self._operators = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, scheme, **config):
+        """
+        Operator for `scheme` and `config`, e.g. `get("fs", root="/")`.
+        """
+        from opendal import Operator
+
+        return self._get(Operator, scheme, config)
+
+    def get_async(self, scheme, **config):
+        from opendal import AsyncOperator
+
+        return self._get(AsyncOperator, scheme, config)
+
+    def __len__(self):
+        return len(self._operators)
+
+    def clear(self):
+        with self._lock:
+            self._operators.clear()
+
+    def _get(self, operator_class, scheme, config):
+        key = (operator_class.__name__, scheme, tuple(sorted(config.items())))
+        with self._lock:
+            operator = self._operators.get(key)
+            if operator is not None:
+                self._operators.move_to_end(key)
+                return operator
+        # building an operator can be slow, so other lookups aren't held up
+        # by it; if two threads race the first one stored wins
+        operator = operator_class(scheme, **config)
+        with self._lock:
+            operator = self._operators.setdefault(key, operator)
+            self._operators.move_to_end(key)
+            while len(self._operators) > self.max_size:
+                self._operators.popitem(last=False)
+            return operator
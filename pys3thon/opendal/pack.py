@@ -0,0 +1,133 @@
+import gzip
+import io
+import json
+
+DEFAULT_PACK_SIZE_128MB = 128 * 1024 * 1024
+PACK_FORMAT_VERSION = 1
+INDEX_FILE_NAME = "index.json.gz"
+
+
+class PackWriter:
+    def __init__(self, client, prefix: str, pack_size: int = DEFAULT_PACK_SIZE_128MB):
+        """
+        Write many small blobs as a few large pack objects plus one index
+        object, so that storing millions of tiny files costs a handful of
+        requests instead of one per file.
+
+        Blobs are streamed into `{prefix}/pack-00000.bin`, `pack-00001.bin`...
+        through `client.open(path, "wb")`, starting a new pack once the current
+        one reaches `pack_size` bytes. The index, mapping each path to its pack,
+        offset and length, is written to `{prefix}/index.json.gz` on close.
+
+        :param client: OpenDALClient to write the pack and index objects with.
+        :param prefix: Path prefix the pack is stored under.
+        :param pack_size: Size in bytes after which a new pack object is started.
+        """
+        self._client = client
+        self._prefix = prefix.rstrip("/")
+        self._pack_size = pack_size
+        self._packs = []
+        self._entries = {}
+        self._pack_file = None
+        self._pack_offset = 0
+        self._closed = False
+
+    def add(self, path: str, data: bytes):
+        if self._closed:
+            raise ValueError("PackWriter is closed")
+        if self._pack_file is None:
+            self._open_next_pack()
+
+        with memoryview(data) as view:
+            size = view.nbytes
+            # Python file objects such as S3MultipartWriter take any buffer,
+            # OpenDAL files only take bytes
+            if isinstance(data, bytes) or isinstance(self._pack_file, io.IOBase):
+                self._pack_file.write(data)
+            else:
+                self._pack_file.write(view.tobytes())
+        self._entries[path] = [len(self._packs) - 1, self._pack_offset, size]
+        self._pack_offset += size
+
+        if self._pack_offset >= self._pack_size:
+            self._close_pack()
+
+    def add_file(self, path: str, local_path):
+        with open(local_path, "rb") as f:
+            self.add(path, f.read())
+
+    def close(self):
+        if self._closed:
+            return
+        self._close_pack()
+        index = {
+            "version": PACK_FORMAT_VERSION,
+            "packs": self._packs,
+            "entries": self._entries,
+        }
+        self._client.write(
+            f"{self._prefix}/{INDEX_FILE_NAME}",
+            gzip.compress(json.dumps(index, separators=(",", ":")).encode()),
+        )
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._pack_file is not None:
+            # don't complete a partially written pack if the writer supports it
+            getattr(self._pack_file, "abort", self._pack_file.close)()
+
+    def _open_next_pack(self):
+        pack_name = f"pack-{len(self._packs):05d}.bin"
+        self._pack_file = self._client.open(f"{self._prefix}/{pack_name}", "wb")
+        self._packs.append(pack_name)
+        self._pack_offset = 0
+
+    def _close_pack(self):
+        if self._pack_file is not None:
+            self._pack_file.close()
+            self._pack_file = None
+
+
+class PackReader:
+    def __init__(self, client, prefix: str):
+        """
+        Read blobs written by PackWriter. The index is loaded once and each
+        `read` is a single ranged read of the pack object holding the blob.
+
+        :param client: OpenDALClient the pack was written with.
+        :param prefix: Path prefix the pack is stored under.
+        """
+        self._client = client
+        self._prefix = prefix.rstrip("/")
+        index = json.loads(
+            gzip.decompress(bytes(client.read(f"{self._prefix}/{INDEX_FILE_NAME}")))
+        )
+        if index["version"] != PACK_FORMAT_VERSION:
+            raise ValueError(f"Unsupported pack format version: {index['version']}")
+        self._packs = index["packs"]
+        self._entries = index["entries"]
+
+    def read(self, path: str) -> bytes:
+        try:
+            pack_number, offset, length = self._entries[path]
+        except KeyError:
+            raise FileNotFoundError(
+                f"{path} not found in pack {self._prefix}"
+            ) from None
+        return self._client.read_range(
+            f"{self._prefix}/{self._packs[pack_number]}", offset, length
+        )
+
+    def __contains__(self, path: str):
+        return path in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
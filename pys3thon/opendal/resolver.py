@@ -0,0 +1,117 @@
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from .shared import StorageScheme
+
+DEFAULT_MAX_CLIENTS = 256
+DEFAULT_DECRYPT_CONCURRENCY = 8
+
+_S3ClientKey = namedtuple(
+    "_S3ClientKey",
+    ["bucket", "region", "endpoint", "access_key_id", "encrypted_secret_access_key"],
+)
+
+
+class DescriptorResolver:
+    def __init__(
+        self,
+        decrypt_fn,
+        max_clients=DEFAULT_MAX_CLIENTS,
+        decrypt_concurrency=DEFAULT_DECRYPT_CONCURRENCY,
+    ):
+        """
+        Resolve JSON storage descriptors to (client, path) pairs in bulk,
+        without building a JSONStorageDescriptor and StorageDescriptor for
+        each one.
+
+        Descriptors are grouped by bucket and credentials. Each distinct
+        encrypted secret is decrypted once and remembered, concurrently when
+        there are several. One client is created per group and kept for later
+        calls, and clients with the same credentials, region and endpoint
+        share one S3Client.
+
+        :param decrypt_fn: Called with an encrypted secret access key to
+            decrypt it, as for StorageDescriptor.decrypt.
+        :param max_clients: Number of clients kept, the least recently used is
+            dropped beyond it.
+        :param decrypt_concurrency: Number of secrets decrypted concurrently.
+        """
+        self.decrypt_fn = decrypt_fn
+        self.max_clients = max_clients
+        self.decrypt_concurrency = decrypt_concurrency
+        self._secrets = {}
+        self._clients = OrderedDict()
+        self._s3_clients = OrderedDict()
+        self._lock = Lock()
+
+    def resolve(self, json_descriptor):
+        return self.resolve_many([json_descriptor])[0]
+
+    def resolve_many(self, json_descriptors):
+        """
+        :param json_descriptors: Iterable of JSON descriptors, as accepted by
+            JSONStorageDescriptor.create_from_json_descriptor.
+        :return: List of (client, path) tuples in the order of
+            `json_descriptors`.
+        """
+        entries = [_s3_entry(json_descriptor) for json_descriptor in json_descriptors]
+        client_keys = {client_key for client_key, _ in entries}
+        self._decrypt_secrets(
+            {client_key.encrypted_secret_access_key for client_key in client_keys}
+        )
+        clients = {client_key: self._client(client_key) for client_key in client_keys}
+        return [(clients[client_key], path) for client_key, path in entries]
+
+    def _decrypt_secrets(self, encrypted_secrets):
+        pending = [
+            secret for secret in encrypted_secrets if secret not in self._secrets
+        ]
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=self.decrypt_concurrency) as executor:
+            decrypted = list(executor.map(self.decrypt_fn, pending))
+        with self._lock:
+            self._secrets.update(zip(pending, decrypted))
+
+    def _client(self, client_key):
+        from .s3.client import OpenDALS3Client
+
+        # buckets with the same credentials, region and endpoint share an
+        # S3Client, whose boto3 client is expensive to create
+        credentials_key = client_key[1:]
+        with self._lock:
+            client = self._clients.get(client_key)
+            if client is not None:
+                self._clients.move_to_end(client_key)
+                return client
+            s3_client = self._s3_clients.get(credentials_key)
+            client = OpenDALS3Client(
+                bucket=client_key.bucket,
+                region=client_key.region,
+                endpoint=client_key.endpoint,
+                access_key_id=client_key.access_key_id,
+                secret_access_key=self._secrets[client_key.encrypted_secret_access_key],
+                s3_client=s3_client,
+            )
+            if s3_client is None:
+                self._s3_clients[credentials_key] = client.operator
+            self._s3_clients.move_to_end(credentials_key)
+            self._clients[client_key] = client
+            for pool in (self._clients, self._s3_clients):
+                while len(pool) > self.max_clients:
+                    pool.popitem(last=False)
+            return client
+
+
+def _s3_entry(json_descriptor):
+    if json_descriptor["scheme"] != StorageScheme.S3.value:
+        raise ValueError(f"Unsupported storage scheme: {json_descriptor['scheme']}")
+    client_key = _S3ClientKey(
+        json_descriptor["bucket"],
+        json_descriptor.get("region"),
+        json_descriptor.get("endpoint"),
+        json_descriptor["awsAccessKeyId"],
+        json_descriptor["encryptedAwsSecretAccessKey"],
+    )
+    return client_key, json_descriptor["key"]
@@ -1,8 +1,19 @@
-from io import BytesIO, IOBase
+from concurrent.futures import ThreadPoolExecutor
+from io import IOBase, TextIOWrapper
+from threading import Lock
 
-from smart_open import open
-
-from ...s3.client import S3Client
+from ...s3.bulk import DeleteError
+from ...utils.compression import compress
+from ..bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_MAX_BYTES_IN_FLIGHT_256MB,
+    DEFAULT_MULTIPART_THRESHOLD_8MB,
+    DEFAULT_PART_CONCURRENCY,
+    DEFAULT_PART_SIZE_8MB,
+    iter_reads,
+    run_writes,
+    verify_deleted,
+)
 from ..shared import OpenDALClient
 
 
@@ -14,6 +25,7 @@ class OpenDALS3Client(OpenDALClient):
         endpoint=None,
         access_key_id=None,
         secret_access_key=None,
+        s3_client=None,
     ):
         """
         Initialize the OpenDALS3Client with AWS credentials and configuration.
@@ -23,6 +35,8 @@ class OpenDALS3Client(OpenDALClient):
         :param endpoint: Custom S3 endpoint URL.
         :param access_key_id: AWS access key ID.
         :param secret_access_key: AWS secret access key.
+        :param s3_client: S3Client created with the same credentials, region
+            and endpoint to share with other clients instead of creating one.
         """
         self._bucket = bucket
         self._region = region
@@ -30,25 +44,81 @@ class OpenDALS3Client(OpenDALClient):
         self._access_key_id = access_key_id
         self._secret_access_key = secret_access_key
 
+        # boto3 is slow to import and set up, so the S3 client is only created
+        # on first use
+        self._operator = s3_client
+        self._operator_lock = Lock()
+
+    @property
+    def operator(self):
+        if self._operator is None:
+            with self._operator_lock:
+                if self._operator is None:
+                    self._operator = self._create_operator()
+        return self._operator
+
+    def _create_operator(self):
+        from ...s3.client import S3Client
+
         # Initialize S3 client with credentials
         credentials = None
-        if access_key_id and secret_access_key:
+        if self._access_key_id and self._secret_access_key:
             credentials = {
-                "aws_access_key_id": access_key_id,
-                "aws_secret_access_key": secret_access_key,
+                "aws_access_key_id": self._access_key_id,
+                "aws_secret_access_key": self._secret_access_key,
             }
 
-        self.operator = S3Client(
+        return S3Client(
             credentials=credentials,
-            endpoint_url=endpoint,
-            region_name=region,
+            endpoint_url=self._endpoint,
+            region_name=self._region,
         )
 
-    def read(self, path: str) -> bytes:
+    def read(self, path: str, decompress: bool = False) -> bytes:
+        if decompress:
+            with self.operator.get_streaming_body(
+                self._bucket, path, decompress=True
+            ) as body:
+                return body.read()
         with self.operator.download_to_temporary_file(self._bucket, path) as temp_file:
             with open(temp_file, "rb") as f:
                 return f.read()
 
+    def read_many(
+        self,
+        paths,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        ordered: bool = True,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT_256MB,
+    ):
+        """
+        Read many objects with concurrent GetObject calls sharing the S3
+        client's connection pool, yielding (path, bytes) pairs as they arrive.
+
+        :param concurrency: Number of reads running at once.
+        :param ordered: Yield results in the order of `paths`.
+        :param max_bytes_in_flight: No new read starts while this many bytes
+            are read but not yet consumed.
+        """
+        client = self.operator.client
+
+        def read(path):
+            response = client.get_object(Bucket=self._bucket, Key=path)
+            with response["Body"] as body:
+                return body.read()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            yield from iter_reads(
+                paths,
+                lambda path: executor.submit(read, path),
+                concurrency,
+                ordered,
+                max_bytes_in_flight,
+            )
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes:
+        return self.operator.read_range(self._bucket, path, offset, length)
+
     def presign_read(self, path: str, expiration: int) -> str:
         class PresignedUrl:
             def __init__(self, url):
@@ -69,21 +139,157 @@ class OpenDALS3Client(OpenDALClient):
             def content_length(self):
                 return self.stat["ContentLength"]
 
+            @property
+            def etag(self):
+                return self.stat.get("ETag")
+
+            @property
+            def content_encoding(self):
+                return self.stat.get("ContentEncoding")
+
         return Stat(self.operator.head_object(self._bucket, path))
 
-    def open(self, path: str, mode: str = "rb") -> IOBase:
+    def open(
+        self, path: str, mode: str = "rb", if_match: str = None, **kwargs
+    ) -> IOBase:
+        """
+        Open an object for reading or writing. Writes go through a
+        S3MultipartWriter, `kwargs` (e.g. `part_size`, `max_concurrency`) are
+        passed on to it.
+
+        :param if_match: When reading, only read the version of the object
+            with this ETag, failing with a 412 Precondition Failed error if it
+            has been overwritten.
+        """
+        if "w" in mode:
+            writer = self.operator.open_multipart_writer(self._bucket, path, **kwargs)
+            return writer if "b" in mode else _AbortingTextIOWrapper(writer)
+
+        from smart_open import open
+
+        transport_params = {"client": self.operator.client}
+        if if_match is not None:
+            transport_params["client_kwargs"] = {
+                "S3.Client.get_object": {"IfMatch": if_match}
+            }
         return open(
             f"s3://{self._bucket}/{path}",  # noqa
             mode,
-            transport_params={"client": self.operator.client},
+            transport_params=transport_params,
         )
 
-    def write(self, path: str, data: bytes):
-        fileobj = BytesIO(data)
-        self.operator.upload_fileobj(fileobj, self._bucket, path)
+    def write(
+        self,
+        path: str,
+        data: bytes,
+        content_encoding: str = None,
+        compression_level: int = None,
+        compression_threads: int = 0,
+    ):
+        """
+        :param content_encoding: "gzip" or "zstd" to compress `data` and set
+            the object's Content-Encoding.
+        """
+        if content_encoding is None:
+            self.operator.upload_buffer(data, self._bucket, path)
+            return
+        self.operator.upload_buffer(
+            compress(
+                data,
+                content_encoding,
+                level=compression_level,
+                threads=compression_threads,
+            ),
+            self._bucket,
+            path,
+            ContentEncoding=content_encoding,
+        )
+
+    def write_many(
+        self,
+        items,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD_8MB,
+        part_size: int = DEFAULT_PART_SIZE_8MB,
+        part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT_256MB,
+    ):
+        """
+        Write many objects concurrently. Payloads up to `multipart_threshold`
+        bytes are sent with a single PutObject straight from the caller's
+        buffer, larger ones as multipart uploads of `part_size` parts sent
+        `part_concurrency` at a time.
+
+        :param items: Iterable of (path, data) pairs, consumed lazily.
+        :return: BulkWriteResult with the written paths, the exception of each
+            failed path and the aggregate throughput.
+        """
+
+        def write(path, data):
+            self.operator.upload_buffer(
+                data,
+                self._bucket,
+                path,
+                multipart_threshold=multipart_threshold,
+                part_size=part_size,
+                max_concurrency=part_concurrency,
+            )
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return run_writes(
+                items,
+                lambda path, data: executor.submit(write, path, data),
+                concurrency,
+                max_bytes_in_flight,
+            )
 
-    def delete(self, path: str):
+    def delete(self, path: str, verify: bool = False):
+        """
+        :param verify: Check the object is gone afterwards, raising
+            DeleteError if it still exists.
+        """
         self.operator.delete_object(self._bucket, path)
+        if verify and self._exists(path):
+            raise DeleteError(path, "NotDeleted", "object still exists after delete")
+
+    def delete_many(
+        self,
+        paths,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        verify: bool = False,
+    ):
+        """
+        Delete many objects with DeleteObjects, 1000 paths per request.
+
+        :param paths: Iterable of paths, consumed lazily.
+        :param concurrency: Number of requests running at once.
+        :param verify: Check every deleted object is gone in one concurrent
+            pass after the deletes.
+        :return: BulkResult mapping each deleted path to None and each failed
+            path to a DeleteError or the exception of its failed request.
+        """
+        result = self.operator.delete_objects(
+            self._bucket, paths, max_concurrency=concurrency
+        )
+        if verify:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                verify_deleted(
+                    result,
+                    lambda path: executor.submit(self._exists, path),
+                    concurrency,
+                )
+        return result
+
+    def _exists(self, path):
+        from botocore.exceptions import ClientError
+
+        try:
+            self.operator.head_object(self._bucket, path)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
 
     @property
     def bucket(self):
@@ -104,3 +310,12 @@ class OpenDALS3Client(OpenDALClient):
     @property
     def secret_access_key(self):
         return self._secret_access_key
+
+
+class _AbortingTextIOWrapper(TextIOWrapper):
+    # TextIOWrapper closes its buffer when exited with an exception, which
+    # would complete the upload and publish a truncated object
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            return super().__exit__(exc_type, exc_value, traceback)
+        self.buffer.abort()
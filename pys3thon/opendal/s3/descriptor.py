@@ -1,7 +1,8 @@
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
-from ..shared import JSONStorageDescriptor, StorageDescriptor
+from ..shared import JSONStorageDescriptor, StorageDescriptor, StorageScheme
 
 
 @dataclass
@@ -39,3 +40,176 @@ class S3StorageDescriptor(StorageDescriptor):
             return
         super().decrypt()
         self.aws_secret_access_key = decrypt_fn(self.encrypted_aws_secret_access_key)
+
+
+class S3Credentials:
+    __slots__ = (
+        "aws_access_key_id",
+        "encrypted_aws_secret_access_key",
+        "aws_secret_access_key",
+    )
+
+    def __init__(
+        self,
+        aws_access_key_id,
+        encrypted_aws_secret_access_key=None,
+        aws_secret_access_key=None,
+    ):
+        """
+        Credentials shared by every CompactS3StorageDescriptor that uses them,
+        so the secret is stored and decrypted once for all of them.
+        """
+        assert (
+            encrypted_aws_secret_access_key is not None
+            or aws_secret_access_key is not None
+        )
+        self.aws_access_key_id = sys.intern(aws_access_key_id)
+        self.encrypted_aws_secret_access_key = encrypted_aws_secret_access_key
+        self.aws_secret_access_key = aws_secret_access_key
+
+    @property
+    def is_decrypted(self):
+        return self.aws_secret_access_key is not None
+
+    def decrypt(self, decrypt_fn):
+        if self.is_decrypted:
+            return
+        self.aws_secret_access_key = decrypt_fn(self.encrypted_aws_secret_access_key)
+
+    def __eq__(self, other):
+        return isinstance(other, S3Credentials) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        return (self.aws_access_key_id, self.encrypted_aws_secret_access_key)
+
+
+class CompactS3StorageDescriptor(StorageDescriptor):
+    __slots__ = ("path", "bucket", "region", "endpoint", "credentials")
+
+    def __init__(self, path, bucket, credentials, region=None, endpoint=None):
+        """
+        Memory-efficient S3StorageDescriptor for datasets of millions of
+        files. Instances have no `__dict__`, the bucket, region and endpoint
+        strings are interned and the S3Credentials object is shared, so each
+        descriptor costs little more than its path.
+
+        Create them with an S3DescriptorInterner so descriptors with the same
+        credentials share one S3Credentials.
+        """
+        self.path = path
+        self.bucket = sys.intern(bucket)
+        self.region = _intern_optional(region)
+        self.endpoint = _intern_optional(endpoint)
+        self.credentials = credentials
+
+    @property
+    def aws_access_key_id(self):
+        return self.credentials.aws_access_key_id
+
+    @property
+    def encrypted_aws_secret_access_key(self):
+        return self.credentials.encrypted_aws_secret_access_key
+
+    @property
+    def aws_secret_access_key(self):
+        return self.credentials.aws_secret_access_key
+
+    @property
+    def is_decrypted(self):
+        return self.credentials.is_decrypted
+
+    def decrypt(self, decrypt_fn):
+        self.credentials.decrypt(decrypt_fn)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, CompactS3StorageDescriptor)
+            and self.path == other.path
+            and self.bucket == other.bucket
+            and self.region == other.region
+            and self.endpoint == other.endpoint
+            and self.credentials == other.credentials
+        )
+
+    def __hash__(self):
+        return hash((self.path, self.bucket, self.region, self.endpoint))
+
+    def __repr__(self):
+        return (
+            f"CompactS3StorageDescriptor(path={self.path!r}, bucket={self.bucket!r}, "
+            f"region={self.region!r}, endpoint={self.endpoint!r}, "
+            f"aws_access_key_id={self.aws_access_key_id!r})"
+        )
+
+
+class S3DescriptorInterner:
+    def __init__(self):
+        """
+        Creates CompactS3StorageDescriptors that share one S3Credentials per
+        distinct access key ID and secret.
+        """
+        self._credentials = {}
+
+    def credentials(
+        self,
+        aws_access_key_id,
+        encrypted_aws_secret_access_key=None,
+        aws_secret_access_key=None,
+    ):
+        key = (aws_access_key_id, encrypted_aws_secret_access_key)
+        credentials = self._credentials.get(key)
+        if credentials is None:
+            credentials = S3Credentials(
+                aws_access_key_id,
+                encrypted_aws_secret_access_key=encrypted_aws_secret_access_key,
+                aws_secret_access_key=aws_secret_access_key,
+            )
+            self._credentials[key] = credentials
+        return credentials
+
+    def descriptor(
+        self,
+        bucket,
+        path,
+        aws_access_key_id,
+        encrypted_aws_secret_access_key=None,
+        aws_secret_access_key=None,
+        region=None,
+        endpoint=None,
+    ):
+        return CompactS3StorageDescriptor(
+            path,
+            bucket,
+            self.credentials(
+                aws_access_key_id,
+                encrypted_aws_secret_access_key=encrypted_aws_secret_access_key,
+                aws_secret_access_key=aws_secret_access_key,
+            ),
+            region=region,
+            endpoint=endpoint,
+        )
+
+    def from_json_descriptor(self, json_descriptor):
+        """
+        CompactS3StorageDescriptor of a JSON descriptor, as accepted by
+        JSONStorageDescriptor.create_from_json_descriptor.
+        """
+        if json_descriptor["scheme"] != StorageScheme.S3.value:
+            raise ValueError(f"Unsupported storage scheme: {json_descriptor['scheme']}")
+        return self.descriptor(
+            json_descriptor["bucket"],
+            json_descriptor["key"],
+            json_descriptor["awsAccessKeyId"],
+            encrypted_aws_secret_access_key=json_descriptor[
+                "encryptedAwsSecretAccessKey"
+            ],
+            region=json_descriptor.get("region"),
+            endpoint=json_descriptor.get("endpoint"),
+        )
+
+
+def _intern_optional(value):
+    return None if value is None else sys.intern(value)
@@ -0,0 +1,109 @@
+import gzip
+import io
+import json
+
+from .descriptor import CompactS3StorageDescriptor, S3DescriptorInterner
+
+MANIFEST_FORMAT_VERSION = 1
+_CREDENTIALS = "c"
+_LOCATION = "l"
+
+
+def write_manifest(descriptors, fileobj) -> int:
+    """
+    Write S3 storage descriptors to the writable binary file `fileobj` as a
+    gzipped JSON lines manifest, storing each distinct set of credentials
+    and location once instead of with every descriptor.
+
+    After a `{"version": 1}` header every line is one of
+    `["c", access key ID, encrypted secret]` for credentials,
+    `["l", bucket, region, endpoint, credentials number]` for a location, or
+    `[location number, path]` for a descriptor. Credentials and locations are
+    numbered in the order they appear and always precede their first use,
+    so read_manifest loads a manifest in a single streaming pass.
+
+    Only encrypted secrets are written, descriptors without one raise
+    ValueError.
+
+    :param descriptors: Iterable of S3StorageDescriptor or
+        CompactS3StorageDescriptor.
+    :return: Number of descriptors written.
+    """
+    credentials_numbers = {}
+    location_numbers = {}
+    written = 0
+    with gzip.GzipFile(fileobj=fileobj, mode="wb", mtime=0) as gzip_file:
+        writer = io.TextIOWrapper(gzip_file, encoding="utf-8")
+        _write_line(writer, {"version": MANIFEST_FORMAT_VERSION})
+        for descriptor in descriptors:
+            if descriptor.encrypted_aws_secret_access_key is None:
+                raise ValueError(
+                    f"{descriptor.path} has no encrypted secret, plaintext secrets are never written"
+                )
+            credentials = (
+                descriptor.aws_access_key_id,
+                descriptor.encrypted_aws_secret_access_key,
+            )
+            if credentials not in credentials_numbers:
+                credentials_numbers[credentials] = len(credentials_numbers)
+                _write_line(writer, [_CREDENTIALS, *credentials])
+            location = (
+                descriptor.bucket,
+                descriptor.region,
+                descriptor.endpoint,
+                credentials_numbers[credentials],
+            )
+            if location not in location_numbers:
+                location_numbers[location] = len(location_numbers)
+                _write_line(writer, [_LOCATION, *location])
+            _write_line(writer, [location_numbers[location], descriptor.path])
+            written += 1
+        writer.flush()
+        writer.detach()
+    return written
+
+
+def read_manifest(fileobj, interner=None):
+    """
+    Read the descriptors of a manifest written by write_manifest from the
+    readable binary file `fileobj`, one line at a time.
+
+    :param interner: S3DescriptorInterner to share credentials with
+        descriptors created elsewhere, defaults to a new one.
+    :return: Iterator of CompactS3StorageDescriptor.
+    """
+    interner = interner or S3DescriptorInterner()
+    credentials = []
+    locations = []
+    with gzip.GzipFile(fileobj=fileobj, mode="rb") as gzip_file:
+        lines = io.TextIOWrapper(gzip_file, encoding="utf-8")
+        header = json.loads(next(lines, "{}"))
+        if header.get("version") != MANIFEST_FORMAT_VERSION:
+            raise ValueError(f"Unsupported manifest version: {header.get('version')}")
+        for line in lines:
+            record = json.loads(line)
+            if record[0] == _CREDENTIALS:
+                credentials.append(
+                    interner.credentials(
+                        record[1], encrypted_aws_secret_access_key=record[2]
+                    )
+                )
+            elif record[0] == _LOCATION:
+                bucket, region, endpoint, credentials_number = record[1:]
+                locations.append(
+                    (bucket, region, endpoint, credentials[credentials_number])
+                )
+            else:
+                bucket, region, endpoint, location_credentials = locations[record[0]]
+                yield CompactS3StorageDescriptor(
+                    record[1],
+                    bucket,
+                    location_credentials,
+                    region=region,
+                    endpoint=endpoint,
+                )
+
+
+def _write_line(writer, record):
+    writer.write(json.dumps(record, separators=(",", ":")))
+    writer.write("\n")
@@ -2,12 +2,33 @@ from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from opendal import Operator
+from ..s3.checksums import ETagVerifier
+from .operator_cache import OperatorCache
 
 DEFAULT_CHUNK_SIZE_256MB = 256 * 1024 * 1024
+DEFAULT_ETAG_PART_SIZE_8MB = 8 * 1024 * 1024
 
 
 class OpenDALService:
+    def __init__(self, download_cache=None, operator_cache=None):
+        """
+        :param download_cache: Optional DownloadCache used by
+            download_to_temporary_file for clients that expose a `bucket` and
+            report an ETag from `stat`.
+        :param operator_cache: OperatorCache the service's operators, such as
+            the local filesystem operator downloads are written with, are
+            built and reused from. Defaults to a cache owned by the service.
+        """
+        self.download_cache = download_cache
+        self.operator_cache = operator_cache or OperatorCache()
+
+    def get_operator(self, scheme, **config):
+        """
+        Long-lived OpenDAL Operator for `scheme` and `config`, built once and
+        reused by later calls with the same arguments.
+        """
+        return self.operator_cache.get(scheme, **config)
+
     def copy(
         self,
         source_client,
@@ -15,9 +36,30 @@ class OpenDALService:
         destination_client,
         destination_path,
         read_chunk_size=DEFAULT_CHUNK_SIZE_256MB,
+        verify_etag=False,
+        etag_part_size=DEFAULT_ETAG_PART_SIZE_8MB,
     ):
-        total_size = source_client.stat(source_path).content_length
+        """
+        Stream an object from one client to another.
+
+        :param verify_etag: Hash the data as it is copied and compare it with
+            the source's and destination's ETags, raising ChecksumMismatchError
+            if either differs. Only ETags of S3 clients can be checked, others
+            such as Azure Blob, Dropbox and filesystem ETags, and those of
+            SSE-KMS encrypted objects, are skipped.
+        :param etag_part_size: Part size the destination's multipart ETag is
+            computed with, S3MultipartWriter's default part size.
+        """
+        source_stat = source_client.stat(source_path)
+        total_size = source_stat.content_length
         bytes_written = 0
+        verifier = None
+        if verify_etag:
+            source_etag = _verifiable_etag(source_client, source_path)
+            part_sizes = [etag_part_size]
+            if source_etag is not None and source_etag[1] is not None:
+                part_sizes.append(source_etag[1])
+            verifier = ETagVerifier(part_sizes)
 
         with source_client.open(source_path, "rb") as source_file:
             with destination_client.open(destination_path, "wb") as destination_file:
@@ -32,6 +74,8 @@ class OpenDALService:
                         break
 
                     destination_file.write(chunk)
+                    if verifier is not None:
+                        verifier.update(chunk)
                     bytes_written += len(chunk)
 
         # Verify the copy was complete
@@ -39,11 +83,19 @@ class OpenDALService:
             raise IOError(
                 f"Copy incomplete. Expected {total_size} bytes but wrote {bytes_written} bytes"
             )
+        if verifier is not None:
+            destination_etag = _verifiable_etag(destination_client, destination_path)
+            for path, etag in [
+                (source_path, source_etag),
+                (destination_path, destination_etag),
+            ]:
+                if etag is not None:
+                    verifier.verify(path, *etag)
 
     def download(self, download_client, download_from_path, save_path):
         source_client = download_client
         source_path = download_from_path
-        destination_client = Operator("fs", root="/")
+        destination_client = self.get_operator("fs", root="/")
         destination_path = str(save_path)
         self.copy(source_client, source_path, destination_client, destination_path)
 
@@ -52,6 +104,13 @@ class OpenDALService:
         self, download_client, download_from_path, file_name=None
     ):
         download_from_path = str(download_from_path)
+        if self._is_cacheable(download_client):
+            with self._download_to_temporary_file_from_cache(
+                download_client, download_from_path, file_name
+            ) as save_path:
+                yield save_path
+            return
+
         try:
             temp_directory = TemporaryDirectory()
             if file_name is None:
@@ -61,3 +120,59 @@ class OpenDALService:
             yield save_path
         finally:
             temp_directory.cleanup()
+
+    def _is_cacheable(self, download_client):
+        return (
+            self.download_cache is not None
+            and getattr(download_client, "bucket", None) is not None
+        )
+
+    @contextmanager
+    def _download_to_temporary_file_from_cache(
+        self, download_client, download_from_path, file_name=None
+    ):
+        etag = download_client.stat(download_from_path).etag
+        with self.download_cache.temporary_directory() as temp_directory:
+            if file_name is None:
+                file_name = download_from_path.split("/")[-1]
+            save_path = temp_directory / file_name
+            self.download_cache.link(
+                download_client.bucket,
+                download_from_path,
+                etag,
+                save_path,
+                lambda path: self.download(
+                    _IfMatchClient(download_client, etag),
+                    download_from_path,
+                    str(path),
+                ),
+            )
+            yield save_path
+
+
+class _IfMatchClient:
+    def __init__(self, client, etag):
+        """
+        Reads `client`'s objects only while their ETag is `etag`, so a
+        download cached under that ETag can't store a newer version.
+        """
+        self._client = client
+        self._etag = etag
+
+    def stat(self, path):
+        return self._client.stat(path)
+
+    def open(self, path, mode):
+        return self._client.open(path, mode, if_match=self._etag)
+
+
+def _verifiable_etag(client, path):
+    # only S3 ETags are derived from the MD5 of the data, so only clients
+    # backed by an S3Client are checked
+    get_verifiable_etag = getattr(
+        getattr(client, "operator", None), "get_verifiable_etag", None
+    )
+    bucket = getattr(client, "bucket", None)
+    if get_verifiable_etag is None or bucket is None:
+        return None
+    return get_verifiable_etag(bucket, path)
@@ -3,8 +3,26 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 
-from asgiref.sync import async_to_sync
-import opendal.exceptions as opendal_exceptions
+from ..s3.bulk import DeleteError
+from ..utils import compression
+from ..utils.ranges import (
+    DEFAULT_COALESCE_GAP_1MB,
+    DEFAULT_MAX_COALESCED_SIZE_64MB,
+    DEFAULT_RANGE_CONCURRENCY,
+    read_coalesced_ranges,
+)
+from .bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_MAX_BYTES_IN_FLIGHT_256MB,
+    DEFAULT_MULTIPART_THRESHOLD_8MB,
+    DEFAULT_PART_CONCURRENCY,
+    DEFAULT_PART_SIZE_8MB,
+    event_loop_thread,
+    iter_reads,
+    run_many,
+    run_writes,
+    verify_deleted,
+)
 
 
 class StorageScheme(Enum):
@@ -36,6 +54,9 @@ class JSONStorageDescriptor:
 
 @dataclass
 class StorageDescriptor(ABC):
+    # no __dict__ here, so slotted subclasses such as CompactS3StorageDescriptor stay compact
+    __slots__ = ()
+
     path: str
 
     @abstractmethod
@@ -67,13 +88,15 @@ class OpenDALClient(ABC):
         storage_descriptor: StorageDescriptor,
     ):
         from .s3.client import OpenDALS3Client
-        from .s3.descriptor import S3StorageDescriptor
+        from .s3.descriptor import CompactS3StorageDescriptor, S3StorageDescriptor
 
         if not storage_descriptor.is_decrypted:
             raise ValueError(
                 "Storage descriptor must be decrypted before creating OpenDAL client."
             )
-        if isinstance(storage_descriptor, S3StorageDescriptor):
+        if isinstance(
+            storage_descriptor, (S3StorageDescriptor, CompactS3StorageDescriptor)
+        ):
             return OpenDALS3Client(
                 bucket=storage_descriptor.bucket,
                 region=storage_descriptor.region,
@@ -84,13 +107,80 @@ class OpenDALClient(ABC):
         else:
             raise ValueError(f"Unsupported storage type: {storage_descriptor.scheme}")
 
-    def read(self, path: str):
-        return self.operator.read(path)
-    
+    def read(self, path: str, decompress: bool = False):
+        data = self.operator.read(path)
+        if decompress:
+            data = bytes(data)
+            content_encoding = self.stat(path).content_encoding
+            if not content_encoding:
+                # fall back to the magic number for services without
+                # Content-Encoding metadata
+                content_encoding = compression.detect_content_encoding(data)
+            return compression.decompress(data, content_encoding)
+        return data
+
+    def read_many(
+        self,
+        paths,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        ordered: bool = True,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT_256MB,
+    ):
+        """
+        Read many objects concurrently through the operator's AsyncOperator,
+        yielding (path, bytes) pairs as they arrive.
+
+        :param concurrency: Number of reads running at once.
+        :param ordered: Yield results in the order of `paths`.
+        :param max_bytes_in_flight: No new read starts while this many bytes
+            are read but not yet consumed.
+        """
+        import asyncio
+
+        async_operator = self.operator.to_async_operator()
+
+        async def read(path):
+            return bytes(await async_operator.read(path))
+
+        with event_loop_thread() as loop:
+            yield from iter_reads(
+                paths,
+                lambda path: asyncio.run_coroutine_threadsafe(read(path), loop),
+                concurrency,
+                ordered,
+                max_bytes_in_flight,
+            )
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes:
+        if length <= 0:
+            return b""
+        return bytes(self.operator.read(path, offset=offset, size=length))
+
+    def read_ranges(
+        self,
+        path: str,
+        ranges,
+        max_gap: int = DEFAULT_COALESCE_GAP_1MB,
+        max_size: int = DEFAULT_MAX_COALESCED_SIZE_64MB,
+        max_concurrency: int = DEFAULT_RANGE_CONCURRENCY,
+    ):
+        return read_coalesced_ranges(
+            ranges,
+            lambda offset, length: self.read_range(path, offset, length),
+            max_gap=max_gap,
+            max_size=max_size,
+            max_concurrency=max_concurrency,
+        )
+
     def presign_read(self, path: str, expiration: int):
+        from asgiref.sync import async_to_sync
+
         async def get_presigned_url():
-            presigned_read = await self.operator.to_async_operator().presign_read(path, expiration)
+            presigned_read = await self.operator.to_async_operator().presign_read(
+                path, expiration
+            )
             return presigned_read
+
         return async_to_sync(get_presigned_url)()
 
     def stat(self, path: str):
@@ -99,17 +189,120 @@ class OpenDALClient(ABC):
     def open(self, path: str, mode: str):
         return self.operator.open(path, mode)
 
-    def write(self, path: str, data: bytes):
-        self.operator.write(path, data)
+    def write(
+        self,
+        path: str,
+        data: bytes,
+        content_encoding: str = None,
+        compression_level: int = None,
+        compression_threads: int = 0,
+    ):
+        if content_encoding is None:
+            self.operator.write(path, data)
+            return
+        data = compression.compress(
+            data, content_encoding, level=compression_level, threads=compression_threads
+        )
+        self.operator.write(path, data, content_encoding=content_encoding)
 
-    def delete(self, path: str):
-        try:
-            self.operator.delete(path)
-            self.stat(path)
-        except opendal_exceptions.NotFound:
-            # need to explicity catch the failed read as OpenDAL doesn't error when delete fails
-            pass
-        except Exception as e:
-            print(e)
-            assert False, f"{path} not deleted"
+    def write_many(
+        self,
+        items,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD_8MB,
+        part_size: int = DEFAULT_PART_SIZE_8MB,
+        part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT_256MB,
+    ):
+        """
+        Write many objects concurrently through the operator's AsyncOperator.
+        Payloads up to `multipart_threshold` bytes are written with a single
+        request, larger ones in `part_size` chunks uploaded
+        `part_concurrency` at a time.
+
+        :param items: Iterable of (path, data) pairs, consumed lazily.
+        :return: BulkWriteResult with the written paths, the exception of each
+            failed path and the aggregate throughput.
+        """
+        import asyncio
+
+        async_operator = self.operator.to_async_operator()
+
+        async def write(path, data):
+            if not isinstance(data, (bytes, bytearray)):
+                await write_buffer(path, data)
+            elif len(data) > multipart_threshold:
+                await async_operator.write(
+                    path, data, chunk=part_size, concurrent=part_concurrency
+                )
+            else:
+                await async_operator.write(path, data)
+
+        async def write_buffer(path, data):
+            # the binding only takes bytes-like objects it can copy in one go,
+            # other buffers such as memoryviews are converted a part at a time
+            with memoryview(data) as buffer, buffer.cast("B") as view:
+                if view.nbytes <= multipart_threshold:
+                    await async_operator.write(path, view.tobytes())
+                    return
+                async with await async_operator.open(
+                    path, "wb", chunk=part_size, concurrent=part_concurrency
+                ) as f:
+                    for start in range(0, view.nbytes, part_size):
+                        end = start + part_size
+                        await f.write(view[start:end].tobytes())
+
+        with event_loop_thread() as loop:
+            return run_writes(
+                items,
+                lambda path, data: asyncio.run_coroutine_threadsafe(
+                    write(path, data), loop
+                ),
+                concurrency,
+                max_bytes_in_flight,
+            )
+
+    def delete(self, path: str, verify: bool = False):
+        """
+        :param verify: Check the object is gone afterwards, OpenDAL doesn't
+            error when a delete fails. Raises DeleteError if it still exists.
+        """
+        self.operator.delete(path)
+        if verify and self.operator.exists(path):
+            raise DeleteError(path, "NotDeleted", "object still exists after delete")
 
+    def delete_many(
+        self, paths, concurrency: int = DEFAULT_BULK_CONCURRENCY, verify: bool = False
+    ):
+        """
+        Delete many objects concurrently through the operator's AsyncOperator.
+
+        :param paths: Iterable of paths, consumed lazily.
+        :param verify: Check every deleted object is gone in one concurrent
+            pass after the deletes.
+        :return: BulkResult mapping each deleted path to None and each failed
+            path to its exception.
+        """
+        import asyncio
+
+        async_operator = self.operator.to_async_operator()
+
+        async def delete(path):
+            await async_operator.delete(path)
+
+        async def exists(path):
+            return await async_operator.exists(path)
+
+        with event_loop_thread() as loop:
+            result = run_many(
+                paths,
+                lambda path: asyncio.run_coroutine_threadsafe(delete(path), loop),
+                concurrency,
+            )
+            if verify:
+                verify_deleted(
+                    result,
+                    lambda path: asyncio.run_coroutine_threadsafe(exists(path), loop),
+                    concurrency,
+                )
+        return result
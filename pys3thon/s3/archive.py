@@ -0,0 +1,223 @@
+import io
+import shutil
+import tarfile
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+
+from ..utils.keys import relative_key
+
+ARCHIVE_FORMATS = ["tar", "tar.gz", "zip"]
+COPY_BUFFER_SIZE_1MB = 1024 * 1024
+
+
+def infer_archive_format(key):
+    if key.endswith(".zip"):
+        return "zip"
+    if key.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    return "tar"
+
+
+def create_archive(
+    s3_client,
+    bucket,
+    prefix,
+    archive_bucket,
+    archive_key,
+    archive_format,
+    part_size,
+    max_concurrency,
+):
+    """
+    Stream every object under `prefix` into an archive written through a
+    multipart upload. Objects up to `part_size` bytes are read into memory
+    `max_concurrency` at a time ahead of the archive writer, larger ones are
+    only requested when they are written and their bodies are streamed, so
+    memory use does not depend on the size of the prefix or of its objects.
+
+    :return: List of archived keys.
+    """
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unsupported archive format: {archive_format}")
+
+    contents = (
+        content
+        for content in s3_client._construct_s3_paginator(bucket, prefix=prefix).search(
+            "Contents"
+        )
+        if content is not None and not content["Key"].endswith("/")
+    )
+    archived_keys = []
+    with s3_client.open_multipart_writer(
+        archive_bucket,
+        archive_key,
+        part_size=part_size,
+        max_concurrency=max_concurrency,
+    ) as writer:
+        if archive_format == "zip":
+            archive = zipfile.ZipFile(writer, mode="w")
+        else:
+            mode = "w|gz" if archive_format == "tar.gz" else "w|"
+            archive = tarfile.open(fileobj=writer, mode=mode)
+
+        with archive:
+            for content, response in _prefetch_objects(
+                s3_client, bucket, contents, part_size, max_concurrency
+            ):
+                name = relative_key(content["Key"], prefix)
+                size = response["ContentLength"]
+                last_modified = response["LastModified"]
+                with response["Body"] as body:
+                    if archive_format == "zip":
+                        _add_to_zip(archive, name, size, last_modified, body)
+                    else:
+                        _add_to_tar(archive, name, size, last_modified, body)
+                archived_keys.append(content["Key"])
+    return archived_keys
+
+
+def extract_archive(
+    s3_client,
+    archive_bucket,
+    archive_key,
+    bucket,
+    prefix,
+    archive_format,
+    part_size,
+    max_concurrency,
+):
+    """
+    Stream an archive object and upload its members under `prefix`.
+
+    Members are read one at a time from the archive stream and uploaded
+    concurrently, with at most `max_concurrency` uploads queued. Members up to
+    `part_size` bytes are buffered and sent with a single PutObject, larger
+    ones are streamed through a multipart upload.
+
+    :return: List of uploaded keys.
+    """
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unsupported archive format: {archive_format}")
+
+    uploaded_keys = []
+    futures = []
+    in_flight = BoundedSemaphore(max_concurrency)
+
+    def upload(data, key):
+        try:
+            s3_client.upload_buffer(data, bucket, key)
+        finally:
+            in_flight.release()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        try:
+            for name, size, member_file in _archive_members(
+                s3_client, archive_bucket, archive_key, archive_format
+            ):
+                _raise_failed_upload(futures)
+                name = name.lstrip("/")
+                key = f"{prefix.rstrip('/')}/{name}" if prefix else name
+                if size <= part_size:
+                    data = member_file.read()
+                    in_flight.acquire()
+                    futures.append(executor.submit(upload, data, key))
+                else:
+                    with s3_client.open_multipart_writer(
+                        bucket,
+                        key,
+                        part_size=part_size,
+                        max_concurrency=max_concurrency,
+                    ) as writer:
+                        shutil.copyfileobj(member_file, writer, part_size)
+                uploaded_keys.append(key)
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+    for future in futures:
+        future.result()
+    return uploaded_keys
+
+
+def _raise_failed_upload(futures):
+    # stop at the first failed upload instead of after reading every member
+    for future in [future for future in futures if future.done()]:
+        futures.remove(future)
+        future.result()
+
+
+def _archive_members(s3_client, archive_bucket, archive_key, archive_format):
+    if archive_format == "zip":
+        # the zip central directory is at the end of the archive, so members
+        # are located with ranged reads through a seekable smart_open reader
+        from smart_open import open
+
+        with open(
+            f"s3://{archive_bucket}/{archive_key}",  # noqa
+            "rb",
+            transport_params={"client": s3_client.client},
+        ) as archive_file, zipfile.ZipFile(archive_file) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as member_file:
+                    yield info.filename, info.file_size, member_file
+    else:
+        body = s3_client.get_streaming_body(archive_bucket, archive_key)
+        with body, tarfile.open(fileobj=body, mode="r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                yield member.name, member.size, archive.extractfile(member)
+
+
+def _prefetch_objects(s3_client, bucket, contents, prefetch_size, max_concurrency):
+    """
+    Yield (content, get_object response) for each listed object in order.
+
+    Objects up to `prefetch_size` bytes are read into memory ahead of the
+    caller, at most `max_concurrency` at a time, so no response is left
+    unread, holding a connection, while the caller catches up. Larger
+    objects are requested when the caller reaches them and streamed.
+    """
+
+    def get_object_bytes(key):
+        response = s3_client.client.get_object(Bucket=bucket, Key=key)
+        with response["Body"] as body:
+            response["Body"] = io.BytesIO(body.read())
+        return response
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        window = deque()
+        for content in contents:
+            future = None
+            if content["Size"] <= prefetch_size:
+                future = executor.submit(get_object_bytes, content["Key"])
+            window.append((content, future))
+            if len(window) >= max_concurrency:
+                yield _prefetched_object(s3_client, bucket, *window.popleft())
+        while window:
+            yield _prefetched_object(s3_client, bucket, *window.popleft())
+
+
+def _prefetched_object(s3_client, bucket, content, future):
+    if future is None:
+        return content, s3_client.client.get_object(Bucket=bucket, Key=content["Key"])
+    return content, future.result()
+
+
+def _add_to_tar(archive, name, size, last_modified, body):
+    info = tarfile.TarInfo(name)
+    info.size = size
+    info.mtime = last_modified.timestamp()
+    archive.addfile(info, body)
+
+
+def _add_to_zip(archive, name, size, last_modified, body):
+    info = zipfile.ZipInfo(name, date_time=last_modified.timetuple()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.file_size = size
+    with archive.open(info, mode="w", force_zip64=size >= zipfile.ZIP64_LIMIT) as f:
+        shutil.copyfileobj(body, f, COPY_BUFFER_SIZE_1MB)
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from threading import BoundedSemaphore
+
+
+class DeleteError(Exception):
+    def __init__(self, path, code, message):
+        self.path = path
+        self.code = code
+        self.message = message
+        super().__init__(f"Failed to delete {path}: {code} {message}")
+
+
+@dataclass
+class BulkResult:
+    results: dict = field(default_factory=dict)
+    failed: dict = field(default_factory=dict)
+
+    @property
+    def succeeded(self):
+        return not self.failed
+
+
+def run_bulk(fn, items, max_concurrency):
+    """
+    Call `fn(*item)` for every item on a thread pool, with at most
+    `2 * max_concurrency` calls queued or running so `items` can be a lazy
+    iterable of any length.
+
+    :return: BulkResult mapping each item to its return value, or to the
+        exception it raised.
+    """
+    result = BulkResult()
+    queued = BoundedSemaphore(2 * max_concurrency)
+
+    def call(item):
+        try:
+            return fn(*item)
+        finally:
+            queued.release()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = {}
+        for item in items:
+            item = tuple(item)
+            queued.acquire()
+            futures[executor.submit(call, item)] = item
+        for future in as_completed(futures):
+            try:
+                result.results[futures[future]] = future.result()
+            except Exception as e:
+                result.failed[futures[future]] = e
+    return result
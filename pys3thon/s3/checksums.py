@@ -0,0 +1,288 @@
+import base64
+import hashlib
+import re
+import zlib
+
+CHECKSUM_ALGORITHMS = ["CRC32", "CRC32C", "SHA1", "SHA256", "ETAG"]
+_MD5_ETAG = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ChecksumError(Exception):
+    pass
+
+
+class ChecksumMismatchError(ChecksumError):
+    def __init__(self, location, algorithm, expected, actual):
+        self.location = location
+        self.algorithm = algorithm
+        self.expected = expected
+        self.actual = actual
+        super().__init__(
+            f"{algorithm} checksum mismatch for {location}: "
+            f"expected {expected}, got {actual}"
+        )
+
+
+class MissingChecksumError(ChecksumError):
+    def __init__(self, location, algorithm):
+        self.location = location
+        self.algorithm = algorithm
+        super().__init__(f"{location} has no stored {algorithm} checksum")
+
+
+def new_hasher(algorithm):
+    """
+    hashlib-style object with `update` and `digest` for an S3 checksum
+    algorithm. "ETAG" hashes with MD5, as S3 does for ETags.
+    """
+    if algorithm == "SHA256":
+        return hashlib.sha256()
+    if algorithm == "SHA1":
+        return hashlib.sha1()
+    if algorithm == "ETAG":
+        return hashlib.md5()
+    if algorithm == "CRC32":
+        return _CRCHasher(zlib.crc32)
+    if algorithm == "CRC32C":
+        return _CRCHasher(_crc32c_function())
+    raise ValueError(f"Unsupported checksum algorithm: {algorithm}")
+
+
+def encode_digest(algorithm, digest, parts=None):
+    """
+    Format a digest the way S3 reports it, hex in quotes for ETags and base64
+    for checksums, with a `-N` suffix for checksums of `parts` parts.
+    """
+    if algorithm == "ETAG":
+        value = digest.hex()
+        return f'"{value}-{parts}"' if parts else f'"{value}"'
+    value = base64.b64encode(digest).decode()
+    return f"{value}-{parts}" if parts else value
+
+
+def combine_part_digests(algorithm, part_digests):
+    """
+    Checksum S3 reports for a multipart object, the checksum of the
+    concatenated checksums of its parts.
+    """
+    hasher = new_hasher(algorithm)
+    hasher.update(b"".join(part_digests))
+    return encode_digest(algorithm, hasher.digest(), parts=len(part_digests))
+
+
+def stored_checksum(head, algorithm):
+    """
+    Checksum S3 stored for an object, from a head_object response made with
+    `ChecksumMode="ENABLED"`.
+
+    :return: (checksum, parts), `parts` is the number of parts the checksum
+        was combined from, or None for a checksum of the whole object.
+        (None, None) if there is no such checksum, or for "ETAG" if the ETag
+        isn't derived from the MD5 of the data, e.g. for SSE-KMS objects.
+    """
+    etag = head.get("ETag")
+    etag_parts = _parts_count(etag)
+    if algorithm == "ETAG":
+        if etag is None or _is_encrypted_with_other_key(head):
+            return None, None
+        if etag_parts is None and not is_md5_etag(etag):
+            return None, None
+        return etag, etag_parts
+
+    checksum = head.get(f"Checksum{algorithm}")
+    if checksum is None:
+        return None, None
+    checksum_type = head.get("ChecksumType")
+    checksum_parts = _parts_count(checksum)
+    if checksum_type == "FULL_OBJECT":
+        return checksum, None
+    if checksum_parts is not None:
+        return checksum, checksum_parts
+    if etag_parts is not None:
+        # composite checksum of a multipart upload reported without its suffix
+        return f"{checksum}-{etag_parts}", etag_parts
+    return checksum, None
+
+
+def upload_part_args(extra_args):
+    """
+    Arguments for UploadPart so each part carries the checksum requested by
+    `ChecksumAlgorithm` in the CreateMultipartUpload arguments.
+    """
+    algorithm = extra_args.get("ChecksumAlgorithm")
+    return {"ChecksumAlgorithm": algorithm} if algorithm else {}
+
+
+def completed_part(part_number, response, extra_args):
+    """
+    Entry for CompleteMultipartUpload from an UploadPart response, including
+    the part's checksum so S3 validates it against the data it received.
+    """
+    part = {"PartNumber": part_number, "ETag": response["ETag"]}
+    algorithm = extra_args.get("ChecksumAlgorithm")
+    if algorithm and f"Checksum{algorithm}" in response:
+        part[f"Checksum{algorithm}"] = response[f"Checksum{algorithm}"]
+    return part
+
+
+def is_md5_etag(etag):
+    return etag is not None and _MD5_ETAG.match(etag.strip('"')) is not None
+
+
+def is_multipart_etag(etag):
+    return _parts_count(etag) is not None
+
+
+class MultipartETagHasher:
+    def __init__(self, part_size):
+        """
+        Computes, while data streams through `update`, the ETag S3 gives an
+        object uploaded by S3MultipartWriter with `part_size` byte parts: a
+        plain MD5 below one part, otherwise the MD5 of the parts' MD5s.
+        """
+        self._part_size = part_size
+        self._part_digests = []
+        self._part = hashlib.md5()
+        self._part_bytes = 0
+
+    def update(self, data):
+        view = memoryview(data)
+        while view.nbytes:
+            n = min(self._part_size - self._part_bytes, view.nbytes)
+            self._part.update(view[:n])
+            self._part_bytes += n
+            view = view[n:]
+            if self._part_bytes == self._part_size:
+                self._part_digests.append(self._part.digest())
+                self._part = hashlib.md5()
+                self._part_bytes = 0
+
+    def etag(self):
+        if not self._part_digests:
+            return encode_digest("ETAG", self._part.digest())
+        part_digests = list(self._part_digests)
+        if self._part_bytes:
+            part_digests.append(self._part.digest())
+        return combine_part_digests("ETAG", part_digests)
+
+
+class ETagVerifier:
+    def __init__(self, part_sizes=()):
+        """
+        Hashes data as it streams through `update` and checks it against ETags
+        S3 reports for it, whether the object was uploaded with one request or
+        as a multipart upload of one of `part_sizes` byte parts.
+
+        :param part_sizes: Part sizes multipart ETags are computed for, a
+            multipart ETag of any other part size can't be checked.
+        """
+        self._md5 = hashlib.md5()
+        self._multipart = {
+            part_size: MultipartETagHasher(part_size) for part_size in set(part_sizes)
+        }
+
+    def update(self, data):
+        self._md5.update(data)
+        for hasher in self._multipart.values():
+            hasher.update(data)
+
+    def verify(self, location, etag, part_size=None):
+        """
+        :param etag: ETag S3 reported for the data, as returned by
+            verifiable_etag.
+        :param part_size: Size of the object's parts, None if it was uploaded
+            with one request.
+        :return: True if the ETag was checked, False if it was uploaded with a
+            part size the verifier doesn't hash.
+        """
+        if part_size is None:
+            actual = encode_digest("ETAG", self._md5.digest())
+        elif part_size in self._multipart:
+            actual = self._multipart[part_size].etag()
+        else:
+            return False
+        if actual.strip('"') != etag.strip('"'):
+            raise ChecksumMismatchError(location, "ETAG", etag, actual)
+        return True
+
+
+def verifiable_etag(head, part_head=None):
+    """
+    ETag of an S3 object and the part size it was computed with, if it can be
+    checked with ETagVerifier.
+
+    S3 ETags are the MD5 of an object uploaded with one request, or the MD5
+    of the MD5s of a multipart upload's parts, except for SSE-KMS and SSE-C
+    encrypted objects.
+
+    :param head: head_object response for the object.
+    :param part_head: head_object response made with `PartNumber=1`, needed
+        for multipart objects.
+    :return: (etag, part_size) with part_size None for an object uploaded
+        with one request, or None if the ETag can't be checked.
+    """
+    etag = head.get("ETag")
+    if etag is None or _is_encrypted_with_other_key(head):
+        return None
+    parts = _parts_count(etag)
+    if parts is None:
+        return (etag, None) if is_md5_etag(etag) else None
+    if part_head is None:
+        return None
+    part_size = part_head["ContentLength"]
+    # the ETag is only reproducible if every part but the last has the size
+    # of the first, as far as the part count can tell
+    if part_size <= 0 or -(-head["ContentLength"] // part_size) != parts:
+        return None
+    return etag, part_size
+
+
+class _CRCHasher:
+    def __init__(self, crc_function):
+        self._crc_function = crc_function
+        self._value = 0
+
+    def update(self, data):
+        self._value = self._crc_function(data, self._value)
+
+    def digest(self):
+        return self._value.to_bytes(4, "big")
+
+
+def _crc32c_function():
+    # CRC32C isn't in the standard library, use whichever native
+    # implementation is installed
+    try:
+        from awscrt.checksums import crc32c
+
+        return crc32c
+    except ImportError:
+        pass
+    try:
+        from crc32c import crc32c
+
+        return lambda data, value: crc32c(data, value)
+    except ImportError:
+        pass
+    try:
+        import google_crc32c
+
+        return lambda data, value: google_crc32c.extend(value, bytes(data))
+    except ImportError:
+        raise ImportError(
+            "CRC32C checksums require awscrt, crc32c or google-crc32c"
+        ) from None
+
+
+def _is_encrypted_with_other_key(head):
+    return (
+        head.get("ServerSideEncryption", "").startswith("aws:kms")
+        or "SSECustomerAlgorithm" in head
+    )
+
+
+def _parts_count(value):
+    if value is None:
+        return None
+    match = re.search(r"-(\d+)\"?$", value)
+    return int(match.group(1)) if match else None
@@ -1,7 +1,13 @@
 import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
+from itertools import accumulate, islice
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from uuid import uuid4
 
 import boto3
 from boto3.s3.transfer import TransferConfig
@@ -9,12 +15,48 @@ from botocore.client import Config
 from botocore.exceptions import ClientError
 from tqdm import tqdm
 
-from ..utils import run_shell_command
+from ..utils import MemoryViewReader, read_coalesced_ranges, run_shell_command
+from ..utils.compression import compressing_reader, decompressing_reader
+from ..utils.ranges import (
+    DEFAULT_COALESCE_GAP_1MB,
+    DEFAULT_MAX_COALESCED_SIZE_64MB,
+    DEFAULT_RANGE_CONCURRENCY,
+)
+from . import checksums
+from .archive import create_archive, extract_archive, infer_archive_format
+from .bulk import BulkResult, DeleteError, run_bulk
+from .directory_transfer import download_directory
+from .listing_filter import compile_listing_filter, filter_page
+from .multipart_writer import S3MultipartWriter
+from .parallel_listing import (
+    DEFAULT_MAX_PAGES_BUFFERED,
+    alphabet_boundaries,
+    list_objects_parallel,
+)
+from .process_pool import (
+    DEFAULT_PROCESS_CHUNK_SIZE,
+    copy_task,
+    run_in_process_pool,
+    upload_file_task,
+)
+
+DEFAULT_MULTIPART_THRESHOLD_8MB = 8 * 1024 * 1024
+DEFAULT_PART_SIZE_8MB = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_READ_CHUNK_SIZE_1MB = 1024 * 1024
+DEFAULT_MAX_BYTES_IN_FLIGHT_256MB = 256 * 1024 * 1024
+DELETE_OBJECTS_BATCH_SIZE = 1000
+BULK_BACKENDS = ["thread", "process"]
 
 
 class S3Client:
     def __init__(
-        self, profile_name=None, credentials=None, endpoint_url=None, region_name=None
+        self,
+        profile_name=None,
+        credentials=None,
+        endpoint_url=None,
+        region_name=None,
+        download_cache=None,
     ):
         """
         Initialize the S3Client with optional AWS credentials and configuration.
@@ -23,6 +65,8 @@ class S3Client:
         :param credentials: Dictionary containing 'aws_access_key_id' and 'aws_secret_access_key'.
         :param endpoint_url: Custom S3 endpoint URL.
         :param region_name: AWS region name.
+        :param download_cache: Optional DownloadCache used by
+            download_to_temporary_file to avoid re-downloading unchanged objects.
         """
         session_kwargs = {}
         client_kwargs = {}
@@ -60,11 +104,19 @@ class S3Client:
         self.credentials = credentials
         self.endpoint_url = endpoint_url
         self.region_name = region_name
+        self.download_cache = download_cache
 
     @contextmanager
     def download_to_temporary_file(
         self, bucket, key, file_name=None, show_progress=False
     ):
+        if self.download_cache is not None:
+            with self._download_to_temporary_file_from_cache(
+                bucket, key, file_name, show_progress
+            ) as save_path:
+                yield save_path
+            return
+
         try:
             temp_directory = TemporaryDirectory()
             if file_name is None:
@@ -75,6 +127,54 @@ class S3Client:
         finally:
             temp_directory.cleanup()
 
+    @contextmanager
+    def _download_to_temporary_file_from_cache(
+        self, bucket, key, file_name=None, show_progress=False
+    ):
+        # a single conditional GET either confirms the cached copy or streams
+        # the new version straight into the cache
+        cached_etag = self.download_cache.get_cached_etag(bucket, key)
+        response = self._get_object_if_modified(bucket, key, if_none_match=cached_etag)
+
+        def write_response(response, path):
+            with tqdm(
+                total=response["ContentLength"],
+                unit="B",
+                unit_scale=True,
+                desc=str(path),
+                disable=not show_progress,
+            ) as t:
+                self._write_body_to_file(response["Body"], path, Callback=t.update)
+
+        if response is None:
+            etag = cached_etag
+
+            def download_fn(path):
+                # the cached copy was evicted after the conditional GET, only
+                # the version it confirmed may be cached under its ETag
+                evicted_response = self.client.get_object(
+                    Bucket=bucket, Key=key, IfMatch=cached_etag
+                )
+                with evicted_response["Body"]:
+                    write_response(evicted_response, path)
+
+        else:
+            etag = response["ETag"]
+
+            def download_fn(path):
+                write_response(response, path)
+
+        try:
+            with self.download_cache.temporary_directory() as temp_directory:
+                if file_name is None:
+                    file_name = key.split("/")[-1]
+                save_path = temp_directory / file_name
+                self.download_cache.link(bucket, key, etag, save_path, download_fn)
+                yield save_path
+        finally:
+            if response is not None:
+                response["Body"].close()
+
     def download(
         self,
         bucket,
@@ -82,8 +182,66 @@ class S3Client:
         save_prefix,
         show_progress=False,
         Config=TransferConfig(),
+        use_mmap=False,
+        if_none_match=None,
+        if_modified_since=None,
+        decompress=False,
+        checksum=None,
     ):
+        """
+        Download an object to a local file.
+
+        :param use_mmap: Preallocate the destination file and write concurrent
+            ranged GETs straight into a memory map of it instead of going
+            through boto3's transfer manager.
+        :param if_none_match: Only download if the object's ETag differs.
+        :param if_modified_since: Only download if the object was modified
+            after this datetime. With either validator the object is
+            downloaded as with `use_mmap`, the HEAD request for its size
+            carries the condition and the ranged GETs are pinned to the
+            version it returned.
+        :param decompress: Stream the object and decompress it according to its
+            Content-Encoding (gzip or zstd) while writing it.
+        :param checksum: Verify the download against the checksum S3 stored
+            for the object, one of "CRC32", "CRC32C", "SHA1", "SHA256" or
+            "ETAG". The data is hashed as it is written, and each part of a
+            multipart object is hashed in parallel on the thread downloading
+            it. Raises ChecksumMismatchError, leaving no file behind, if the
+            checksums differ and MissingChecksumError if none is stored, or
+            for "ETAG" if the ETag isn't an MD5 of the data, as for SSE-KMS
+            and SSE-C objects.
+        :return: False if the object was not modified and nothing was
+            downloaded, True otherwise.
+        """
+        if checksum is not None and decompress:
+            raise ValueError("checksum cannot be combined with decompress")
+        if decompress:
+            body = self.get_streaming_body(
+                bucket, key, if_none_match, if_modified_since, decompress=True
+            )
+            if body is None:
+                return False
+            with body, tqdm(
+                unit="B",
+                unit_scale=True,
+                desc=str(save_prefix),
+                disable=not show_progress,
+            ) as t:
+                self._write_body_to_file(body, save_prefix, Callback=t.update)
+            return True
+
         save_prefix = str(save_prefix)
+        conditional = if_none_match is not None or if_modified_since is not None
+        if checksum is not None or use_mmap or conditional:
+            # the transfer manager can't make its requests conditional
+            download_file = partial(
+                self._download_file_to_mmap,
+                checksum=checksum,
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+            )
+        else:
+            download_file = self.client.download_file
 
         if show_progress:
 
@@ -99,18 +257,164 @@ class S3Client:
             with tqdm(
                 total=file_size, unit="B", unit_scale=True, desc=save_prefix
             ) as t:
-                self.client.download_file(
+                modified = download_file(
                     bucket, key, save_prefix, Callback=hook(t), Config=Config
                 )
         else:
-            self.client.download_file(bucket, key, save_prefix, Config=Config)
+            modified = download_file(bucket, key, save_prefix, Config=Config)
+        return modified is not False
+
+    def upload_file(
+        self,
+        path,
+        bucket,
+        key,
+        Config=TransferConfig(),
+        use_mmap=False,
+        content_encoding=None,
+        compression_level=None,
+        compression_threads=0,
+        **kwargs,
+    ):
+        """
+        Upload a local file.
+
+        :param use_mmap: Memory-map the file and upload multipart parts
+            directly from slices of the map instead of going through boto3's
+            transfer manager.
+        :param content_encoding: "gzip" or "zstd" to compress the file while it
+            is uploaded and set the object's Content-Encoding.
+        :param compression_level: Compression level, defaults to the codec's.
+        :param compression_threads: Number of threads compressing in parallel.
+        """
+        if content_encoding is not None:
+            if use_mmap:
+                raise ValueError("use_mmap cannot be combined with compression")
+            with open(path, "rb") as f:
+                self.upload_fileobj(
+                    f,
+                    bucket,
+                    key,
+                    Config=Config,
+                    content_encoding=content_encoding,
+                    compression_level=compression_level,
+                    compression_threads=compression_threads,
+                    **kwargs,
+                )
+        elif use_mmap:
+            self._upload_file_from_mmap(path, bucket, key, Config=Config, **kwargs)
+        else:
+            self.client.upload_file(path, bucket, key, Config=Config, **kwargs)
 
-    def upload_file(self, path, bucket, key, Config=TransferConfig(), **kwargs):
-        self.client.upload_file(path, bucket, key, Config=Config, **kwargs)
+    def upload_fileobj(
+        self,
+        fileobj,
+        bucket,
+        key,
+        Config=TransferConfig(),
+        content_encoding=None,
+        compression_level=None,
+        compression_threads=0,
+        **kwargs,
+    ):
+        """
+        Upload a readable file-like object.
 
-    def upload_fileobj(self, fileobj, bucket, key, Config=TransferConfig(), **kwargs):
+        :param content_encoding: "gzip" or "zstd" to compress `fileobj` while it
+            is uploaded, in bounded memory, and set the object's
+            Content-Encoding.
+        :param compression_level: Compression level, defaults to the codec's.
+        :param compression_threads: Number of threads compressing in parallel.
+        """
+        if content_encoding is not None:
+            fileobj = compressing_reader(
+                fileobj,
+                content_encoding,
+                level=compression_level,
+                threads=compression_threads,
+            )
+            kwargs["ExtraArgs"] = {
+                **kwargs.get("ExtraArgs", {}),
+                "ContentEncoding": content_encoding,
+            }
         self.client.upload_fileobj(fileobj, bucket, key, Config=Config, **kwargs)
 
+    def put_object(self, body, bucket, key, **kwargs):
+        return self.client.put_object(Bucket=bucket, Key=key, Body=body, **kwargs)
+
+    def upload_buffer(
+        self,
+        buffer,
+        bucket,
+        key,
+        multipart_threshold=DEFAULT_MULTIPART_THRESHOLD_8MB,
+        part_size=DEFAULT_PART_SIZE_8MB,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        Callback=None,
+        **kwargs,
+    ):
+        """
+        Upload an in-memory buffer without copying it first.
+
+        Buffers up to `multipart_threshold` bytes are sent with a single
+        PutObject, larger ones with a multipart upload whose parts are slices
+        of the original buffer.
+
+        :param buffer: bytes, bytearray, memoryview, mmap or any other object
+            supporting the buffer protocol.
+        :param bucket: S3 bucket name.
+        :param key: S3 object key.
+        :param multipart_threshold: Size in bytes above which multipart is used.
+        :param part_size: Size in bytes of each multipart part.
+        :param max_concurrency: Number of parts uploaded concurrently.
+        :param Callback: Called with the number of bytes sent after each request.
+        :param kwargs: Extra arguments for PutObject/CreateMultipartUpload. With
+            `ChecksumAlgorithm` every part is checksummed as it is sent and S3
+            validates each part and the completed object.
+        """
+        with memoryview(buffer) as view, view.cast("B") as byte_view:
+            if byte_view.nbytes <= multipart_threshold:
+                if isinstance(buffer, (bytes, bytearray)):
+                    self.put_object(buffer, bucket, key, **kwargs)
+                else:
+                    with MemoryViewReader(byte_view) as body:
+                        self.put_object(body, bucket, key, **kwargs)
+                if Callback is not None:
+                    Callback(byte_view.nbytes)
+            else:
+                self._upload_view_multipart(
+                    byte_view,
+                    bucket,
+                    key,
+                    part_size,
+                    max_concurrency,
+                    Callback=Callback,
+                    **kwargs,
+                )
+
+    def open_multipart_writer(
+        self,
+        bucket,
+        key,
+        part_size=DEFAULT_PART_SIZE_8MB,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        max_parts_in_flight=None,
+        **kwargs,
+    ):
+        """
+        Open a writable file-like object that uploads parts concurrently in
+        the background, see S3MultipartWriter.
+        """
+        return S3MultipartWriter(
+            self,
+            bucket,
+            key,
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+            max_parts_in_flight=max_parts_in_flight,
+            **kwargs,
+        )
+
     def copy(self, source_bucket, source_key, dst_bucket, dst_key):
         self.client.copy(
             {"Bucket": source_bucket, "Key": source_key}, dst_bucket, dst_key
@@ -132,24 +436,104 @@ class S3Client:
     def head_object(self, bucket, key):
         return self.client.head_object(Bucket=bucket, Key=key)
 
+    def get_verifiable_etag(self, bucket, key):
+        """
+        ETag of an object and the part size it was uploaded with, to check
+        data against with ETagVerifier.
+
+        :return: (etag, part_size) with part_size None for an object uploaded
+            with one request, or None if the ETag isn't derived from the MD5
+            of the data, e.g. for SSE-KMS encrypted objects.
+        """
+        head = self.head_object(bucket, key)
+        part_head = None
+        if checksums.is_multipart_etag(head.get("ETag")):
+            part_head = self.client.head_object(Bucket=bucket, Key=key, PartNumber=1)
+        return checksums.verifiable_etag(head, part_head)
+
+    def is_modified(self, bucket, key, if_none_match=None, if_modified_since=None):
+        """
+        Check with a conditional HEAD whether an object changed.
+
+        :param if_none_match: ETag of the last seen version of the object.
+        :param if_modified_since: datetime the object was last seen at.
+        :return: False if S3 answered 304 Not Modified, True otherwise.
+        """
+        if if_none_match is None and if_modified_since is None:
+            return True
+        try:
+            self.client.head_object(
+                Bucket=bucket,
+                Key=key,
+                **self._conditional_kwargs(if_none_match, if_modified_since),
+            )
+        except ClientError as e:
+            if self._is_not_modified_error(e):
+                return False
+            raise
+        return True
+
     def get_object_storage_class(self, bucket, key):
         return self.client.head_object(Bucket=bucket, Key=key).get(
             "StorageClass", "STANDARD"
         )
 
     def delete_directory(self, bucket, prefix):
-        keys = self.get_s3_keys(bucket, prefix)
-        for key in keys:
-            self.delete_object(bucket, key)
+        result = self.delete_objects(bucket, self.get_s3_keys(bucket, prefix))
+        if not result.succeeded:
+            raise next(iter(result.failed.values()))
 
     def delete_object(self, bucket, key):
         self.client.delete_object(Bucket=bucket, Key=key)
 
-    def get_s3_keys(self, bucket, prefix=None, delimiter=None):
+    def delete_objects(self, bucket, keys, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        Delete many objects with DeleteObjects, up to 1000 keys per request
+        and `max_concurrency` requests at once.
+
+        :param keys: Iterable of keys, consumed lazily.
+        :return: BulkResult mapping each deleted key to None and each failed
+            key to a DeleteError, or to the exception of its failed request.
+        """
+
+        def delete_batch(*batch):
+            response = self.client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            return response.get("Errors", [])
+
+        keys = iter(keys)
+        batches = iter(lambda: list(islice(keys, DELETE_OBJECTS_BATCH_SIZE)), [])
+        batch_results = run_bulk(delete_batch, batches, max_concurrency)
+
+        result = BulkResult()
+        for batch, errors in batch_results.results.items():
+            failed = {
+                error["Key"]: DeleteError(error["Key"], error["Code"], error["Message"])
+                for error in errors
+            }
+            for key in batch:
+                if key in failed:
+                    result.failed[key] = failed[key]
+                else:
+                    result.results[key] = None
+        for batch, exception in batch_results.failed.items():
+            for key in batch:
+                result.failed[key] = exception
+        return result
+
+    def get_s3_keys(self, bucket, prefix=None, delimiter=None, **filters):
+        """
+        :param filters: Listing filters, see `compile_listing_filter`.
+        """
+        predicate = compile_listing_filter(**filters)
         keys = []
         try:
             for resp in self._construct_s3_paginator(bucket, prefix, delimiter):
-                keys.extend([c["Key"] for c in resp["Contents"]])
+                keys.extend(
+                    [c["Key"] for c in filter_page(resp["Contents"], predicate)]
+                )
         except KeyError:
             pass
         return keys
@@ -197,18 +581,93 @@ class S3Client:
             keys.append(prefix.get("Prefix"))
         return keys
 
-    def get_files_for_bucket_with_prefix(self, bucket, prefix, delimiter="/"):
+    def get_files_for_bucket_with_prefix(
+        self, bucket, prefix, delimiter="/", fields=None, **filters
+    ):
+        """
+        :param fields: Keys of each `Contents` entry to keep, e.g. `["Key", "Size"]`.
+        :param filters: Listing filters, see `compile_listing_filter`.
+        """
+        predicate = compile_listing_filter(**filters)
         all_file_contents = []
-        for contents in self._construct_s3_paginator(
+        for page in self._construct_s3_paginator(
             bucket, prefix=prefix, delimiter=delimiter
-        ).search("Contents"):
-            if contents is None:
-                continue
-            if contents["Key"] == prefix:
-                continue
-            all_file_contents.append(contents)
+        ):
+            contents = [c for c in page.get("Contents", []) if c["Key"] != prefix]
+            all_file_contents.extend(filter_page(contents, predicate, fields))
         return all_file_contents
 
+    def iter_objects(
+        self,
+        bucket,
+        prefix=None,
+        parallel=False,
+        boundaries=None,
+        ordered=True,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        max_pages_buffered=DEFAULT_MAX_PAGES_BUFFERED,
+        fields=None,
+        **filters,
+    ):
+        """
+        Stream the objects under `prefix` without building the whole listing.
+
+        :param parallel: Split the keyspace into ranges listed concurrently with
+            `StartAfter`, for large flat prefixes where a single sequential
+            paginator is too slow.
+        :param boundaries: Keys to split the keyspace at when `parallel`, e.g.
+            from `sample_boundaries`. Defaults to splitting on the character
+            after `prefix`, see `alphabet_boundaries`.
+        :param ordered: Yield objects in key order. When False, objects from
+            each range are yielded as soon as they are listed.
+        :param max_concurrency: Number of ranges listed concurrently.
+        :param max_pages_buffered: Pages each range lists ahead of the caller.
+        :param fields: Keys of each entry to keep, e.g. `["Key", "Size"]`.
+        :param filters: Listing filters applied to each page as it is listed,
+            see `compile_listing_filter`.
+        :return: Generator of `Contents` entries of `list_objects_v2`.
+        """
+        predicate = compile_listing_filter(**filters)
+        if not parallel:
+            for page in self._construct_s3_paginator(bucket, prefix=prefix):
+                yield from filter_page(page.get("Contents", []), predicate, fields)
+            return
+
+        if boundaries is None:
+            boundaries = alphabet_boundaries(prefix)
+        yield from list_objects_parallel(
+            self,
+            bucket,
+            prefix,
+            boundaries,
+            ordered=ordered,
+            max_concurrency=max_concurrency,
+            max_pages_buffered=max_pages_buffered,
+            predicate=predicate,
+            fields=fields,
+        )
+
+    def iter_keys(self, bucket, prefix=None, **kwargs):
+        """
+        Stream the keys under `prefix`, see `iter_objects` for `kwargs`.
+        """
+        for content in self.iter_objects(bucket, prefix=prefix, **kwargs):
+            yield content["Key"]
+
+    def scan_prefix(self, bucket, prefix, listing_index, start_after_last_key=False):
+        """
+        List a prefix and report what changed since it was last scanned into
+        `listing_index`, see ListingIndex.scan.
+
+        :param listing_index: ListingIndex holding the previous snapshot.
+        :param start_after_last_key: Only list keys after the last one seen,
+            for prefixes whose keys only ever increase lexically.
+        :return: ListingChanges of added, removed and changed objects.
+        """
+        return listing_index.scan(
+            self, bucket, prefix, start_after_last_key=start_after_last_key
+        )
+
     def generate_presigned_get_url(self, bucket, key, expiration=3600):
         """Generate a presigned URL to share an S3 object
         :param bucket_name: string
@@ -303,21 +762,419 @@ class S3Client:
             )
         )
 
-    def upload_directory(self, directory_path, bucket, prefix):
+    def upload_directory(
+        self,
+        directory_path,
+        bucket,
+        prefix,
+        backend=None,
+        max_workers=None,
+        chunk_size=DEFAULT_PROCESS_CHUNK_SIZE,
+        transform=None,
+        show_progress=False,
+    ):
+        """
+        Upload every file below `directory_path` under `prefix`.
+
+        :param backend: None to upload one file at a time, "thread" to upload
+            concurrently on a thread pool or "process" to upload on a process
+            pool, for when `transform` is CPU bound.
+        :param max_workers: Number of threads or processes.
+        :param chunk_size: Number of files sent to a worker process at once.
+        :param transform: Picklable callable applied to the bytes of each file
+            before it is uploaded, e.g. to compress or encrypt it.
+        :param show_progress: Show a progress bar of uploaded files when using
+            the "process" backend.
+        :return: None if `backend` is None, otherwise a BulkResult mapping each
+            (path, bucket, key) to the bytes uploaded or to its exception.
+        """
         # Convert the local path to a Path object
         directory_path = Path(directory_path)
 
-        # Walk through the local directory and upload each file
-        for child in directory_path.rglob("*"):
-            # Check if the child is a file
-            if child.is_file():
-                # Compute the full S3 key of the file
-                s3_key = str(Path(prefix) / child.relative_to(directory_path))
+        # Walk through the local directory and compute the S3 key of each file
+        uploads = (
+            (str(child), bucket, str(Path(prefix) / child.relative_to(directory_path)))
+            for child in directory_path.rglob("*")
+            if child.is_file()
+        )
+
+        if backend is None:
+            for upload in uploads:
+                upload_file_task(self, *upload, transform=transform)
+            return None
+        return self._run_bulk(
+            upload_file_task,
+            uploads,
+            backend,
+            max_workers,
+            chunk_size,
+            show_progress,
+            transform=transform,
+        )
+
+    def copy_many(
+        self,
+        copies,
+        backend="thread",
+        max_workers=None,
+        chunk_size=DEFAULT_PROCESS_CHUNK_SIZE,
+        show_progress=False,
+    ):
+        """
+        Copy many objects concurrently.
+
+        :param copies: Iterable of (source_bucket, source_key, dst_bucket,
+            dst_key) tuples.
+        :param backend: "thread" or "process", see `upload_directory`.
+        :return: BulkResult with a None result for each successful copy.
+        """
+        return self._run_bulk(
+            copy_task, copies, backend, max_workers, chunk_size, show_progress
+        )
+
+    def download_directory(
+        self,
+        bucket,
+        prefix,
+        local_path,
+        skip_existing="size",
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        max_bytes_in_flight=DEFAULT_MAX_BYTES_IN_FLIGHT_256MB,
+        show_progress=False,
+        Config=TransferConfig(),
+        **filters,
+    ):
+        """
+        Download every object under `prefix` into `local_path`, keeping the
+        key hierarchy below `prefix`. Objects are downloaded concurrently while
+        the prefix is still being listed.
+
+        :param skip_existing: Skip objects whose local file already has the
+            same "size", or the same size and "etag", or None to download
+            everything. The ETag is computed with the part size the object
+            was uploaded with, objects whose ETag isn't an MD5 of the data,
+            such as SSE-KMS objects, are compared by size only.
+        :param max_concurrency: Number of objects downloaded concurrently.
+        :param max_bytes_in_flight: Bytes of objects queued or downloading
+            before listing waits.
+        :param show_progress: Show a progress bar of the total bytes downloaded.
+        :param Config: TransferConfig used for each object.
+        :param filters: Listing filters, see `compile_listing_filter`.
+        :return: DirectoryTransferReport of the transferred, skipped and failed
+            keys, failures map each key to its exception.
+        """
+        return download_directory(
+            self,
+            bucket,
+            prefix,
+            local_path,
+            self.iter_objects(bucket, prefix=prefix, **filters),
+            skip_existing=skip_existing,
+            max_concurrency=max_concurrency,
+            max_bytes_in_flight=max_bytes_in_flight,
+            show_progress=show_progress,
+            Config=Config,
+        )
+
+    def create_archive(
+        self,
+        bucket,
+        prefix,
+        archive_bucket,
+        archive_key,
+        archive_format=None,
+        part_size=DEFAULT_PART_SIZE_8MB,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Bundle every object under a prefix into a tar, tar.gz or zip archive
+        streamed straight into a multipart upload, without local staging.
+
+        :param archive_format: "tar", "tar.gz" or "zip", inferred from
+            `archive_key` if not given.
+        :return: List of archived keys.
+        """
+        return create_archive(
+            self,
+            bucket,
+            prefix,
+            archive_bucket,
+            archive_key,
+            archive_format or infer_archive_format(archive_key),
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+        )
+
+    def extract_archive(
+        self,
+        archive_bucket,
+        archive_key,
+        bucket,
+        prefix,
+        archive_format=None,
+        part_size=DEFAULT_PART_SIZE_8MB,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Stream a tar, tar.gz or zip archive object and upload its members
+        concurrently under a prefix, without local staging.
+
+        :param archive_format: "tar", "tar.gz" or "zip", inferred from
+            `archive_key` if not given.
+        :return: List of uploaded keys.
+        """
+        return extract_archive(
+            self,
+            archive_bucket,
+            archive_key,
+            bucket,
+            prefix,
+            archive_format or infer_archive_format(archive_key),
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+        )
+
+    def _client_kwargs(self):
+        return {
+            "profile_name": self.profile_name,
+            "credentials": self.credentials,
+            "endpoint_url": self.endpoint_url,
+            "region_name": self.region_name,
+        }
+
+    def _run_bulk(
+        self, task, items, backend, max_workers, chunk_size, show_progress, **kwargs
+    ):
+        if backend not in BULK_BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}")
+        if backend == "process":
+            return run_in_process_pool(
+                task,
+                items,
+                self._client_kwargs(),
+                max_workers=max_workers,
+                chunk_size=chunk_size,
+                show_progress=show_progress,
+                **kwargs,
+            )
+        return run_bulk(
+            lambda *item: task(self, *item, **kwargs),
+            items,
+            max_workers or DEFAULT_MAX_CONCURRENCY,
+        )
+
+    def _upload_view_multipart(
+        self, view, bucket, key, part_size, max_concurrency, Callback=None, **kwargs
+    ):
+        upload_id = self.client.create_multipart_upload(
+            Bucket=bucket, Key=key, **kwargs
+        )["UploadId"]
+
+        def upload_part(part_number, start):
+            end = start + part_size
+            with view[start:end] as part:
+                with MemoryViewReader(part) as body:
+                    response = self.client.upload_part(
+                        Bucket=bucket,
+                        Key=key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=body,
+                        **checksums.upload_part_args(kwargs),
+                    )
+                if Callback is not None:
+                    Callback(part.nbytes)
+            return checksums.completed_part(part_number, response, kwargs)
+
+        try:
+            starts = range(0, view.nbytes, part_size)
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                parts = list(
+                    executor.map(upload_part, range(1, len(starts) + 1), starts)
+                )
+            self.client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            self.client.abort_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id
+            )
+            raise
+
+    def _upload_file_from_mmap(
+        self, path, bucket, key, Config=TransferConfig(), ExtraArgs=None, Callback=None
+    ):
+        extra_args = ExtraArgs or {}
+        with open(path, "rb") as f:
+            # zero-length files cannot be memory-mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                self.put_object(b"", bucket, key, **extra_args)
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.upload_buffer(
+                    mapped,
+                    bucket,
+                    key,
+                    multipart_threshold=Config.multipart_threshold,
+                    part_size=Config.multipart_chunksize,
+                    max_concurrency=Config.max_concurrency,
+                    Callback=Callback,
+                    **extra_args,
+                )
+
+    def _download_file_to_mmap(
+        self,
+        bucket,
+        key,
+        filename,
+        Callback=None,
+        Config=TransferConfig(),
+        checksum=None,
+        if_none_match=None,
+        if_modified_since=None,
+    ):
+        """
+        :return: False if the object was not modified since the given
+            validators and nothing was downloaded, True otherwise.
+        """
+        head_kwargs = self._conditional_kwargs(if_none_match, if_modified_since)
+        if checksum is not None:
+            head_kwargs["ChecksumMode"] = "ENABLED"
+        try:
+            head = self.client.head_object(Bucket=bucket, Key=key, **head_kwargs)
+        except ClientError as e:
+            if self._is_not_modified_error(e):
+                return False
+            raise
+        size = head["ContentLength"]
+        ranges = [
+            (start, min(start + Config.multipart_chunksize, size))
+            for start in range(0, size, Config.multipart_chunksize)
+        ]
+        location = f"s3://{bucket}/{key}"
+        hash_parts = False
+        if checksum is not None:
+            expected, parts = checksums.stored_checksum(head, checksum)
+            if expected is None:
+                raise checksums.MissingChecksumError(location, checksum)
+            if parts:
+                # each part is hashed on the thread downloading it, so the
+                # ranges must line up with the parts the stored checksum was
+                # built from. The ranged GETs below are conditional on the
+                # ETag, so the part sizes can't come from another version.
+                ranges = self._part_ranges(
+                    bucket, key, size, parts, Config.max_concurrency
+                )
+                hash_parts = True
+        temp_filename = f"{filename}.{uuid4().hex[:8]}"
+        part_digests = []
+        hasher = (
+            checksums.new_hasher(checksum)
+            if checksum is not None and not hash_parts
+            else None
+        )
+
+        try:
+            with open(temp_filename, "wb+") as f:
+                f.truncate(size)
+                # zero-length files cannot be memory-mapped
+                if size > 0:
+                    with mmap.mmap(f.fileno(), size) as mapped, memoryview(
+                        mapped
+                    ) as view:
 
-                # Upload the file to S3
-                self.upload_file(str(child), bucket, s3_key)
+                        def download_range(byte_range):
+                            start, end = byte_range
+                            response = self.client.get_object(
+                                Bucket=bucket,
+                                Key=key,
+                                Range=f"bytes={start}-{end - 1}",
+                                IfMatch=head["ETag"],
+                            )
+                            part_hasher = (
+                                checksums.new_hasher(checksum) if hash_parts else None
+                            )
+                            with view[start:end] as destination:
+                                self._read_body_into(
+                                    response["Body"], destination, Callback, part_hasher
+                                )
+                            return part_hasher.digest() if hash_parts else None
 
-    def _construct_s3_paginator(self, bucket, prefix=None, delimiter=None):
+                        with ThreadPoolExecutor(
+                            max_workers=Config.max_concurrency
+                        ) as executor:
+                            results = executor.map(download_range, ranges)
+                            if hash_parts:
+                                part_digests = list(results)
+                            else:
+                                # a checksum of the whole object is computed
+                                # in order, each range once it and the ones
+                                # before it have arrived
+                                for (start, end), _ in zip(ranges, results):
+                                    if hasher is not None:
+                                        with view[start:end] as data:
+                                            hasher.update(data)
+                        mapped.flush()
+            if checksum is not None:
+                actual = (
+                    checksums.combine_part_digests(checksum, part_digests)
+                    if hash_parts
+                    else checksums.encode_digest(checksum, hasher.digest())
+                )
+                if actual != expected:
+                    raise checksums.ChecksumMismatchError(
+                        location, checksum, expected, actual
+                    )
+            os.replace(temp_filename, filename)
+        except Exception:
+            Path(temp_filename).unlink(missing_ok=True)
+            raise
+        return True
+
+    def _part_ranges(self, bucket, key, size, parts, max_concurrency):
+        """
+        Byte ranges of the parts of a multipart object, which can have
+        different sizes, from a HEAD of each part.
+        """
+
+        def part_size(part_number):
+            return self.client.head_object(
+                Bucket=bucket, Key=key, PartNumber=part_number
+            )["ContentLength"]
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            part_sizes = list(executor.map(part_size, range(1, parts + 1)))
+        ends = list(accumulate(part_sizes))
+        if ends[-1] != size:
+            raise IOError(
+                f"Parts of s3://{bucket}/{key} add up to {ends[-1]} bytes, expected {size} bytes"
+            )
+        return list(zip([0] + ends[:-1], ends))
+
+    @staticmethod
+    def _read_body_into(body, destination, Callback=None, hasher=None):
+        position = 0
+        while position < destination.nbytes:
+            end = min(position + DEFAULT_READ_CHUNK_SIZE_1MB, destination.nbytes)
+            with destination[position:end] as chunk:
+                bytes_read = body.readinto(chunk)
+                if hasher is not None:
+                    with chunk[:bytes_read] as data:
+                        hasher.update(data)
+            if not bytes_read:
+                raise IOError(
+                    f"Read incomplete. Expected {destination.nbytes} bytes but read {position} bytes"
+                )
+            position += bytes_read
+            if Callback is not None:
+                Callback(bytes_read)
+
+    def _construct_s3_paginator(
+        self, bucket, prefix=None, delimiter=None, start_after=None
+    ):
         kwargs = {"Bucket": bucket}
         s3_paginator = self.client.get_paginator("list_objects_v2")
 
@@ -326,16 +1183,119 @@ class S3Client:
 
         if delimiter is not None:
             kwargs.update({"Delimiter": delimiter})
+
+        if start_after is not None:
+            kwargs.update({"StartAfter": start_after})
         paginate = s3_paginator.paginate(**kwargs)
         return paginate
 
-    def get_streaming_body(self, bucket, key):
+    def get_streaming_body(
+        self,
+        bucket,
+        key,
+        if_none_match=None,
+        if_modified_since=None,
+        decompress=False,
+    ):
         """
         Get a streaming body for an S3 object that supports read operations.
 
         :param bucket: S3 bucket name
         :param key: S3 object key
-        :return: A file-like object that supports read operations
+        :param if_none_match: Only fetch the body if the object's ETag differs.
+        :param if_modified_since: Only fetch the body if the object was
+            modified after this datetime.
+        :param decompress: Decompress the body as it is read according to the
+            object's Content-Encoding.
+        :return: A file-like object that supports read operations, or None if
+            the object was not modified.
         """
-        response = self.client.get_object(Bucket=bucket, Key=key)
+        response = self._get_object_if_modified(
+            bucket, key, if_none_match, if_modified_since
+        )
+        if response is None:
+            return None
+        if decompress:
+            return decompressing_reader(
+                response["Body"], response.get("ContentEncoding")
+            )
         return response["Body"]
+
+    def read_range(self, bucket, key, offset, length):
+        """
+        Read `length` bytes of an object starting at `offset` with a ranged GET.
+        Fewer bytes are returned if the range runs past the end of the object,
+        and none if it starts at or past the end.
+        """
+        if length <= 0:
+            return b""
+        try:
+            response = self.client.get_object(
+                Bucket=bucket, Key=key, Range=f"bytes={offset}-{offset + length - 1}"
+            )
+        except ClientError as e:
+            # S3 answers 416 Range Not Satisfiable for a range past the end
+            if e.response["Error"]["Code"] == "InvalidRange":
+                return b""
+            raise
+        return response["Body"].read()
+
+    def read_ranges(
+        self,
+        bucket,
+        key,
+        ranges,
+        max_gap=DEFAULT_COALESCE_GAP_1MB,
+        max_size=DEFAULT_MAX_COALESCED_SIZE_64MB,
+        max_concurrency=DEFAULT_RANGE_CONCURRENCY,
+    ):
+        """
+        Read many byte ranges of an object. Ranges closer than `max_gap` bytes
+        are coalesced into a single ranged GET and the GETs run concurrently.
+
+        :param ranges: List of (offset, length) tuples.
+        :return: List of bytes, one per requested range, in request order.
+        """
+        return read_coalesced_ranges(
+            ranges,
+            lambda offset, length: self.read_range(bucket, key, offset, length),
+            max_gap=max_gap,
+            max_size=max_size,
+            max_concurrency=max_concurrency,
+        )
+
+    def _get_object_if_modified(
+        self, bucket, key, if_none_match=None, if_modified_since=None, **kwargs
+    ):
+        try:
+            return self.client.get_object(
+                Bucket=bucket,
+                Key=key,
+                **self._conditional_kwargs(if_none_match, if_modified_since),
+                **kwargs,
+            )
+        except ClientError as e:
+            if self._is_not_modified_error(e):
+                return None
+            raise
+
+    @staticmethod
+    def _conditional_kwargs(if_none_match=None, if_modified_since=None):
+        kwargs = {}
+        if if_none_match is not None:
+            kwargs["IfNoneMatch"] = if_none_match
+        if if_modified_since is not None:
+            kwargs["IfModifiedSince"] = if_modified_since
+        return kwargs
+
+    @staticmethod
+    def _is_not_modified_error(e):
+        return e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 304
+
+    @staticmethod
+    def _write_body_to_file(body, path, Callback=None):
+        with open(path, "wb") as f:
+            for chunk in iter(lambda: body.read(DEFAULT_READ_CHUNK_SIZE_1MB), b""):
+                f.write(chunk)
+                if Callback is not None:
+                    Callback(len(chunk))
@@ -0,0 +1,170 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import BoundedSemaphore, Condition, Lock
+
+from tqdm import tqdm
+
+from ..utils.keys import relative_key
+
+SKIP_EXISTING_MODES = [None, "size", "etag"]
+
+
+@dataclass
+class DirectoryTransferReport:
+    transferred: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+    bytes_transferred: int = 0
+
+    @property
+    def succeeded(self):
+        return not self.failed
+
+
+class ByteBudget:
+    def __init__(self, max_bytes):
+        """
+        Blocks `acquire` while more than `max_bytes` are in flight. A single
+        request larger than the budget is let through once nothing else is in
+        flight so that it cannot block forever.
+        """
+        self._max_bytes = max_bytes
+        self._in_flight = 0
+        self._condition = Condition()
+
+    def acquire(self, size):
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._in_flight == 0
+                or self._in_flight + size <= self._max_bytes
+            )
+            self._in_flight += size
+
+    def release(self, size):
+        with self._condition:
+            self._in_flight -= size
+            self._condition.notify_all()
+
+
+def download_directory(
+    s3_client,
+    bucket,
+    prefix,
+    local_path,
+    contents,
+    skip_existing,
+    max_concurrency,
+    max_bytes_in_flight,
+    show_progress,
+    Config,
+):
+    """
+    Download every object in `contents` below `local_path`, keeping the part of
+    each key after `prefix` as its relative path.
+
+    Objects are downloaded concurrently as they are listed, with at most
+    `max_bytes_in_flight` bytes and `2 * max_concurrency` objects queued or
+    downloading at once. Failures are recorded in the report instead of
+    stopping the other downloads.
+    """
+    if skip_existing not in SKIP_EXISTING_MODES:
+        raise ValueError(f"Unsupported skip_existing mode: {skip_existing}")
+
+    local_path = Path(local_path).resolve()
+    report = DirectoryTransferReport()
+    report_lock = Lock()
+    budget = ByteBudget(max_bytes_in_flight)
+    queued = BoundedSemaphore(2 * max_concurrency)
+
+    with tqdm(
+        total=0,
+        unit="B",
+        unit_scale=True,
+        desc=str(local_path),
+        disable=not show_progress,
+    ) as progress:
+
+        def on_bytes(bytes_amount):
+            with report_lock:
+                report.bytes_transferred += bytes_amount
+                progress.update(bytes_amount)
+
+        def download(key, path, size):
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                s3_client.client.download_file(
+                    bucket, key, str(path), Callback=on_bytes, Config=Config
+                )
+                with report_lock:
+                    report.transferred.append(key)
+            except Exception as e:
+                with report_lock:
+                    report.failed[key] = e
+            finally:
+                budget.release(size)
+                queued.release()
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for content in contents:
+                key = content["Key"]
+                if key.endswith("/"):
+                    continue
+                path = (local_path / relative_key(key, prefix)).resolve()
+                if not path.is_relative_to(local_path):
+                    with report_lock:
+                        report.failed[key] = ValueError(
+                            f"{key} resolves outside of {local_path}"
+                        )
+                    continue
+                if _is_up_to_date(s3_client, bucket, path, content, skip_existing):
+                    with report_lock:
+                        report.skipped.append(key)
+                    continue
+
+                size = content["Size"]
+                with report_lock:
+                    progress.total += size
+                    progress.refresh()
+                queued.acquire()
+                budget.acquire(size)
+                executor.submit(download, key, path, size)
+    return report
+
+
+def compute_etag(path, part_size):
+    """
+    S3 ETag a file would get when uploaded as parts of `part_size` bytes, or as
+    a single PutObject if it is no larger than one part.
+    """
+    part_digests = []
+    with open(path, "rb") as f:
+        while True:
+            part = f.read(part_size)
+            if not part and part_digests:
+                break
+            part_digests.append(hashlib.md5(part).digest())
+            if len(part) < part_size:
+                break
+    if len(part_digests) == 1:
+        return f'"{part_digests[0].hex()}"'
+    etag = hashlib.md5(b"".join(part_digests)).hexdigest()
+    return f'"{etag}-{len(part_digests)}"'
+
+
+def _is_up_to_date(s3_client, bucket, path, content, skip_existing):
+    if skip_existing is None or not path.is_file():
+        return False
+    if os.path.getsize(path) != content["Size"]:
+        return False
+    if skip_existing == "size":
+        return True
+    verifiable_etag = s3_client.get_verifiable_etag(bucket, content["Key"])
+    if verifiable_etag is None:
+        # e.g. SSE-KMS objects, whose ETag isn't an MD5 of the data, can only
+        # be compared by size
+        return True
+    etag, part_size = verifiable_etag
+    return compute_etag(path, part_size or max(content["Size"], 1)) == etag
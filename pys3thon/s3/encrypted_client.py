@@ -0,0 +1,64 @@
+import os
+
+
+class EncryptedS3Client:
+    def __init__(self, s3_client, encryption):
+        """
+        Encrypt objects client-side as they are uploaded and decrypt them as
+        they are downloaded, see EnvelopeEncryption for the format.
+
+        :param s3_client: S3Client to transfer the encrypted objects with.
+        :param encryption: EnvelopeEncryption holding the master key.
+        """
+        self.s3_client = s3_client
+        self.encryption = encryption
+
+    def upload_fileobj(self, fileobj, bucket, key, **kwargs):
+        self.s3_client.upload_fileobj(
+            self.encryption.encrypting_reader(fileobj), bucket, key, **kwargs
+        )
+
+    def upload_file(self, path, bucket, key, **kwargs):
+        with open(path, "rb") as f:
+            self.upload_fileobj(f, bucket, key, **kwargs)
+
+    def put_object(self, data, bucket, key, **kwargs):
+        self.s3_client.upload_buffer(
+            self.encryption.encrypt(data), bucket, key, **kwargs
+        )
+
+    def get_object(self, bucket, key):
+        with self.s3_client.get_streaming_body(bucket, key) as body:
+            return self.encryption.decrypt(body.read())
+
+    def download(self, bucket, key, save_path):
+        """
+        Stream and decrypt an object into `save_path`. The file is removed if
+        the object fails to decrypt.
+        """
+        try:
+            with self.s3_client.get_streaming_body(bucket, key) as body, open(
+                save_path, "wb"
+            ) as f:
+                self.encryption.decrypt_stream(body, f)
+        except BaseException:
+            if os.path.exists(save_path):
+                os.remove(save_path)
+            raise
+
+    def read_range(self, bucket, key, offset, length):
+        return self.encryption.decrypt_range(
+            lambda start, size: self.s3_client.read_range(bucket, key, start, size),
+            self.s3_client.get_object_size(bucket, key),
+            offset,
+            length,
+        )
+
+    def get_object_size(self, bucket, key):
+        """
+        Size of the decrypted object.
+        """
+        return self.encryption.plaintext_size(
+            lambda start, size: self.s3_client.read_range(bucket, key, start, size),
+            self.s3_client.get_object_size(bucket, key),
+        )
@@ -0,0 +1,68 @@
+import re
+from fnmatch import translate
+
+
+def compile_listing_filter(
+    suffix=None,
+    glob=None,
+    min_size=None,
+    max_size=None,
+    modified_since=None,
+    storage_class=None,
+):
+    """
+    Compile listing filters into a single predicate over `Contents` entries,
+    so that it can be applied to each page as it is listed.
+
+    :param suffix: Key suffix, or tuple of suffixes, to keep.
+    :param glob: Shell-style pattern the whole key must match, e.g. `*/2024-*.csv`.
+    :param min_size: Smallest object size in bytes to keep.
+    :param max_size: Largest object size in bytes to keep.
+    :param modified_since: Timezone-aware datetime, only objects last modified
+        at or after it are kept.
+    :param storage_class: Storage class, or collection of storage classes, to
+        keep.
+    :return: Predicate taking a `Contents` entry, or None if no filter is set.
+    """
+    checks = []
+    if suffix is not None:
+        suffix = suffix if isinstance(suffix, str) else tuple(suffix)
+        checks.append(lambda content: content["Key"].endswith(suffix))
+    if glob is not None:
+        match = re.compile(translate(glob)).match
+        checks.append(lambda content: match(content["Key"]) is not None)
+    if min_size is not None:
+        checks.append(lambda content: content["Size"] >= min_size)
+    if max_size is not None:
+        checks.append(lambda content: content["Size"] <= max_size)
+    if modified_since is not None:
+        checks.append(lambda content: content["LastModified"] >= modified_since)
+    if storage_class is not None:
+        storage_classes = (
+            {storage_class} if isinstance(storage_class, str) else set(storage_class)
+        )
+        checks.append(
+            lambda content: content.get("StorageClass", "STANDARD") in storage_classes
+        )
+
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda content: all(check(content) for check in checks)
+
+
+def filter_page(contents, predicate=None, fields=None):
+    """
+    Filter and project the `Contents` of one listing page.
+
+    :param fields: Keys of each entry to keep, e.g. `["Key", "Size"]`.
+    """
+    if predicate is not None:
+        contents = [content for content in contents if predicate(content)]
+    if fields is not None:
+        contents = [
+            {field: content[field] for field in fields if field in content}
+            for content in contents
+        ]
+    return contents
@@ -0,0 +1,210 @@
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+
+INSERT_BATCH_SIZE = 10000
+
+
+@dataclass
+class ListingChanges:
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+
+
+class ListingIndex:
+    def __init__(self, path):
+        """
+        SQLite-backed snapshot of S3 listings, used to find what changed under
+        a prefix since it was last scanned without keeping every listing in
+        memory.
+
+        :param path: Path of the SQLite database file, created if missing.
+        """
+        self.path = str(path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = Lock()
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS objects (
+                    bucket TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    size INTEGER,
+                    etag TEXT,
+                    last_modified TEXT,
+                    storage_class TEXT,
+                    PRIMARY KEY (bucket, key)
+                ) WITHOUT ROWID
+                """)
+
+    def scan(self, s3_client, bucket, prefix, start_after_last_key=False):
+        """
+        List `prefix` and update the snapshot of it.
+
+        :param start_after_last_key: Only list keys after the largest key in
+            the snapshot using `StartAfter`. This is much cheaper for prefixes
+            whose keys only ever increase lexically (e.g. timestamped names)
+            but cannot detect removed or changed objects.
+        :return: ListingChanges of the objects added, removed and changed since
+            the previous scan.
+        """
+        start_after = self.last_key(bucket, prefix) if start_after_last_key else None
+        contents = (
+            content
+            for content in s3_client._construct_s3_paginator(
+                bucket, prefix=prefix, start_after=start_after
+            ).search("Contents")
+            if content is not None
+        )
+
+        with self._lock, self._connection:
+            self._connection.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS listing (
+                    key TEXT PRIMARY KEY,
+                    size INTEGER,
+                    etag TEXT,
+                    last_modified TEXT,
+                    storage_class TEXT
+                ) WITHOUT ROWID
+                """)
+            self._connection.execute("DELETE FROM listing")
+            self._insert_listing(contents)
+
+            lower, upper = self._key_range(prefix)
+            changes = ListingChanges(
+                added=self._query(
+                    """
+                    SELECT l.key, l.size, l.etag, l.last_modified, l.storage_class
+                    FROM listing l LEFT JOIN objects o
+                        ON o.bucket = ? AND o.key = l.key
+                    WHERE o.key IS NULL ORDER BY l.key
+                    """,
+                    (bucket,),
+                ),
+                changed=self._query(
+                    """
+                    SELECT l.key, l.size, l.etag, l.last_modified, l.storage_class
+                    FROM listing l JOIN objects o
+                        ON o.bucket = ? AND o.key = l.key
+                    WHERE o.etag IS NOT l.etag OR o.size IS NOT l.size
+                    ORDER BY l.key
+                    """,
+                    (bucket,),
+                ),
+            )
+            if not start_after_last_key:
+                changes.removed = self._query(
+                    """
+                    SELECT o.key, o.size, o.etag, o.last_modified, o.storage_class
+                    FROM objects o LEFT JOIN listing l ON l.key = o.key
+                    WHERE o.bucket = ? AND o.key >= ? AND o.key < ?
+                        AND l.key IS NULL
+                    ORDER BY o.key
+                    """,
+                    (bucket, lower, upper),
+                )
+                self._connection.execute(
+                    """
+                    DELETE FROM objects
+                    WHERE bucket = ? AND key >= ? AND key < ?
+                        AND key NOT IN (SELECT key FROM listing)
+                    """,
+                    (bucket, lower, upper),
+                )
+
+            self._connection.execute(
+                """
+                INSERT OR REPLACE INTO objects
+                SELECT ?, key, size, etag, last_modified, storage_class FROM listing
+                """,
+                (bucket,),
+            )
+            self._connection.execute("DELETE FROM listing")
+        return changes
+
+    def get(self, bucket, key):
+        rows = self._query(
+            """
+            SELECT key, size, etag, last_modified, storage_class FROM objects
+            WHERE bucket = ? AND key = ?
+            """,
+            (bucket, key),
+        )
+        return rows[0] if rows else None
+
+    def list(self, bucket, prefix=""):
+        """
+        Objects under `prefix` from the last snapshot, in key order.
+        """
+        lower, upper = self._key_range(prefix)
+        return self._query(
+            """
+            SELECT key, size, etag, last_modified, storage_class FROM objects
+            WHERE bucket = ? AND key >= ? AND key < ? ORDER BY key
+            """,
+            (bucket, lower, upper),
+        )
+
+    def last_key(self, bucket, prefix=""):
+        lower, upper = self._key_range(prefix)
+        row = self._connection.execute(
+            "SELECT MAX(key) FROM objects WHERE bucket = ? AND key >= ? AND key < ?",
+            (bucket, lower, upper),
+        ).fetchone()
+        return row[0]
+
+    def close(self):
+        self._connection.close()
+
+    def _insert_listing(self, contents):
+        batch = []
+        for content in contents:
+            batch.append(
+                (
+                    content["Key"],
+                    content.get("Size"),
+                    content.get("ETag"),
+                    (
+                        content["LastModified"].isoformat()
+                        if content.get("LastModified")
+                        else None
+                    ),
+                    content.get("StorageClass"),
+                )
+            )
+            if len(batch) >= INSERT_BATCH_SIZE:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO listing VALUES (?, ?, ?, ?, ?)", batch
+                )
+                batch = []
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO listing VALUES (?, ?, ?, ?, ?)", batch
+        )
+
+    def _query(self, sql, parameters):
+        return [
+            self._row_to_content(row)
+            for row in self._connection.execute(sql, parameters)
+        ]
+
+    @staticmethod
+    def _row_to_content(row):
+        key, size, etag, last_modified, storage_class = row
+        return {
+            "Key": key,
+            "Size": size,
+            "ETag": etag,
+            "LastModified": (
+                datetime.fromisoformat(last_modified) if last_modified else None
+            ),
+            "StorageClass": storage_class,
+        }
+
+    @staticmethod
+    def _key_range(prefix):
+        # every key starting with `prefix` sorts in [prefix, prefix + U+10FFFF)
+        # which lets SQLite answer prefix queries from the primary key index
+        prefix = prefix or ""
+        return prefix, prefix + "\U0010ffff"
@@ -0,0 +1,148 @@
+from threading import Lock
+
+from botocore.exceptions import ClientError
+
+from .bulk import run_bulk
+from .client import DEFAULT_MAX_CONCURRENCY, S3Client
+
+DEFAULT_REGION = "us-east-1"
+
+
+class MultiRegionS3Client:
+    def __init__(
+        self,
+        profile_name=None,
+        credentials=None,
+        endpoint_url=None,
+        default_region=DEFAULT_REGION,
+        download_cache=None,
+    ):
+        """
+        Route calls to an S3Client in the region of each bucket, so that jobs
+        spanning buckets in several regions don't construct clients by hand.
+
+        Bucket regions are resolved once and cached, and one S3Client is kept
+        per region and shared by every bucket in it.
+
+        :param profile_name: AWS CLI profile name to use.
+        :param credentials: Dictionary containing 'aws_access_key_id' and 'aws_secret_access_key'.
+        :param endpoint_url: Custom S3 endpoint URL.
+        :param default_region: Region of the client used to look up bucket regions.
+        :param download_cache: Optional DownloadCache shared by every client.
+        """
+        self.profile_name = profile_name
+        self.credentials = credentials
+        self.endpoint_url = endpoint_url
+        self.default_region = default_region
+        self.download_cache = download_cache
+        self._clients = {}
+        self._bucket_regions = {}
+        self._lock = Lock()
+
+    def client_for_region(self, region):
+        with self._lock:
+            if region not in self._clients:
+                self._clients[region] = S3Client(
+                    profile_name=self.profile_name,
+                    credentials=self.credentials,
+                    endpoint_url=self.endpoint_url,
+                    region_name=region,
+                    download_cache=self.download_cache,
+                )
+            return self._clients[region]
+
+    def client_for_bucket(self, bucket):
+        return self.client_for_region(self.get_bucket_region(bucket))
+
+    def get_bucket_region(self, bucket):
+        region = self._bucket_regions.get(bucket)
+        if region is None:
+            region = self._lookup_bucket_region(bucket)
+            with self._lock:
+                self._bucket_regions[bucket] = region
+        return region
+
+    def head_object(self, bucket, key):
+        return self.client_for_bucket(bucket).head_object(bucket, key)
+
+    def download(self, bucket, key, save_prefix, **kwargs):
+        return self.client_for_bucket(bucket).download(
+            bucket, key, save_prefix, **kwargs
+        )
+
+    def copy(self, source_bucket, source_key, dst_bucket, dst_key):
+        """
+        Copy an object, possibly across regions. The copy is issued from the
+        destination region and the source is read with the source region's
+        client.
+        """
+        source_client = self.client_for_bucket(source_bucket)
+        dst_client = self.client_for_bucket(dst_bucket)
+        dst_client.client.copy(
+            {"Bucket": source_bucket, "Key": source_key},
+            dst_bucket,
+            dst_key,
+            SourceClient=source_client.client,
+        )
+
+    def get_s3_keys(self, bucket, prefix=None, delimiter=None, **filters):
+        return self.client_for_bucket(bucket).get_s3_keys(
+            bucket, prefix, delimiter, **filters
+        )
+
+    def get_files_for_bucket_with_prefix(self, bucket, prefix, **kwargs):
+        return self.client_for_bucket(bucket).get_files_for_bucket_with_prefix(
+            bucket, prefix, **kwargs
+        )
+
+    def iter_objects(self, bucket, prefix=None, **kwargs):
+        return self.client_for_bucket(bucket).iter_objects(
+            bucket, prefix=prefix, **kwargs
+        )
+
+    def head_many(self, locations, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        :param locations: Iterable of (bucket, key) tuples, in any buckets.
+        :return: BulkResult mapping each (bucket, key) to its head_object
+            response or exception.
+        """
+        return run_bulk(self.head_object, locations, max_concurrency)
+
+    def copy_many(self, copies, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        :param copies: Iterable of (source_bucket, source_key, dst_bucket,
+            dst_key) tuples, in any buckets.
+        :return: BulkResult with a None result for each successful copy.
+        """
+        return run_bulk(self.copy, copies, max_concurrency)
+
+    def download_many(self, downloads, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        :param downloads: Iterable of (bucket, key, save_prefix) tuples, in any
+            buckets.
+        :return: BulkResult mapping each item to the result of `download`.
+        """
+        return run_bulk(self.download, downloads, max_concurrency)
+
+    def list_many(self, prefixes, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        :param prefixes: Iterable of (bucket, prefix) tuples, in any buckets.
+        :return: BulkResult mapping each (bucket, prefix) to its list of keys.
+        """
+        return run_bulk(self.get_s3_keys, prefixes, max_concurrency)
+
+    def _lookup_bucket_region(self, bucket):
+        # S3 returns the bucket region in a header of HeadBucket responses,
+        # including redirect and access denied errors from the wrong region
+        client = self.client_for_region(self.default_region).client
+        try:
+            response = client.head_bucket(Bucket=bucket)
+        except ClientError as e:
+            response = e.response
+        region = response["ResponseMetadata"]["HTTPHeaders"].get("x-amz-bucket-region")
+        if region is None:
+            location = client.get_bucket_location(Bucket=bucket)
+            region = location["LocationConstraint"] or DEFAULT_REGION
+            if region == "EU":
+                region = "eu-west-1"
+        return region
@@ -0,0 +1,165 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+
+from . import checksums
+
+MIN_PART_SIZE_5MB = 5 * 1024 * 1024
+MAX_PARTS = 10000
+
+
+class S3MultipartWriter(io.BufferedIOBase):
+    def __init__(
+        self,
+        s3_client,
+        bucket,
+        key,
+        part_size,
+        max_concurrency,
+        max_parts_in_flight=None,
+        **kwargs,
+    ):
+        """
+        Writable file-like object that uploads to S3 as a multipart upload,
+        sending parts concurrently in the background while the caller keeps
+        writing.
+
+        At most `max_parts_in_flight` parts are queued or uploading at once, so
+        memory stays around `(max_parts_in_flight + 1) * part_size`. Objects
+        smaller than one part are sent with a single PutObject. The upload is
+        completed on close, and aborted if a part fails or the writer is used
+        as a context manager and exited with an exception.
+
+        :param s3_client: S3Client to upload with.
+        :param bucket: S3 bucket name.
+        :param key: S3 object key.
+        :param part_size: Size in bytes of each part, at least 5MB. Writing
+            more than 10,000 parts' worth raises ValueError.
+        :param max_concurrency: Number of parts uploaded concurrently.
+        :param max_parts_in_flight: Number of parts that can be queued or
+            uploading before write blocks, defaults to `max_concurrency`.
+        :param kwargs: Extra arguments for PutObject/CreateMultipartUpload.
+        """
+        if part_size < MIN_PART_SIZE_5MB:
+            raise ValueError(
+                f"part_size must be at least {MIN_PART_SIZE_5MB} bytes, got {part_size}"
+            )
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._extra_args = kwargs
+        self._buffer = bytearray()
+        self._bytes_written = 0
+        self._upload_id = None
+        self._parts = []
+        self._error = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._in_flight = BoundedSemaphore(max_parts_in_flight or max_concurrency)
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        with memoryview(b) as view, view.cast("B") as data:
+            if self._bytes_written + data.nbytes > MAX_PARTS * self._part_size:
+                raise ValueError(
+                    f"s3://{self._bucket}/{self._key} would need more than "
+                    f"{MAX_PARTS} parts of {self._part_size} bytes, use a larger part_size"
+                )
+            position = 0
+            while position < data.nbytes:
+                end = min(position + self._part_size - len(self._buffer), data.nbytes)
+                self._buffer += data[position:end]
+                position = end
+                if len(self._buffer) >= self._part_size:
+                    self._submit_part()
+            self._bytes_written += data.nbytes
+            return data.nbytes
+
+    def tell(self):
+        return self._bytes_written
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                self._s3_client.put_object(
+                    self._buffer, self._bucket, self._key, **self._extra_args
+                )
+            else:
+                if self._buffer:
+                    self._submit_part()
+                parts = [future.result() for future in self._parts]
+                self._s3_client.client.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            self.abort()
+            raise
+        self._executor.shutdown()
+        super().close()
+
+    def abort(self):
+        if self.closed:
+            return
+        try:
+            self._executor.shutdown(cancel_futures=True)
+            if self._upload_id is not None:
+                self._s3_client.client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+                )
+        finally:
+            self._buffer = bytearray()
+            super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __del__(self):
+        # never complete a half-written object when the writer is garbage
+        # collected without being closed
+        try:
+            self.abort()
+        except Exception:
+            pass
+
+    def _submit_part(self):
+        if self._error is not None:
+            raise self._error
+        if self._upload_id is None:
+            self._upload_id = self._s3_client.client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key, **self._extra_args
+            )["UploadId"]
+
+        part_number = len(self._parts) + 1
+        body, self._buffer = self._buffer, bytearray()
+        self._in_flight.acquire()
+        future = self._executor.submit(self._upload_part, part_number, body)
+        future.add_done_callback(self._on_part_done)
+        self._parts.append(future)
+
+    def _upload_part(self, part_number, body):
+        response = self._s3_client.client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+            **checksums.upload_part_args(self._extra_args),
+        )
+        return checksums.completed_part(part_number, response, self._extra_args)
+
+    def _on_part_done(self, future):
+        self._in_flight.release()
+        if not future.cancelled() and future.exception() is not None:
+            self._error = future.exception()
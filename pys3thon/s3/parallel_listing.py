@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from queue import Full, Queue
+from threading import Event
+
+from .listing_filter import filter_page
+
+DEFAULT_SHARD_ALPHABET = (
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+)
+DEFAULT_MAX_PAGES_BUFFERED = 4
+_QUEUE_POLL_INTERVAL_SECONDS = 0.1
+_SHARD_DONE = object()
+
+
+def alphabet_boundaries(prefix=None, alphabet=DEFAULT_SHARD_ALPHABET):
+    """
+    Boundary keys splitting `prefix` by the character that follows it, giving
+    `len(alphabet) + 1` shards. Keys with characters outside `alphabet` still
+    fall into the first or last shard, so no key is missed.
+    """
+    prefix = prefix or ""
+    return [prefix + character for character in sorted(set(alphabet))]
+
+
+def sample_boundaries(keys, shards):
+    """
+    Boundary keys splitting a sorted sample of keys, e.g. a previous listing
+    or a ListingIndex snapshot, into `shards` evenly sized shards.
+    """
+    keys = sorted(keys)
+    if shards <= 1 or not keys:
+        return []
+    step = len(keys) / shards
+    return sorted({keys[int(step * i)] for i in range(1, shards)})
+
+
+def list_objects_parallel(
+    s3_client,
+    bucket,
+    prefix,
+    boundaries,
+    ordered,
+    max_concurrency,
+    max_pages_buffered,
+    predicate=None,
+    fields=None,
+):
+    """
+    List `prefix` as independent key ranges split at `boundaries`, paginating
+    up to `max_concurrency` ranges at once.
+
+    Shard `i` starts listing after `boundaries[i - 1]` with `StartAfter` and
+    stops once it passes `boundaries[i]`, so every key is listed exactly once.
+    Each shard buffers at most `max_pages_buffered` pages ahead of the caller.
+
+    :param ordered: Yield objects in key order, otherwise yield pages from any
+        shard as soon as they are listed.
+    :param predicate: Filter applied to each page in the listing threads, see
+        `compile_listing_filter`.
+    :param fields: Keys of each entry to keep.
+    :return: Generator of the `Contents` entries of the listing.
+    """
+    boundaries = sorted(set(boundaries))
+    shard_ranges = list(zip([None] + boundaries, boundaries + [None]))
+    stop = Event()
+    if ordered:
+        queues = [Queue(maxsize=max_pages_buffered) for _ in shard_ranges]
+    else:
+        queue = Queue(maxsize=max_pages_buffered * max_concurrency)
+        queues = [queue] * len(shard_ranges)
+
+    def list_shard(start_after, end, queue):
+        if stop.is_set():
+            return
+        try:
+            pages = s3_client._construct_s3_paginator(
+                bucket, prefix=prefix, start_after=start_after
+            )
+            for page in pages:
+                contents = page.get("Contents", [])
+                in_range = [c for c in contents if end is None or c["Key"] <= end]
+                reached_end = len(in_range) < len(contents)
+                in_range = filter_page(in_range, predicate, fields)
+                if in_range and not _put(queue, in_range, stop):
+                    return
+                if reached_end:
+                    break
+        except Exception as e:
+            _put(queue, e, stop)
+        finally:
+            _put(queue, _SHARD_DONE, stop)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        try:
+            for (start_after, end), queue in zip(shard_ranges, queues):
+                executor.submit(list_shard, start_after, end, queue)
+
+            if ordered:
+                for queue in queues:
+                    yield from _drain(queue, shards=1)
+            else:
+                yield from _drain(queues[0], shards=len(shard_ranges))
+        finally:
+            # lets blocked shards exit if the caller stops iterating early
+            stop.set()
+
+
+def _drain(queue, shards):
+    while shards:
+        item = queue.get()
+        if item is _SHARD_DONE:
+            shards -= 1
+        elif isinstance(item, Exception):
+            raise item
+        else:
+            yield from item
+
+
+def _put(queue, item, stop):
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_QUEUE_POLL_INTERVAL_SECONDS)
+            return True
+        except Full:
+            continue
+    return False
@@ -0,0 +1,116 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+
+from tqdm import tqdm
+
+from .bulk import BulkResult
+
+DEFAULT_PROCESS_CHUNK_SIZE = 64
+
+_worker_client = None
+
+
+def run_in_process_pool(
+    task,
+    items,
+    client_kwargs,
+    max_workers=None,
+    chunk_size=DEFAULT_PROCESS_CHUNK_SIZE,
+    show_progress=False,
+    **task_kwargs,
+):
+    """
+    Run `task` for every item on a pool of worker processes, for bulk
+    transfers whose per-item work (hashing, encryption, compression) is CPU
+    bound and would otherwise be serialised by the GIL.
+
+    Each worker builds its own S3Client from `client_kwargs` once. Items are
+    sent in chunks of `chunk_size` and each chunk returns one list of small
+    result tuples, so IPC costs one round trip per chunk rather than per item.
+    At most `2 * max_workers` chunks are queued at once, so `items` can be a
+    lazy iterable of any length.
+
+    :param task: Module level function called in the worker as
+        `task(s3_client, *item, **task_kwargs)`, returning the item's result.
+    :param items: Iterable of argument tuples.
+    :param client_kwargs: Keyword arguments for S3Client in each worker.
+    :param show_progress: Show a progress bar of completed items.
+    :return: BulkResult mapping each item to its result or exception.
+    """
+    result = BulkResult()
+    items = iter(items)
+    max_workers = max_workers or os.cpu_count()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(client_kwargs,),
+    ) as executor, tqdm(unit="item", disable=not show_progress) as progress:
+        futures = set()
+        while True:
+            while len(futures) < 2 * max_workers:
+                chunk = [tuple(item) for item in islice(items, chunk_size)]
+                if not chunk:
+                    break
+                futures.add(executor.submit(_run_chunk, task, chunk, task_kwargs))
+            if not futures:
+                break
+            future = next(as_completed(futures))
+            futures.remove(future)
+            chunk_results = future.result()
+            for item, value, error in chunk_results:
+                if error is None:
+                    result.results[item] = value
+                else:
+                    result.failed[item] = error
+            progress.update(len(chunk_results))
+    return result
+
+
+def upload_file_task(s3_client, path, bucket, key, transform=None, **kwargs):
+    """
+    Upload a local file, passing its contents through `transform` first if
+    given, e.g. to compress or encrypt it.
+
+    :param transform: Picklable callable taking and returning bytes.
+    :return: Number of bytes uploaded.
+    """
+    if transform is None:
+        s3_client.upload_file(str(path), bucket, key, **kwargs)
+        with open(path, "rb") as f:
+            return f.seek(0, 2)
+    with open(path, "rb") as f:
+        data = transform(f.read())
+    s3_client.upload_buffer(data, bucket, key, **kwargs)
+    return len(data)
+
+
+def copy_task(s3_client, source_bucket, source_key, dst_bucket, dst_key):
+    s3_client.copy(source_bucket, source_key, dst_bucket, dst_key)
+
+
+def _init_worker(client_kwargs):
+    global _worker_client
+    from .client import S3Client
+
+    _worker_client = S3Client(**client_kwargs)
+
+
+def _run_chunk(task, chunk, task_kwargs):
+    results = []
+    for item in chunk:
+        try:
+            results.append((item, task(_worker_client, *item, **task_kwargs), None))
+        except Exception as e:
+            results.append((item, None, _picklable(e)))
+    return results
+
+
+def _picklable(e):
+    # an exception that can't be sent back would fail the whole chunk
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:
+        return RuntimeError(repr(e))
@@ -1,2 +1,17 @@
-from .cryptography import AES256GCM  # noqa: F401
+from .buffer import IterableReader, MemoryViewReader  # noqa: F401
+from .download_cache import DownloadCache  # noqa: F401
+from .ranges import coalesce_ranges, read_coalesced_ranges  # noqa: F401
 from .run_shell_command import run_shell_command  # noqa: F401
+
+
+def __getattr__(name):
+    # cryptography is slow to import, so only load it when it is used
+    if name == "AES256GCM":
+        from .cryptography import AES256GCM
+
+        return AES256GCM
+    if name == "EnvelopeEncryption":
+        from .envelope_encryption import EnvelopeEncryption
+
+        return EnvelopeEncryption
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
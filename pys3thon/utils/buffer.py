@@ -0,0 +1,97 @@
+import io
+
+
+class MemoryViewReader(io.RawIOBase):
+    def __init__(self, buffer):
+        """
+        Read-only, seekable file-like object over any object supporting the
+        buffer protocol (bytes, bytearray, memoryview, mmap).
+
+        Slicing the underlying memoryview does not copy, so handing slices of
+        a large buffer to boto3 only copies the bytes as they are sent.
+
+        :param buffer: Object supporting the buffer protocol.
+        """
+        view = memoryview(buffer)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        self._view = view
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        start = self._position
+        end = min(start + len(b), len(self._view))
+        b[: end - start] = self._view[start:end]
+        self._position = end
+        return end - start
+
+    def read(self, size=-1):
+        start = self._position
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(start + size, len(self._view))
+        self._position = end
+        return self._view[start:end].tobytes()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+    def __len__(self):
+        return len(self._view)
+
+
+class IterableReader(io.RawIOBase):
+    def __init__(self, chunks):
+        """
+        Readable file-like object over an iterable of bytes chunks, pulling a
+        chunk only when the previous one has been read, so that generated
+        streams (e.g. encrypted or compressed) can be uploaded in constant
+        memory.
+
+        :param chunks: Iterable of bytes-like chunks.
+        """
+        self._chunks = iter(chunks)
+        self._buffer = b""
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while self._position >= len(self._buffer):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+            self._position = 0
+        start = self._position
+        end = min(start + len(b), len(self._buffer))
+        b[: end - start] = self._buffer[start:end]
+        self._position = end
+        return end - start
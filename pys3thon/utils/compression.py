@@ -0,0 +1,159 @@
+import gzip
+import io
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .buffer import IterableReader
+
+CONTENT_ENCODINGS = ["gzip", "zstd"]
+DEFAULT_COMPRESSION_CHUNK_SIZE_4MB = 4 * 1024 * 1024
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def compressing_reader(
+    fileobj,
+    content_encoding,
+    level=None,
+    threads=0,
+    chunk_size=DEFAULT_COMPRESSION_CHUNK_SIZE_4MB,
+):
+    """
+    Readable file-like object of `fileobj` compressed as it is read, holding
+    at most a few chunks in memory.
+
+    :param content_encoding: "gzip" or "zstd".
+    :param level: Compression level, defaults to the codec's default.
+    :param threads: Number of threads compressing in parallel, 0 compresses
+        on the reading thread. Parallel gzip compresses each chunk as its own
+        gzip member, which concatenate into a valid gzip stream. Parallel zstd
+        uses zstd's own worker threads.
+    :param chunk_size: Bytes of input compressed at a time.
+    """
+    if content_encoding == "gzip":
+        level = DEFAULT_GZIP_LEVEL if level is None else level
+        if threads > 1:
+            chunks = _compress_gzip_parallel(fileobj, level, threads, chunk_size)
+        else:
+            chunks = _compress_gzip(fileobj, level, chunk_size)
+    elif content_encoding == "zstd":
+        zstandard = _import_zstandard()
+        compressor = zstandard.ZstdCompressor(
+            level=DEFAULT_ZSTD_LEVEL if level is None else level,
+            threads=threads if threads > 1 else 0,
+        )
+        chunks = compressor.read_to_iter(fileobj, read_size=chunk_size)
+    else:
+        raise ValueError(f"Unsupported content encoding: {content_encoding}")
+    return IterableReader(chunks)
+
+
+def decompressing_reader(
+    fileobj, content_encoding, chunk_size=DEFAULT_COMPRESSION_CHUNK_SIZE_4MB
+):
+    """
+    Readable file-like object of `fileobj` decompressed as it is read.
+
+    :param content_encoding: "gzip", "zstd", or None or "identity" to read
+        `fileobj` unchanged.
+    """
+    if content_encoding in (None, "identity"):
+        return fileobj
+    if content_encoding == "gzip":
+        chunks = _decompress_gzip(fileobj, chunk_size)
+    elif content_encoding == "zstd":
+        zstandard = _import_zstandard()
+        chunks = _read_chunks(
+            zstandard.ZstdDecompressor().stream_reader(
+                fileobj, read_across_frames=True
+            ),
+            chunk_size,
+        )
+    else:
+        raise ValueError(f"Unsupported content encoding: {content_encoding}")
+    return IterableReader(chunks)
+
+
+def compress(data, content_encoding, level=None, threads=0):
+    return compressing_reader(
+        io.BytesIO(data), content_encoding, level=level, threads=threads
+    ).read()
+
+
+def decompress(data, content_encoding):
+    return decompressing_reader(io.BytesIO(data), content_encoding).read()
+
+
+def detect_content_encoding(data):
+    """
+    Content encoding of compressed bytes from their magic number, for stores
+    that don't keep `Content-Encoding` metadata.
+    """
+    if data.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if data.startswith(_ZSTD_MAGIC):
+        return "zstd"
+    return None
+
+
+def _compress_gzip(fileobj, level, chunk_size):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in _read_chunks(fileobj, chunk_size):
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _compress_gzip_parallel(fileobj, level, threads, chunk_size):
+    # zlib releases the GIL while compressing, so gzip members compress in
+    # parallel on threads. Only `2 * threads` chunks are held at once.
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        window = deque()
+        empty = True
+        for chunk in _read_chunks(fileobj, chunk_size):
+            empty = False
+            window.append(executor.submit(gzip.compress, chunk, level, mtime=0))
+            if len(window) >= 2 * threads:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+        if empty:
+            yield gzip.compress(b"", level, mtime=0)
+
+
+def _decompress_gzip(fileobj, chunk_size):
+    decompressor = zlib.decompressobj(31)
+    started = False
+    for chunk in _read_chunks(fileobj, chunk_size):
+        while chunk:
+            started = True
+            yield decompressor.decompress(chunk)
+            if decompressor.eof:
+                # concatenated gzip members, e.g. from parallel compression
+                chunk = decompressor.unused_data
+                decompressor = zlib.decompressobj(31)
+                started = False
+            else:
+                chunk = b""
+    if started:
+        raise EOFError("Compressed stream ended before the end-of-stream marker")
+
+
+def _read_chunks(fileobj, chunk_size):
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires zstandard, install pys3thon[zstd]"
+        ) from None
+    return zstandard
@@ -0,0 +1,229 @@
+import fcntl
+import hashlib
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from uuid import uuid4
+
+DEFAULT_MAX_SIZE_10GB = 10 * 1024 * 1024 * 1024
+
+
+class DownloadCache:
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE_10GB):
+        """
+        On-disk read-through cache of downloaded objects keyed by
+        (bucket, key, ETag).
+
+        Entries are evicted least recently used first once the cache grows
+        past `max_size` bytes. All mutations are guarded by file locks so the
+        same directory can be shared between processes. Cached files are
+        read-only and handed out as hardlinks, so they must not be modified
+        in place.
+
+        :param directory: Directory to keep cached objects in.
+        :param max_size: Maximum total size of cached objects in bytes.
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self._objects_directory = self.directory / "objects"
+        self._locks_directory = self.directory / "locks"
+        self._temporary_directory = self.directory / "tmp"
+        self._validators_directory = self.directory / "validators"
+        for directory in [
+            self._objects_directory,
+            self._locks_directory,
+            self._temporary_directory,
+            self._validators_directory,
+        ]:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def temporary_directory(self):
+        """
+        Temporary directory on the same filesystem as the cache, so entries can
+        be hardlinked into it instead of copied.
+        """
+        temp_directory = TemporaryDirectory(dir=self._temporary_directory)
+        try:
+            yield Path(temp_directory.name)
+        finally:
+            temp_directory.cleanup()
+
+    def link(self, bucket, key, etag, destination, download_fn):
+        """
+        Hardlink the cached copy of an object to `destination`, downloading it
+        with `download_fn(path)` first if it isn't cached yet.
+
+        :return: True if the object was served from the cache.
+        """
+        entry_path = self._entry_path(bucket, key, etag)
+        with self._lock(entry_path.name):
+            hit = entry_path.exists()
+            if hit:
+                # mtime tracks recency of use for LRU eviction
+                os.utime(entry_path)
+            else:
+                try:
+                    self._populate(entry_path, download_fn)
+                except Exception:
+                    self._lock_path(entry_path.name).unlink(missing_ok=True)
+                    raise
+            self._link_or_copy(entry_path, destination)
+            self._set_cached_etag(bucket, key, etag)
+
+        if not hit:
+            self.evict()
+        return hit
+
+    def contains(self, bucket, key, etag):
+        return self._entry_path(bucket, key, etag).exists()
+
+    def get_cached_etag(self, bucket, key):
+        """
+        ETag of the most recently linked version of an object, for use as an
+        If-None-Match validator, or None if that version is no longer cached.
+        """
+        try:
+            etag, _ = self._read_validator(self._validator_path(bucket, key))
+        except FileNotFoundError:
+            return None
+        if not self.contains(bucket, key, etag):
+            return None
+        return etag
+
+    def size(self):
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def evict(self):
+        """
+        Remove least recently used entries, and their lock files, until the
+        cache fits in `max_size`, then lock files and validators left without
+        an entry. Entries currently being linked by another thread or process
+        are skipped.
+        """
+        with self._lock(".evict"):
+            entries = []
+            for entry_path in self._entries():
+                try:
+                    stat = entry_path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, entry_path in sorted(entries, key=lambda entry: entry[0]):
+                if total_size <= self.max_size:
+                    break
+                if self._remove_entry(entry_path.name, blocking=False):
+                    total_size -= size
+
+            # e.g. of a process killed while downloading
+            for lock_path in self._locks_directory.glob("*.lock"):
+                name = lock_path.name[: -len(".lock")]
+                if not (self._objects_directory / name).exists():
+                    self._remove_entry(name, blocking=False)
+            self._remove_orphaned_validators()
+
+    def clear(self):
+        with self._lock(".evict"):
+            for entry_path in self._entries():
+                self._remove_entry(entry_path.name)
+            self._remove_orphaned_validators()
+
+    def _populate(self, entry_path, download_fn):
+        temp_path = self._temporary_directory / f"{entry_path.name}.{uuid4().hex[:8]}"
+        try:
+            download_fn(temp_path)
+            temp_path.chmod(0o444)
+            os.replace(temp_path, entry_path)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _remove_entry(self, name, blocking=True):
+        with self._lock(name, blocking=blocking) as acquired:
+            if not acquired:
+                return False
+            (self._objects_directory / name).unlink(missing_ok=True)
+            self._lock_path(name).unlink(missing_ok=True)
+            return True
+
+    def _set_cached_etag(self, bucket, key, etag):
+        validator_path = self._validator_path(bucket, key)
+        temp_path = (
+            self._temporary_directory / f"{validator_path.name}.{uuid4().hex[:8]}"
+        )
+        # the entry is recorded so the validator can be removed along with it
+        entry_name = self._entry_path(bucket, key, etag).name
+        temp_path.write_text(f"{etag}\n{entry_name}")
+        os.replace(temp_path, validator_path)
+
+    def _remove_orphaned_validators(self):
+        for validator_path in self._validators_directory.iterdir():
+            try:
+                _, entry_name = self._read_validator(validator_path)
+            except FileNotFoundError:
+                continue
+            if not entry_name or not (self._objects_directory / entry_name).exists():
+                validator_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _read_validator(validator_path):
+        """
+        :return: (etag, entry name) of a validator, entry name is "" for
+            validators written without one.
+        """
+        etag, _, entry_name = validator_path.read_text().partition("\n")
+        return etag, entry_name
+
+    def _entries(self):
+        return [entry for entry in self._objects_directory.iterdir() if entry.is_file()]
+
+    def _entry_path(self, bucket, key, etag):
+        digest = hashlib.sha256(f"{bucket}\0{key}\0{etag}".encode()).hexdigest()
+        return self._objects_directory / digest
+
+    def _validator_path(self, bucket, key):
+        digest = hashlib.sha256(f"{bucket}\0{key}".encode()).hexdigest()
+        return self._validators_directory / digest
+
+    @staticmethod
+    def _link_or_copy(source, destination):
+        try:
+            os.link(source, destination)
+        except OSError:
+            # cross-device or hardlinks unsupported by the filesystem
+            shutil.copyfile(source, destination)
+
+    def _lock_path(self, name):
+        return self._locks_directory / f"{name}.lock"
+
+    @contextmanager
+    def _lock(self, name, blocking=True):
+        lock_path = self._lock_path(name)
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        while True:
+            with open(lock_path, "a") as lock_file:
+                try:
+                    fcntl.flock(lock_file, flags)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    # the previous holder may have removed the lock file while
+                    # this one waited on it, lock the file now at its path
+                    if not _is_same_file(lock_file, lock_path):
+                        continue
+                    yield True
+                    return
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _is_same_file(file, path):
+    try:
+        return os.path.samestat(os.fstat(file.fileno()), os.stat(path))
+    except FileNotFoundError:
+        return False
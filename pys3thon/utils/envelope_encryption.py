@@ -0,0 +1,213 @@
+import base64
+import io
+import os
+import struct
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from .buffer import IterableReader
+from .cryptography import AES256GCM
+
+MAGIC = b"PYS3ENV1"
+DEFAULT_FRAME_SIZE_1MB = 1024 * 1024
+TAG_SIZE = 16
+HEADER_READ_SIZE = 1024
+# magic, frame size, length of the wrapped data key
+_HEADER_PREFIX = struct.Struct(">8sIH")
+_NONCE_PREFIX_SIZE = 8
+# frame index and whether it is the final frame, authenticated with each frame
+_FRAME_AAD = struct.Struct(">QB")
+_FRAME_INDEX = struct.Struct(">I")
+
+
+class EnvelopeEncryption:
+    def __init__(self, master_key, frame_size: int = DEFAULT_FRAME_SIZE_1MB):
+        """
+        Client-side envelope encryption of object bodies.
+
+        Every object is encrypted with its own random AES-256 data key, which is
+        wrapped with the AES256GCM master key and stored in the object header.
+        The body is split into frames of `frame_size` plaintext bytes, each
+        sealed with AES-GCM under a nonce derived from its index, so objects of
+        any size are encrypted and decrypted in constant memory and any byte
+        range can be decrypted from the frames covering it alone.
+
+        Layout: `MAGIC | frame size | wrapped key length | wrapped key | nonce
+        prefix` followed by frames of `ciphertext | tag`. The last frame is
+        authenticated as final so truncated objects fail to decrypt.
+
+        :param master_key: AES256GCM or 32-byte key used to wrap data keys.
+        :param frame_size: Plaintext bytes per frame.
+        """
+        if not isinstance(master_key, AES256GCM):
+            master_key = AES256GCM(master_key)
+        self.master_key = master_key
+        self.frame_size = frame_size
+
+    def encrypt(self, data: bytes) -> bytes:
+        encrypted = io.BytesIO()
+        self.encrypt_stream(io.BytesIO(data), encrypted)
+        return encrypted.getvalue()
+
+    def decrypt(self, data: bytes) -> bytes:
+        decrypted = io.BytesIO()
+        self.decrypt_stream(io.BytesIO(data), decrypted)
+        return decrypted.getvalue()
+
+    def encrypt_stream(self, src, dst) -> int:
+        """
+        Encrypt the readable binary file `src` into the writable `dst`.
+
+        :return: Number of encrypted bytes written.
+        """
+        written = 0
+        for chunk in self._encrypted_chunks(src):
+            dst.write(chunk)
+            written += len(chunk)
+        return written
+
+    def encrypting_reader(self, src) -> io.RawIOBase:
+        """
+        Readable file-like object of the encryption of `src`, e.g. to pass to
+        `S3Client.upload_fileobj`.
+        """
+        return IterableReader(self._encrypted_chunks(src))
+
+    def decrypt_stream(self, src, dst) -> int:
+        """
+        Decrypt the readable binary file `src` into the writable `dst`. Each
+        frame is authenticated before it is written.
+
+        :return: Number of plaintext bytes written.
+        """
+        header_size, frame_size, cipher, nonce_prefix = self._read_header(
+            lambda n: _read_exact(src, n)
+        )
+        written = 0
+        index = 0
+        frame = _read_exact(src, frame_size + TAG_SIZE)
+        while True:
+            next_frame = _read_exact(src, frame_size + TAG_SIZE)
+            final = not next_frame
+            plaintext = self._decrypt_frame(cipher, nonce_prefix, index, frame, final)
+            dst.write(plaintext)
+            written += len(plaintext)
+            if final:
+                return written
+            frame = next_frame
+            index += 1
+
+    def decrypt_range(self, read_range, object_size: int, offset: int, length: int):
+        """
+        Decrypt `length` plaintext bytes from `offset` reading only the header
+        and the frames covering the range.
+
+        :param read_range: Called as `read_range(offset, length)` to read bytes
+            of the encrypted object.
+        :param object_size: Size of the encrypted object.
+        """
+        header_size, frame_size, cipher, nonce_prefix = self._read_header_prefetched(
+            read_range
+        )
+        encrypted_frame_size = frame_size + TAG_SIZE
+        frames = max(-(-(object_size - header_size) // encrypted_frame_size), 1)
+        plaintext_size = object_size - header_size - frames * TAG_SIZE
+
+        end = min(offset + length, plaintext_size)
+        if length <= 0 or offset >= end:
+            return b""
+        first_frame = offset // frame_size
+        last_frame = (end - 1) // frame_size
+        start = header_size + first_frame * encrypted_frame_size
+        stop = min(header_size + (last_frame + 1) * encrypted_frame_size, object_size)
+        data = memoryview(read_range(start, stop - start))
+
+        plaintext = bytearray()
+        for index in range(first_frame, last_frame + 1):
+            frame_start = (index - first_frame) * encrypted_frame_size
+            frame_end = frame_start + encrypted_frame_size
+            plaintext += self._decrypt_frame(
+                cipher,
+                nonce_prefix,
+                index,
+                data[frame_start:frame_end],
+                final=index == frames - 1,
+            )
+        start = offset - first_frame * frame_size
+        stop = start + end - offset
+        return bytes(plaintext[start:stop])
+
+    def plaintext_size(self, read_range, object_size: int) -> int:
+        header_size, frame_size, _, _ = self._read_header_prefetched(read_range)
+        frames = max(-(-(object_size - header_size) // (frame_size + TAG_SIZE)), 1)
+        return object_size - header_size - frames * TAG_SIZE
+
+    def _encrypted_chunks(self, src):
+        data_key = AESGCM.generate_key(bit_length=256)
+        nonce_prefix = os.urandom(_NONCE_PREFIX_SIZE)
+        wrapped_key = self.master_key.encrypt(
+            base64.b64encode(data_key).decode()
+        ).encode()
+        yield _HEADER_PREFIX.pack(
+            MAGIC, self.frame_size, len(wrapped_key)
+        ) + wrapped_key + nonce_prefix
+
+        cipher = AESGCM(data_key)
+        index = 0
+        frame = _read_exact(src, self.frame_size)
+        while True:
+            # read one frame ahead to know whether this frame is the final one
+            next_frame = _read_exact(src, self.frame_size)
+            final = not next_frame
+            yield cipher.encrypt(
+                nonce_prefix + _FRAME_INDEX.pack(index),
+                frame,
+                _FRAME_AAD.pack(index, final),
+            )
+            if final:
+                return
+            frame = next_frame
+            index += 1
+
+    def _read_header(self, read):
+        header_prefix = read(_HEADER_PREFIX.size)
+        if len(header_prefix) < _HEADER_PREFIX.size:
+            raise ValueError("Not an envelope encrypted object")
+        magic, frame_size, wrapped_key_size = _HEADER_PREFIX.unpack(header_prefix)
+        if magic != MAGIC:
+            raise ValueError("Not an envelope encrypted object")
+        wrapped_key = read(wrapped_key_size)
+        nonce_prefix = read(_NONCE_PREFIX_SIZE)
+        data_key = base64.b64decode(self.master_key.decrypt(wrapped_key.decode()))
+        header_size = _HEADER_PREFIX.size + wrapped_key_size + _NONCE_PREFIX_SIZE
+        return header_size, frame_size, AESGCM(data_key), nonce_prefix
+
+    def _read_header_prefetched(self, read_range):
+        # the header is a little over 100 bytes, so one small read covers it
+        header_file = io.BytesIO(read_range(0, HEADER_READ_SIZE))
+        return self._read_header(lambda n: _read_exact(header_file, n))
+
+    @staticmethod
+    def _decrypt_frame(cipher, nonce_prefix, index, frame, final):
+        try:
+            return cipher.decrypt(
+                nonce_prefix + _FRAME_INDEX.pack(index),
+                bytes(frame),
+                _FRAME_AAD.pack(index, final),
+            )
+        except InvalidTag:
+            raise ValueError(
+                f"Decryption failed for frame {index}, the object is corrupt or truncated"
+            ) from None
+
+
+def _read_exact(f, n):
+    chunks = []
+    while n > 0:
+        chunk = f.read(n)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
@@ -0,0 +1,8 @@
+def relative_key(key, prefix):
+    """
+    Part of an object key after `prefix`, without leading slashes, used as
+    the relative path of the object below a local directory or in an archive.
+    """
+    if prefix:
+        key = key.removeprefix(prefix)
+    return key.lstrip("/")
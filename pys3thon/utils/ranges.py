@@ -0,0 +1,71 @@
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_COALESCE_GAP_1MB = 1024 * 1024
+DEFAULT_MAX_COALESCED_SIZE_64MB = 64 * 1024 * 1024
+DEFAULT_RANGE_CONCURRENCY = 10
+
+
+def coalesce_ranges(
+    ranges, max_gap=DEFAULT_COALESCE_GAP_1MB, max_size=DEFAULT_MAX_COALESCED_SIZE_64MB
+):
+    """
+    Merge byte ranges that overlap or are separated by at most `max_gap` bytes.
+
+    :param ranges: Iterable of (offset, length) tuples.
+    :param max_gap: Largest gap in bytes that is read and discarded to save a
+        request.
+    :param max_size: Ranges are not merged past this many bytes.
+    :return: Sorted list of merged (start, end) tuples, end exclusive.
+    """
+    merged = []
+    for offset, length in sorted(ranges):
+        if length <= 0:
+            continue
+        end = offset + length
+        if merged:
+            merged_start, merged_end = merged[-1]
+            if (
+                offset - merged_end <= max_gap
+                and max(end, merged_end) - merged_start <= max_size
+            ):
+                merged[-1] = (merged_start, max(end, merged_end))
+                continue
+        merged.append((offset, end))
+    return merged
+
+
+def read_coalesced_ranges(
+    ranges,
+    read_fn,
+    max_gap=DEFAULT_COALESCE_GAP_1MB,
+    max_size=DEFAULT_MAX_COALESCED_SIZE_64MB,
+    max_concurrency=DEFAULT_RANGE_CONCURRENCY,
+):
+    """
+    Read many byte ranges with as few, concurrently issued, reads as possible.
+
+    :param ranges: List of (offset, length) tuples.
+    :param read_fn: Called as `read_fn(offset, length)` for each merged range
+        and returns its bytes.
+    :return: List of bytes, one per requested range, in request order.
+    """
+    ranges = list(ranges)
+    merged = coalesce_ranges(ranges, max_gap=max_gap, max_size=max_size)
+    merged_ranges = [(start, end - start) for start, end in merged]
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        merged_data = list(
+            executor.map(lambda merged_range: read_fn(*merged_range), merged_ranges)
+        )
+
+    starts = [start for start, _ in merged]
+    results = []
+    for offset, length in ranges:
+        if length <= 0:
+            results.append(b"")
+            continue
+        index = bisect_right(starts, offset) - 1
+        start = offset - starts[index]
+        end = start + length
+        results.append(bytes(merged_data[index][start:end]))
+    return results
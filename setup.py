@@ -13,11 +13,12 @@ setup(
         "boto3>=1.24.89",
         "tqdm>=4.64.0",
         "pyOpenSSL==22.1.0",
-        "opendal>=0.45.2",
+        "opendal>=0.47.0",
         "smart_open==7.1.0",
         "asgiref==3.8.1",
     ],
     extras_require={
+        "zstd": ["zstandard>=0.22.0"],
         "dev": [
             "pytest==7.1.3",
             "pytest-mock==3.10.0",
@@ -31,6 +32,7 @@ setup(
             "pre-commit==2.20.0",
             "click==8.1.3",
             "python-dotenv==1.0.1",
+            "zstandard>=0.22.0",
         ]
     },
 )
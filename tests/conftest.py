@@ -4,6 +4,13 @@ import pytest
 from dotenv import find_dotenv, load_dotenv
 from opendal import Operator
 
+from pys3thon.opendal.shared import OpenDALClient
+
+
+class FSOpenDALClient(OpenDALClient):
+    def __init__(self, root):
+        self.operator = Operator("fs", root=str(root))
+
 
 @pytest.fixture(scope="session", autouse=True)
 def load_env():
@@ -119,3 +126,8 @@ def opendal_operators(opendal_remote_configs):
             "azblob": Operator(**opendal_remote_configs["azblob"]),
             "dropbox": Operator(**opendal_remote_configs["dropbox"]),
         }
+
+
+@pytest.fixture
+def fs_opendal_client(tmpdir):
+    return FSOpenDALClient(tmpdir)
@@ -1,8 +1,11 @@
 import os
 import time
+from uuid import uuid4
 
+import boto3
 import pytest
 import requests
+from moto import mock_aws
 
 from pys3thon.opendal.s3.client import OpenDALS3Client
 from pys3thon.opendal.s3.descriptor import S3StorageDescriptor
@@ -45,6 +48,43 @@ def test_create_opendal_s3_client_from_s3_unencrypted_descriptor():
     assert client.secret_access_key == "test-secret"
 
 
+@mock_aws
+def test_write_bytearray_and_read():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    path = f"{str(uuid4())}/file.txt"
+
+    client.write(path, bytearray(b"Hello, world!"))
+
+    assert client.read(path) == b"Hello, world!"
+
+
+@mock_aws
+def test_open_for_writing_text_aborts_on_exception():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    path = f"{str(uuid4())}/file.txt"
+
+    with pytest.raises(RuntimeError):
+        with client.open(path, "w") as writer:
+            writer.write("Hello, ")
+            raise RuntimeError("source read failed")
+
+    assert not client.operator.check_if_exists_in_s3("test-bucket", path)
+
+    with client.open(path, "w") as writer:
+        writer.write("Hello, world!")
+    assert client.read(path) == b"Hello, world!"
+
+
 @pytest.mark.skipif(
     os.environ.get("TEST_ENV") != "remote", reason="requires TEST_ENV=remote"
 )
@@ -138,3 +178,102 @@ def test_delete(tmpdir, opendal_operators, opendal_remote_configs):
     # Verify file no longer exists by checking if read raises an exception
     with pytest.raises(Exception):
         client.read(descriptor.path)
+
+
+@mock_aws
+def test_write_compressed_and_read_decompressed():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    content = b"compressible " * 1000
+
+    client.write("file.txt", content, content_encoding="gzip")
+
+    assert client.stat("file.txt").content_encoding == "gzip"
+    assert client.stat("file.txt").content_length < len(content) / 10
+    assert client.read("file.txt", decompress=True) == content
+
+
+@mock_aws
+def test_read_many():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    prefix = str(uuid4())
+    contents = {f"{prefix}/file_{i}.bin": os.urandom(100 * i) for i in range(30)}
+    for path, content in contents.items():
+        client.write(path, content)
+
+    assert list(client.read_many(contents, concurrency=5)) == list(contents.items())
+    assert dict(client.read_many(contents, ordered=False)) == contents
+
+
+@mock_aws
+def test_write_many():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    prefix = str(uuid4())
+    items = [(f"{prefix}/file_{i}.bin", os.urandom(100 * i)) for i in range(30)]
+    items.append((f"{prefix}/large.bin", os.urandom(11 * 1024 * 1024)))
+
+    result = client.write_many(
+        items, multipart_threshold=5 * 1024 * 1024, part_size=5 * 1024 * 1024
+    )
+
+    assert result.succeeded
+    assert result.bytes_written == sum(len(data) for _, data in items)
+    assert dict(client.read_many(path for path, _ in items)) == dict(items)
+    assert client.stat(f"{prefix}/large.bin").etag.endswith('-3"')
+
+
+@mock_aws
+def test_delete_many():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    prefix = str(uuid4())
+    paths = [f"{prefix}/file_{i}.txt" for i in range(1500)]
+    client.write_many((path, b"data") for path in paths)
+
+    result = client.delete_many(paths, verify=True)
+
+    assert result.succeeded
+    assert sorted(result.results) == sorted(paths)
+    assert list(conn.Bucket("test-bucket").objects.filter(Prefix=prefix)) == []
+
+
+@mock_aws
+def test_delete_many_reports_per_key_errors(mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    mocker.patch.object(
+        client.operator.client,
+        "delete_objects",
+        return_value={
+            "Errors": [
+                {"Key": "locked.txt", "Code": "AccessDenied", "Message": "Denied"}
+            ]
+        },
+    )
+
+    result = client.delete_many(["deleted.txt", "locked.txt"])
+
+    assert list(result.results) == ["deleted.txt"]
+    assert result.failed["locked.txt"].code == "AccessDenied"
@@ -0,0 +1,70 @@
+import gzip
+import io
+
+import pytest
+
+from pys3thon.opendal.s3.descriptor import S3DescriptorInterner, S3StorageDescriptor
+from pys3thon.opendal.s3.manifest import read_manifest, write_manifest
+
+
+def test_manifest_round_trip():
+    interner = S3DescriptorInterner()
+    descriptors = [
+        interner.descriptor(
+            f"bucket-{i % 2}",
+            f"dataset/file_{i}.txt",
+            f"access-{i % 3}",
+            encrypted_aws_secret_access_key=f"secret-{i % 3}",
+            region="ap-southeast-2",
+            endpoint="http://localhost:9000" if i % 2 else None,
+        )
+        for i in range(100)
+    ]
+    manifest = io.BytesIO()
+
+    assert write_manifest(descriptors, manifest) == 100
+    manifest.seek(0)
+    loaded = list(read_manifest(manifest))
+
+    assert loaded == descriptors
+    assert len({id(descriptor.credentials) for descriptor in loaded}) == 3
+
+
+def test_manifest_stores_each_location_once():
+    descriptors = [
+        S3StorageDescriptor(
+            path=f"file_{i}.txt",
+            bucket="test-bucket",
+            aws_access_key_id="test-access",
+            encrypted_aws_secret_access_key="test-secret",
+            region="test-region",
+        )
+        for i in range(3)
+    ]
+    manifest = io.BytesIO()
+    write_manifest(descriptors, manifest)
+
+    assert gzip.decompress(manifest.getvalue()).decode().splitlines() == [
+        '{"version":1}',
+        '["c","test-access","test-secret"]',
+        '["l","test-bucket","test-region",null,0]',
+        '[0,"file_0.txt"]',
+        '[0,"file_1.txt"]',
+        '[0,"file_2.txt"]',
+    ]
+
+
+def test_manifest_never_writes_plaintext_secrets():
+    descriptor = S3DescriptorInterner().descriptor(
+        "test-bucket", "file.txt", "test-access", aws_secret_access_key="plaintext"
+    )
+
+    with pytest.raises(ValueError):
+        write_manifest([descriptor], io.BytesIO())
+
+
+def test_read_manifest_unsupported_version():
+    manifest = io.BytesIO(gzip.compress(b'{"version":2}\n'))
+
+    with pytest.raises(ValueError):
+        list(read_manifest(manifest))
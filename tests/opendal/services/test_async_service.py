@@ -0,0 +1,238 @@
+import asyncio
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import boto3
+import pytest
+from moto import mock_aws
+from opendal import Operator
+
+from pys3thon.opendal.async_service import AsyncOpenDALService
+from pys3thon.opendal.s3.client import OpenDALS3Client
+from pys3thon.utils import DownloadCache
+
+
+def test_async_copy_between_operators(tmpdir):
+    tmpdir = Path(tmpdir)
+    source = Operator("fs", root=str(tmpdir / "source"))
+    destination = Operator("fs", root=str(tmpdir / "destination"))
+    content = os.urandom(3 * 1024 * 1024 + 17)
+    source.write("file.bin", content)
+
+    asyncio.run(
+        AsyncOpenDALService().copy(
+            source,
+            "file.bin",
+            destination,
+            "copied/file.bin",
+            read_chunk_size=1024 * 1024,
+        )
+    )
+
+    assert bytes(destination.read("copied/file.bin")) == content
+
+
+def test_async_copy_empty_file(tmpdir):
+    operator = Operator("fs", root=str(tmpdir))
+    operator.write("empty.bin", b"")
+
+    asyncio.run(AsyncOpenDALService().copy(operator, "empty.bin", operator, "copy.bin"))
+
+    assert bytes(operator.read("copy.bin")) == b""
+
+
+def test_async_copy_many_limits_concurrency(tmpdir, mocker):
+    operator = Operator("fs", root=str(tmpdir))
+    running = 0
+    peak = 0
+
+    async def copy(*args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    mocker.patch.object(AsyncOpenDALService, "_copy", side_effect=copy)
+    copies = [(operator, f"{i}.bin", operator, f"{i}.copy") for i in range(10)]
+
+    result = asyncio.run(AsyncOpenDALService(max_concurrency=3).copy_many(copies))
+
+    assert result.succeeded
+    assert len(result.results) == 10
+    assert peak == 3
+
+
+def test_async_copy_many_reports_failures(tmpdir):
+    operator = Operator("fs", root=str(tmpdir))
+    operator.write("exists.bin", b"Hello, world!")
+    copies = [
+        (operator, "exists.bin", operator, "exists.copy"),
+        (operator, "missing.bin", operator, "missing.copy"),
+    ]
+
+    result = asyncio.run(AsyncOpenDALService().copy_many(copies))
+
+    assert list(result.results) == [copies[0]]
+    assert list(result.failed) == [copies[1]]
+    assert bytes(operator.read("exists.copy")) == b"Hello, world!"
+
+
+def test_async_copy_many_reuses_service_across_event_loops(tmpdir):
+    operator = Operator("fs", root=str(tmpdir))
+    operator.write("file.bin", b"Hello, world!")
+    service = AsyncOpenDALService(max_concurrency=1)
+
+    for run in range(2):
+        copies = [(operator, "file.bin", operator, f"{run}_{i}.copy") for i in range(4)]
+        result = asyncio.run(service.copy_many(copies))
+        assert result.succeeded
+
+
+class FailingSource:
+    def __init__(self, size):
+        self.size = size
+
+    def stat(self, path):
+        return self
+
+    @property
+    def content_length(self):
+        return self.size
+
+    def open(self, path, mode):
+        source = self
+
+        class File:
+            reads = 0
+
+            def read(self, size):
+                self.reads += 1
+                if self.reads > 1:
+                    raise IOError("read failed")
+                return b"x" * min(size, source.size)
+
+            def close(self):
+                pass
+
+        return File()
+
+
+def test_async_copy_failure_leaves_no_destination_object(tmpdir):
+    destination = Operator("fs", root=str(tmpdir))
+
+    with pytest.raises(IOError, match="read failed"):
+        asyncio.run(
+            AsyncOpenDALService().copy(
+                FailingSource(3 * 1024 * 1024),
+                "file.bin",
+                destination,
+                "file.bin",
+                read_chunk_size=1024 * 1024,
+            )
+        )
+    assert not destination.exists("file.bin")
+
+
+@mock_aws
+def test_async_copy_failure_aborts_s3_destination():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+
+    with pytest.raises(IOError, match="read failed"):
+        asyncio.run(
+            AsyncOpenDALService().copy(
+                FailingSource(24 * 1024 * 1024),
+                "file.bin",
+                client,
+                "file.bin",
+                read_chunk_size=8 * 1024 * 1024,
+            )
+        )
+    s3 = boto3.client("s3", region_name="ap-southeast-2")
+    assert "Contents" not in s3.list_objects_v2(Bucket="test-bucket")
+    assert "Uploads" not in s3.list_multipart_uploads(Bucket="test-bucket")
+
+
+@mock_aws
+def test_async_download_to_temporary_file_from_opendal_s3_client():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    paths = [f"{str(uuid4())}/file_{i}.txt" for i in range(4)]
+    for i, path in enumerate(paths):
+        client.write(path, f"file {i}".encode())
+
+    async def download(path):
+        service = AsyncOpenDALService(max_concurrency=2)
+        async with service.download_to_temporary_file(client, path) as download_path:
+            assert Path(download_path).name == path.split("/")[-1]
+            content = Path(download_path).read_bytes()
+        assert Path(download_path).exists() is False
+        return content
+
+    async def main():
+        return await asyncio.gather(*(download(path) for path in paths))
+
+    assert asyncio.run(main()) == [f"file {i}".encode() for i in range(4)]
+
+
+@mock_aws
+def test_async_download_to_temporary_file_with_download_cache(tmpdir, mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    path = f"{str(uuid4())}/file.txt"
+    client.write(path, b"Hello, world!")
+
+    service = AsyncOpenDALService(download_cache=DownloadCache(Path(tmpdir) / "cache"))
+    download = mocker.spy(service, "download")
+
+    async def main():
+        for _ in range(2):
+            async with service.download_to_temporary_file(
+                client, path
+            ) as download_path:
+                assert Path(download_path).read_bytes() == b"Hello, world!"
+            assert Path(download_path).exists() is False
+
+    asyncio.run(main())
+    assert download.call_count == 1
+
+
+@mock_aws
+def test_async_download_to_temporary_file_with_download_cache_pins_etag(tmpdir, mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    path = f"{str(uuid4())}/file.txt"
+    client.write(path, b"Hello, world!")
+    stale_stat = client.stat(path)
+    # overwritten between the stat and the download
+    client.write(path, b"Goodbye, world!")
+    mocker.patch.object(client, "stat", return_value=stale_stat)
+
+    download_cache = DownloadCache(Path(tmpdir) / "cache")
+    service = AsyncOpenDALService(download_cache=download_cache)
+
+    async def main():
+        async with service.download_to_temporary_file(client, path):
+            pass
+
+    with pytest.raises(OSError, match="PreconditionFailed"):
+        asyncio.run(main())
+    assert not download_cache.contains("test-bucket", path, stale_stat.etag)
@@ -0,0 +1,115 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from opendal import Operator
+
+from pys3thon.opendal.operator_cache import OperatorCache
+from pys3thon.opendal.service import OpenDALService
+
+OPERATOR_LOOKUPS = 500
+
+
+def test_operator_cache_reuses_operators_per_config(tmpdir):
+    cache = OperatorCache()
+
+    operator = cache.get("fs", root=str(tmpdir))
+
+    assert cache.get("fs", root=str(tmpdir)) is operator
+    assert cache.get("fs", root="/") is not operator
+    assert cache.get_async("fs", root=str(tmpdir)) is not operator
+    assert len(cache) == 3
+
+
+def test_operator_cache_evicts_least_recently_used(tmpdir):
+    cache = OperatorCache(max_size=2)
+    first = cache.get("fs", root=str(tmpdir / "first"))
+    cache.get("fs", root=str(tmpdir / "second"))
+
+    # using the first operator makes the second the least recently used
+    assert cache.get("fs", root=str(tmpdir / "first")) is first
+    cache.get("fs", root=str(tmpdir / "third"))
+
+    assert len(cache) == 2
+    assert cache.get("fs", root=str(tmpdir / "first")) is first
+
+
+def test_operator_cache_is_thread_safe(tmpdir):
+    cache = OperatorCache()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        operators = list(
+            executor.map(lambda _: cache.get("fs", root=str(tmpdir)), range(64))
+        )
+
+    assert all(operator is operators[0] for operator in operators)
+
+
+def test_service_download_reuses_fs_operator(tmpdir, mocker):
+    tmpdir = Path(tmpdir)
+    source = Operator("fs", root=str(tmpdir / "source"))
+    source.write("file.txt", b"Hello, world!")
+    service = OpenDALService()
+    get = mocker.spy(service.operator_cache, "get")
+
+    for i in range(3):
+        service.download(source, "file.txt", tmpdir / f"file_{i}.txt")
+
+    assert (tmpdir / "file_2.txt").read_bytes() == b"Hello, world!"
+    assert get.call_count == 3
+    assert len(service.operator_cache) == 1
+
+
+@pytest.mark.parametrize(
+    "scheme, config",
+    [
+        ("fs", {"root": "/"}),
+        ("s3", {"bucket": "test-bucket", "region": "ap-southeast-2"}),
+    ],
+)
+def test_operator_cache_constructs_each_operator_once(scheme, config, mocker):
+    # a cached operator is not rebuilt per lookup, and unlike a new operator
+    # it keeps its pooled connections
+    operator_class = mocker.patch("opendal.Operator", side_effect=Operator)
+    operator_class.__name__ = "Operator"
+    cache = OperatorCache()
+
+    operators = [cache.get(scheme, **config) for _ in range(OPERATOR_LOOKUPS)]
+
+    assert all(operator is operators[0] for operator in operators)
+    assert operator_class.call_count == 1
+
+
+@pytest.mark.skipif(
+    os.environ.get("BENCHMARK") != "1", reason="benchmark, requires BENCHMARK=1"
+)
+@pytest.mark.parametrize(
+    "scheme, config",
+    [
+        ("fs", {"root": "/"}),
+        ("s3", {"bucket": "test-bucket", "region": "ap-southeast-2"}),
+    ],
+)
+def test_benchmark_operator_construction_overhead(scheme, config):
+    # reported rather than asserted, wall-clock timings are too noisy to fail
+    # a build on; run with `BENCHMARK=1 pytest -s`
+    cache = OperatorCache()
+    construction = _best_time(lambda: Operator(scheme, **config))
+    lookup = _best_time(lambda: cache.get(scheme, **config))
+
+    print(
+        f"\n{scheme} operator: {construction * 1e6:.1f}us to construct, "
+        f"{lookup * 1e6:.1f}us from the cache"
+    )
+
+
+def _best_time(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(OPERATOR_LOOKUPS):
+            fn()
+        times.append((time.perf_counter() - start) / OPERATOR_LOOKUPS)
+    return min(times)
@@ -1,11 +1,18 @@
 import os
 import time
+from pathlib import Path
+from uuid import uuid4
 
+import boto3
 import pytest
+from moto import mock_aws
 
+from pys3thon.opendal.s3.client import OpenDALS3Client
 from pys3thon.opendal.s3.descriptor import S3StorageDescriptor
 from pys3thon.opendal.service import OpenDALService
 from pys3thon.opendal.shared import OpenDALClient
+from pys3thon.s3.checksums import ChecksumMismatchError
+from pys3thon.utils import DownloadCache
 
 
 @pytest.mark.skipif(
@@ -327,3 +334,179 @@ def test_download_nonexistent_file(tmpdir, opendal_operators, opendal_remote_con
     download_path = str(tmpdir / "should_not_exist.txt")
     with pytest.raises(Exception):  # Replace with specific exception if known
         service.download(client, descriptor.path, download_path)
+
+
+@mock_aws
+def test_download_to_temporary_file_with_download_cache(tmpdir, mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    path = f"{str(uuid4())}/file.txt"
+    client.write(path, b"Hello, world!")
+
+    service = OpenDALService(download_cache=DownloadCache(Path(tmpdir) / "cache"))
+    download = mocker.spy(service, "download")
+
+    for _ in range(2):
+        with service.download_to_temporary_file(client, path) as download_path:
+            assert Path(download_path).name == "file.txt"
+            assert Path(download_path).read_bytes() == b"Hello, world!"
+        assert Path(download_path).exists() is False
+    assert download.call_count == 1
+
+
+@mock_aws
+def test_download_to_temporary_file_with_download_cache_pins_etag(tmpdir, mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    path = f"{str(uuid4())}/file.txt"
+    client.write(path, b"Hello, world!")
+    stale_stat = client.stat(path)
+    # overwritten between the stat and the download
+    client.write(path, b"Goodbye, world!")
+    mocker.patch.object(client, "stat", return_value=stale_stat)
+
+    download_cache = DownloadCache(Path(tmpdir) / "cache")
+    service = OpenDALService(download_cache=download_cache)
+    with pytest.raises(OSError, match="PreconditionFailed"):
+        with service.download_to_temporary_file(client, path):
+            pass
+
+    assert not download_cache.contains("test-bucket", path, stale_stat.etag)
+
+
+@mock_aws
+def test_opendal_s3_client_open_for_writing_and_service_copy():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    source_path = f"{str(uuid4())}/source_file.bin"
+    destination_path = f"{str(uuid4())}/destination_file.bin"
+    content = os.urandom(11 * 1024 * 1024)
+
+    with client.open(source_path, "wb", part_size=5 * 1024 * 1024) as writer:
+        writer.write(content)
+
+    OpenDALService().copy(
+        client,
+        source_path,
+        client,
+        destination_path,
+        read_chunk_size=2 * 1024 * 1024,
+    )
+
+    assert client.read(destination_path) == content
+
+
+@mock_aws
+def test_service_copy_verify_etag():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    source_path = f"{str(uuid4())}/source_file.bin"
+    destination_path = f"{str(uuid4())}/destination_file.bin"
+    content = os.urandom(11 * 1024 * 1024)
+
+    with client.open(source_path, "wb", part_size=5 * 1024 * 1024) as writer:
+        writer.write(content)
+
+    OpenDALService().copy(
+        client,
+        source_path,
+        client,
+        destination_path,
+        read_chunk_size=2 * 1024 * 1024,
+        verify_etag=True,
+        etag_part_size=5 * 1024 * 1024,
+    )
+
+    assert client.read(destination_path) == content
+
+
+@mock_aws
+def test_service_copy_verify_etag_with_other_part_size():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    source_path = f"{str(uuid4())}/source_file.bin"
+    destination_path = f"{str(uuid4())}/destination_file.bin"
+    content = os.urandom(10 * 1024 * 1024)
+
+    # 2 parts of 6MB, the same part count as the default 8MB parts
+    with client.open(source_path, "wb", part_size=6 * 1024 * 1024) as writer:
+        writer.write(content)
+
+    OpenDALService().copy(
+        client,
+        source_path,
+        client,
+        destination_path,
+        read_chunk_size=2 * 1024 * 1024,
+        verify_etag=True,
+    )
+
+    assert client.read(destination_path) == content
+
+
+@mock_aws
+def test_service_copy_verify_etag_skips_other_storage(
+    fs_opendal_client, tmpdir, mocker
+):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    source_path = f"{str(uuid4())}/source_file.txt"
+    client.write(source_path, b"Hello, world!")
+
+    # an Azure Blob style ETag, which isn't the MD5 of the data
+    stat = mocker.Mock(content_length=13, etag='"0x8DBF0A5C3F2A1B4"')
+    mocker.patch.object(fs_opendal_client, "stat", return_value=stat)
+
+    OpenDALService().copy(
+        client, source_path, fs_opendal_client, "dst.txt", verify_etag=True
+    )
+
+    assert (Path(tmpdir) / "dst.txt").read_bytes() == b"Hello, world!"
+
+
+@mock_aws
+def test_service_copy_verify_etag_mismatch(mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    source_path = f"{str(uuid4())}/source_file.txt"
+    client.write(source_path, b"Hello, world!")
+
+    stat = client.stat(source_path)
+    mocker.patch.object(
+        client.operator,
+        "head_object",
+        return_value={**stat.stat, "ETag": '"00000000000000000000000000000000"'},
+    )
+
+    with pytest.raises(ChecksumMismatchError):
+        OpenDALService().copy(
+            client, source_path, client, f"{str(uuid4())}/dst.txt", verify_etag=True
+        )
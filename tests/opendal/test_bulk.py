@@ -0,0 +1,62 @@
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from threading import Lock
+
+import pytest
+
+from pys3thon.opendal.bulk import iter_reads
+
+
+def test_iter_reads_limits_concurrency_and_buffered_bytes():
+    running = 0
+    peak = 0
+    started = []
+    lock = Lock()
+
+    def read(path):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+            started.append(path)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return b"x" * 10
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        reads = iter_reads(
+            range(20),
+            lambda path: executor.submit(read, path),
+            concurrency=4,
+            ordered=True,
+            max_bytes_in_flight=25,
+        )
+        first = next(reads)
+        time.sleep(0.05)
+        # reads only start while the consumer pulls results, so at most the
+        # 4 running reads and the 3 reads filling the byte budget have started
+        assert len(started) <= 7
+        results = [first, *reads]
+
+    assert [path for path, _ in results] == list(range(20))
+    assert peak <= 4
+
+
+def test_iter_reads_raises_cancelled_read_in_turn():
+    def submit_read(path):
+        future = Future()
+        if path == 1:
+            future.cancel()
+            future.set_running_or_notify_cancel()
+        else:
+            future.set_result(b"x")
+        return future
+
+    reads = iter_reads(
+        range(3), submit_read, concurrency=4, ordered=True, max_bytes_in_flight=100
+    )
+
+    assert next(reads) == (0, b"x")
+    with pytest.raises(CancelledError):
+        next(reads)
@@ -0,0 +1,23 @@
+import os
+from pathlib import Path
+
+from pys3thon.opendal.encrypted_client import EncryptedOpenDALClient
+from pys3thon.utils import EnvelopeEncryption
+
+
+def test_write_and_read_encrypted(fs_opendal_client, tmpdir):
+    client = fs_opendal_client
+    encrypted_client = EncryptedOpenDALClient(
+        client, EnvelopeEncryption(os.urandom(32), frame_size=1024)
+    )
+    data = os.urandom(5000)
+
+    encrypted_client.write("file.bin", data)
+
+    assert data[:64] not in bytes(client.read("file.bin"))
+    assert encrypted_client.read("file.bin") == data
+    assert encrypted_client.read_range("file.bin", 1000, 100) == data[1000:1100]
+
+    local_path = Path(tmpdir) / "downloaded.bin"
+    encrypted_client.download("file.bin", local_path)
+    assert local_path.read_bytes() == data
@@ -0,0 +1,69 @@
+import os
+from array import array
+from uuid import uuid4
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from pys3thon.opendal.pack import PackReader, PackWriter
+from pys3thon.opendal.s3.client import OpenDALS3Client
+
+
+def test_write_and_read_pack(fs_opendal_client):
+    client = fs_opendal_client
+    blobs = {f"files/{i}.json": os.urandom(i * 10) for i in range(50)}
+
+    with PackWriter(client, "dataset", pack_size=1024) as writer:
+        for path, data in blobs.items():
+            writer.add(path, data)
+
+    reader = PackReader(client, "dataset")
+    assert len(reader) == len(blobs)
+    assert set(reader) == set(blobs)
+    for path, data in blobs.items():
+        assert reader.read(path) == data
+    assert "files/missing.json" not in reader
+    with pytest.raises(FileNotFoundError):
+        reader.read("files/missing.json")
+
+    pack_names = sorted(entry.path for entry in client.operator.list("dataset/"))
+    assert "dataset/index.json.gz" in pack_names
+    assert len(pack_names) > 2
+
+
+def test_write_pack_from_buffers(fs_opendal_client):
+    client = fs_opendal_client
+    floats = array("d", [1.5, 2.5, 3.5])
+
+    with PackWriter(client, "dataset") as writer:
+        writer.add("floats.bin", memoryview(floats))
+        writer.add("bytes.bin", bytearray(b"Hello, world!"))
+
+    reader = PackReader(client, "dataset")
+    assert reader.read("floats.bin") == floats.tobytes()
+    assert reader.read("bytes.bin") == b"Hello, world!"
+
+
+@mock_aws
+def test_write_and_read_pack_on_s3(mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    prefix = str(uuid4())
+    blobs = {f"files/{i}.txt": f"file {i}".encode() for i in range(100)}
+
+    with PackWriter(client, prefix) as writer:
+        for path, data in blobs.items():
+            writer.add(path, data)
+
+    keys = client.operator.get_s3_keys("test-bucket", prefix)
+    assert sorted(keys) == [f"{prefix}/index.json.gz", f"{prefix}/pack-00000.bin"]
+
+    reader = PackReader(client, prefix)
+    get_object = mocker.spy(client.operator.client, "get_object")
+    assert reader.read("files/42.txt") == b"file 42"
+    assert get_object.call_count == 1
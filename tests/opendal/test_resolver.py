@@ -0,0 +1,92 @@
+from uuid import uuid4
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from pys3thon.opendal.resolver import DescriptorResolver
+from pys3thon.opendal.s3.client import OpenDALS3Client
+
+
+def _json_descriptor(bucket, key, access_key_id="test-access", region="ap-southeast-2"):
+    return {
+        "scheme": "S3",
+        "bucket": bucket,
+        "key": key,
+        "awsAccessKeyId": access_key_id,
+        "encryptedAwsSecretAccessKey": f"encrypted-{access_key_id}",
+        "region": region,
+    }
+
+
+def test_resolve_many_dedupes_clients_and_secrets(mocker):
+    decrypt_fn = mocker.Mock(
+        side_effect=lambda secret: secret.replace("encrypted-", "")
+    )
+    resolver = DescriptorResolver(decrypt_fn)
+    json_descriptors = [
+        _json_descriptor("bucket-a", f"file_{i}.txt") for i in range(100)
+    ] + [
+        _json_descriptor("bucket-b", "other.txt"),
+        _json_descriptor("bucket-a", "second.txt", access_key_id="second-access"),
+    ]
+
+    resolved = resolver.resolve_many(json_descriptors)
+
+    assert [path for _, path in resolved] == [d["key"] for d in json_descriptors]
+    clients = {id(client): client for client, _ in resolved}
+    assert len(clients) == 3
+    assert all(isinstance(client, OpenDALS3Client) for client in clients.values())
+    assert decrypt_fn.call_count == 2
+
+    first_client = resolved[0][0]
+    assert first_client.bucket == "bucket-a"
+    assert first_client.secret_access_key == "test-access"
+    # buckets with the same credentials share one S3Client
+    assert resolved[100][0].operator is first_client.operator
+    assert resolved[101][0].operator is not first_client.operator
+
+    # later calls reuse pooled clients and decrypted secrets
+    client, path = resolver.resolve(_json_descriptor("bucket-a", "later.txt"))
+    assert client is first_client
+    assert path == "later.txt"
+    assert decrypt_fn.call_count == 2
+
+
+def test_resolver_evicts_least_recently_used_clients(mocker):
+    resolver = DescriptorResolver(lambda secret: secret, max_clients=2)
+
+    first, _ = resolver.resolve(_json_descriptor("bucket-a", "a.txt"))
+    resolver.resolve(_json_descriptor("bucket-b", "b.txt"))
+    resolver.resolve(_json_descriptor("bucket-c", "c.txt"))
+
+    client, _ = resolver.resolve(_json_descriptor("bucket-a", "a.txt"))
+    assert client is not first
+
+
+def test_resolve_unsupported_scheme():
+    resolver = DescriptorResolver(lambda secret: secret)
+
+    with pytest.raises(ValueError):
+        resolver.resolve({"scheme": "Dropbox", "key": "file.txt"})
+
+
+@mock_aws
+def test_resolved_clients_read_objects():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    prefix = str(uuid4())
+    for i in range(3):
+        conn.Object("test-bucket", f"{prefix}/file_{i}.txt").put(Body=f"file {i}")
+
+    resolver = DescriptorResolver(lambda secret: secret.replace("encrypted-", ""))
+    resolved = resolver.resolve_many(
+        [_json_descriptor("test-bucket", f"{prefix}/file_{i}.txt") for i in range(3)]
+    )
+
+    assert [client.read(path) for client, path in resolved] == [
+        f"file {i}".encode() for i in range(3)
+    ]
@@ -0,0 +1,149 @@
+import os
+from array import array
+
+import pytest
+
+from pys3thon.s3.bulk import DeleteError
+
+
+def test_read_range(fs_opendal_client):
+    client = fs_opendal_client
+    content = os.urandom(1024)
+    client.write("file.bin", content)
+
+    assert client.read_range("file.bin", 10, 20) == content[10:30]
+    assert client.read_range("file.bin", 10, 0) == b""
+
+
+def test_read_ranges(fs_opendal_client):
+    client = fs_opendal_client
+    content = os.urandom(4096)
+    client.write("file.bin", content)
+
+    assert client.read_ranges("file.bin", [(4000, 96), (0, 8), (16, 8)]) == [
+        content[4000:],
+        content[0:8],
+        content[16:24],
+    ]
+
+
+def test_write_compressed(fs_opendal_client):
+    client = fs_opendal_client
+    content = b"compressible " * 1000
+    client.write("file.txt.zst", content, content_encoding="zstd")
+
+    assert len(bytes(client.read("file.txt.zst"))) < len(content) / 10
+    assert client.read("file.txt.zst", decompress=True) == content
+
+
+def test_read_many_ordered(fs_opendal_client):
+    client = fs_opendal_client
+    contents = {f"file_{i}.bin": os.urandom(1024 * (i % 5)) for i in range(50)}
+    for path, content in contents.items():
+        client.write(path, content)
+
+    results = list(client.read_many(contents, concurrency=8))
+
+    assert results == list(contents.items())
+
+
+def test_read_many_unordered_with_byte_cap(fs_opendal_client):
+    client = fs_opendal_client
+    contents = {f"file_{i}.bin": os.urandom(4096) for i in range(20)}
+    for path, content in contents.items():
+        client.write(path, content)
+
+    results = dict(
+        client.read_many(contents, concurrency=4, ordered=False, max_bytes_in_flight=1)
+    )
+
+    assert results == contents
+
+
+def test_read_many_raises_and_stops_on_missing_object(fs_opendal_client):
+    client = fs_opendal_client
+    client.write("exists.bin", b"Hello, world!")
+
+    reads = client.read_many(["exists.bin", "missing.bin"])
+
+    assert next(reads) == ("exists.bin", b"Hello, world!")
+    with pytest.raises(Exception):
+        next(reads)
+
+
+def test_write_many(fs_opendal_client):
+    client = fs_opendal_client
+    items = [(f"file_{i}.bin", os.urandom(1024 * i)) for i in range(20)]
+    items.append(("large.bin", bytearray(os.urandom(3 * 1024 * 1024))))
+    items.append(("view.bin", memoryview(os.urandom(1024))))
+    items.append(("large_view.bin", memoryview(os.urandom(3 * 1024 * 1024 + 1))))
+    items.append(("doubles.bin", memoryview(array("d", range(1024)))))
+
+    result = client.write_many(
+        items, concurrency=4, multipart_threshold=1024 * 1024, part_size=1024 * 1024
+    )
+
+    assert result.succeeded
+    assert sorted(result.written) == sorted(path for path, _ in items)
+    assert result.bytes_written == sum(memoryview(data).nbytes for _, data in items)
+    assert result.throughput > 0
+    for path, data in items:
+        assert bytes(client.read(path)) == bytes(data)
+
+
+def test_write_many_reports_failures(fs_opendal_client):
+    client = fs_opendal_client
+    client.write("directory/file.bin", b"")
+
+    result = client.write_many(
+        [("ok.bin", b"data"), ("directory", b"data"), ("text.txt", "data")]
+    )
+
+    assert result.written == ["ok.bin"]
+    assert sorted(result.failed) == ["directory", "text.txt"]
+    assert isinstance(result.failed["text.txt"], TypeError)
+
+
+def test_delete_many(fs_opendal_client):
+    client = fs_opendal_client
+    paths = [f"file_{i}.bin" for i in range(20)]
+    for path in paths:
+        client.write(path, b"data")
+
+    result = client.delete_many(paths, concurrency=4, verify=True)
+
+    assert result.succeeded
+    assert sorted(result.results) == sorted(paths)
+    assert not any(client.operator.exists(path) for path in paths)
+
+
+def test_delete_many_verify_reports_objects_still_present(fs_opendal_client, mocker):
+    client = fs_opendal_client
+    client.write("file.bin", b"data")
+
+    class AsyncOperator:
+        async def delete(self, path):
+            pass
+
+        async def exists(self, path):
+            return True
+
+    mocker.patch.object(client, "operator", mocker.Mock())
+    client.operator.to_async_operator.return_value = AsyncOperator()
+    result = client.delete_many(["file.bin"], verify=True)
+
+    assert result.results == {}
+    assert result.failed["file.bin"].code == "NotDeleted"
+
+
+def test_delete_verify(fs_opendal_client, mocker):
+    client = fs_opendal_client
+    client.write("file.bin", b"data")
+
+    client.delete("file.bin", verify=True)
+    assert not client.operator.exists("file.bin")
+
+    mocker.patch.object(client, "operator", mocker.Mock())
+    client.operator.exists.return_value = True
+    with pytest.raises(DeleteError):
+        client.delete("file.bin", verify=True)
@@ -0,0 +1,156 @@
+import io
+import os
+import tarfile
+import zipfile
+from uuid import uuid4
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from pys3thon.s3 import archive
+from pys3thon.s3.client import S3Client
+
+
+def upload_test_prefix(s3_client, prefix):
+    contents = {
+        "file_1.txt": b"Hello, world!",
+        "nested1/file_2.txt": b"Goodbye, world!",
+        "nested1/nested2/file_3.bin": os.urandom(6 * 1024 * 1024),
+    }
+    for name, content in contents.items():
+        s3_client.upload_buffer(content, "test-bucket", f"{prefix}/{name}")
+    return contents
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "tar.gz", "zip"])
+@mock_aws
+def test_create_and_extract_archive(archive_format):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    prefix = str(uuid4())
+    contents = upload_test_prefix(s3_client, prefix)
+    archive_key = f"{str(uuid4())}/archive.{archive_format}"
+
+    archived_keys = s3_client.create_archive(
+        "test-bucket",
+        f"{prefix}/",
+        "test-bucket",
+        archive_key,
+        part_size=5 * 1024 * 1024,
+    )
+    assert sorted(archived_keys) == sorted(f"{prefix}/{name}" for name in contents)
+
+    extracted_keys = s3_client.extract_archive(
+        "test-bucket",
+        archive_key,
+        "test-bucket",
+        "extracted",
+        part_size=5 * 1024 * 1024,
+    )
+    assert sorted(extracted_keys) == sorted(f"extracted/{name}" for name in contents)
+    for name, content in contents.items():
+        body = s3_client.get_streaming_body("test-bucket", f"extracted/{name}")
+        assert body.read() == content
+
+
+@mock_aws
+def test_create_archive_is_readable_locally():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    prefix = str(uuid4())
+    contents = upload_test_prefix(s3_client, prefix)
+
+    s3_client.create_archive("test-bucket", prefix, "test-bucket", "archive.tar")
+    s3_client.create_archive("test-bucket", prefix, "test-bucket", "archive.zip")
+
+    tar_bytes = s3_client.get_streaming_body("test-bucket", "archive.tar").read()
+    with tarfile.open(fileobj=io.BytesIO(tar_bytes)) as archive:
+        assert {
+            member.name: archive.extractfile(member).read() for member in archive
+        } == contents
+
+    zip_bytes = s3_client.get_streaming_body("test-bucket", "archive.zip").read()
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+        assert {name: archive.read(name) for name in archive.namelist()} == contents
+
+
+@mock_aws
+def test_create_archive_with_unsupported_format():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+
+    with pytest.raises(ValueError):
+        s3_client.create_archive(
+            "test-bucket", "prefix", "test-bucket", "archive.7z", archive_format="7z"
+        )
+
+
+@mock_aws
+def test_prefetch_objects_reads_small_objects_and_defers_large_ones(mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    prefix = str(uuid4())
+    upload_test_prefix(s3_client, prefix)
+    get_object = mocker.spy(s3_client.client, "get_object")
+    contents = s3_client.client.list_objects_v2(Bucket="test-bucket", Prefix=prefix)[
+        "Contents"
+    ]
+
+    def requested(key):
+        return any(call.kwargs["Key"] == key for call in get_object.call_args_list)
+
+    large_key = f"{prefix}/nested1/nested2/file_3.bin"
+    objects = archive._prefetch_objects(
+        s3_client, "test-bucket", contents, 1024 * 1024, max_concurrency=2
+    )
+    for content, response in objects:
+        if content["Key"] == large_key:
+            # streamed, and only requested once it is reached
+            assert not isinstance(response["Body"], io.BytesIO)
+            assert len(response["Body"].read()) == content["Size"]
+        else:
+            assert isinstance(response["Body"], io.BytesIO)
+            assert not requested(large_key)
+
+
+@mock_aws
+def test_extract_archive_fails_on_first_upload_error(mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    tar_bytes = io.BytesIO()
+    with tarfile.open(fileobj=tar_bytes, mode="w") as tar:
+        for i in range(20):
+            info = tarfile.TarInfo(f"file_{i}.txt")
+            info.size = 5
+            tar.addfile(info, io.BytesIO(b"hello"))
+    s3_client.upload_buffer(tar_bytes.getvalue(), "test-bucket", "archive.tar")
+    upload_buffer = mocker.patch.object(
+        s3_client, "upload_buffer", side_effect=IOError("upload failed")
+    )
+
+    with pytest.raises(IOError, match="upload failed"):
+        s3_client.extract_archive(
+            "test-bucket", "archive.tar", "test-bucket", "extracted", max_concurrency=1
+        )
+    assert upload_buffer.call_count <= 2
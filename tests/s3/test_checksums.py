@@ -0,0 +1,279 @@
+import hashlib
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import boto3
+import pytest
+from boto3.s3.transfer import TransferConfig
+from moto import mock_aws
+
+from pys3thon.s3 import checksums
+from pys3thon.s3.checksums import (
+    ChecksumMismatchError,
+    ETagVerifier,
+    MissingChecksumError,
+    MultipartETagHasher,
+    verifiable_etag,
+)
+from pys3thon.s3.client import S3Client
+
+PART_SIZE_5MB = 5 * 1024 * 1024
+
+
+def _create_bucket():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+
+
+@mock_aws
+@pytest.mark.parametrize("checksum", ["SHA256", "SHA1", "CRC32"])
+def test_download_verifies_checksum(tmpdir, checksum):
+    _create_bucket()
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    content = os.urandom(1024 * 1024)
+    s3_client.put_object(content, "test-bucket", key, ChecksumAlgorithm=checksum)
+
+    save_path = Path(tmpdir) / "file.bin"
+    s3_client.download("test-bucket", key, save_path, checksum=checksum)
+
+    assert save_path.read_bytes() == content
+
+
+@mock_aws
+def test_download_verifies_composite_checksum_of_multipart_upload(tmpdir):
+    _create_bucket()
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    content = os.urandom(12 * 1024 * 1024)
+    s3_client.upload_buffer(
+        content,
+        "test-bucket",
+        key,
+        multipart_threshold=PART_SIZE_5MB,
+        part_size=PART_SIZE_5MB,
+        ChecksumAlgorithm="SHA256",
+    )
+
+    save_path = Path(tmpdir) / "file.bin"
+    s3_client.download("test-bucket", key, save_path, checksum="SHA256")
+
+    assert save_path.read_bytes() == content
+
+
+@mock_aws
+def test_download_verifies_multipart_etag(tmpdir):
+    _create_bucket()
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    content = os.urandom(12 * 1024 * 1024)
+    with s3_client.open_multipart_writer(
+        "test-bucket", key, part_size=PART_SIZE_5MB
+    ) as writer:
+        writer.write(content)
+
+    save_path = Path(tmpdir) / "file.bin"
+    s3_client.download(
+        "test-bucket",
+        key,
+        save_path,
+        checksum="ETAG",
+        Config=TransferConfig(max_concurrency=4),
+    )
+
+    assert save_path.read_bytes() == content
+
+
+@mock_aws
+@pytest.mark.parametrize("checksum", ["SHA256", "ETAG"])
+def test_download_verifies_multipart_upload_with_parts_of_different_sizes(
+    tmpdir, checksum
+):
+    _create_bucket()
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    part_sizes = [6 * 1024 * 1024, PART_SIZE_5MB, 1024 * 1024]
+    content = os.urandom(sum(part_sizes))
+    upload_id = s3_client.client.create_multipart_upload(
+        Bucket="test-bucket", Key=key, ChecksumAlgorithm="SHA256"
+    )["UploadId"]
+    parts = []
+    start = 0
+    for part_number, part_size in enumerate(part_sizes, start=1):
+        response = s3_client.client.upload_part(
+            Bucket="test-bucket",
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=content[start : start + part_size],  # noqa: E203
+            ChecksumAlgorithm="SHA256",
+        )
+        parts.append(
+            checksums.completed_part(
+                part_number, response, {"ChecksumAlgorithm": "SHA256"}
+            )
+        )
+        start += part_size
+    s3_client.client.complete_multipart_upload(
+        Bucket="test-bucket",
+        Key=key,
+        UploadId=upload_id,
+        MultipartUpload={"Parts": parts},
+    )
+
+    save_path = Path(tmpdir) / "file.bin"
+    s3_client.download("test-bucket", key, save_path, checksum=checksum)
+
+    assert save_path.read_bytes() == content
+
+
+@mock_aws
+def test_download_checksum_of_single_part_object_uses_ranged_gets(tmpdir, mocker):
+    _create_bucket()
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    content = os.urandom(1024 * 1024)
+    s3_client.put_object(content, "test-bucket", key, ChecksumAlgorithm="SHA256")
+    get_object = mocker.spy(s3_client.client, "get_object")
+
+    save_path = Path(tmpdir) / "file.bin"
+    s3_client.download(
+        "test-bucket",
+        key,
+        save_path,
+        checksum="SHA256",
+        Config=TransferConfig(multipart_chunksize=256 * 1024, max_concurrency=4),
+    )
+
+    assert save_path.read_bytes() == content
+    assert get_object.call_count == 4
+
+
+@mock_aws
+def test_download_checksum_mismatch_leaves_no_file(tmpdir, mocker):
+    _create_bucket()
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    s3_client.put_object(
+        b"Hello, world!", "test-bucket", key, ChecksumAlgorithm="SHA256"
+    )
+    mocker.patch.object(checksums, "stored_checksum", return_value=("AAAA", None))
+
+    save_path = Path(tmpdir) / "file.bin"
+    with pytest.raises(ChecksumMismatchError) as e:
+        s3_client.download("test-bucket", key, save_path, checksum="SHA256")
+
+    assert e.value.expected == "AAAA"
+    assert list(Path(tmpdir).iterdir()) == []
+
+
+@mock_aws
+def test_download_missing_checksum(tmpdir):
+    _create_bucket()
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    s3_client.put_object(
+        b"Hello, world!", "test-bucket", key, ChecksumAlgorithm="CRC32"
+    )
+
+    with pytest.raises(MissingChecksumError):
+        s3_client.download(
+            "test-bucket", key, Path(tmpdir) / "file.bin", checksum="SHA1"
+        )
+
+
+@mock_aws
+def test_download_etag_of_kms_encrypted_object_is_missing(tmpdir, mocker):
+    _create_bucket()
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    s3_client.put_object(b"Hello, world!", "test-bucket", key)
+    head_object = s3_client.client.head_object
+
+    def kms_head_object(**kwargs):
+        # the ETag of an SSE-KMS object is not the MD5 of its data
+        return {
+            **head_object(**kwargs),
+            "ServerSideEncryption": "aws:kms",
+            "ETag": '"0123456789abcdef0123456789abcdef"',
+        }
+
+    mocker.patch.object(s3_client.client, "head_object", side_effect=kms_head_object)
+
+    with pytest.raises(MissingChecksumError):
+        s3_client.download(
+            "test-bucket", key, Path(tmpdir) / "file.bin", checksum="ETAG"
+        )
+    assert list(Path(tmpdir).iterdir()) == []
+
+
+def test_download_checksum_with_decompress_raises(tmpdir):
+    with pytest.raises(ValueError):
+        S3Client().download(
+            "test-bucket", "key", tmpdir, decompress=True, checksum="SHA256"
+        )
+
+
+def test_multipart_etag_hasher():
+    content = os.urandom(11 * 1024)
+    hasher = MultipartETagHasher(4 * 1024)
+    for start in range(0, len(content), 3000):
+        hasher.update(content[start : start + 3000])  # noqa: E203
+
+    part_digests = [
+        hashlib.md5(content[start : start + 4 * 1024]).digest()  # noqa: E203
+        for start in range(0, len(content), 4 * 1024)
+    ]
+    expected = hashlib.md5(b"".join(part_digests)).hexdigest()
+    assert hasher.etag() == f'"{expected}-3"'
+
+
+def test_etag_verifier():
+    verifier = ETagVerifier([4 * 1024])
+    verifier.update(b"Hello, world!")
+
+    assert verifier.verify("file", f'"{hashlib.md5(b"Hello, world!").hexdigest()}"')
+    # a multipart ETag of a part size the verifier doesn't hash can't be checked
+    assert not verifier.verify(
+        "file", '"00000000000000000000000000000000-2"', part_size=6 * 1024
+    )
+    with pytest.raises(ChecksumMismatchError):
+        verifier.verify("file", '"00000000000000000000000000000000"')
+
+
+def test_verifiable_etag():
+    md5_etag = f'"{hashlib.md5(b"Hello, world!").hexdigest()}"'
+    multipart_etag = '"00000000000000000000000000000000-2"'
+
+    assert verifiable_etag({"ETag": md5_etag}) == (md5_etag, None)
+    # Azure Blob style ETags aren't MD5s of the data
+    assert verifiable_etag({"ETag": '"0x8DBF0A5C3F2A1B4"'}) is None
+    assert (
+        verifiable_etag({"ETag": md5_etag, "ServerSideEncryption": "aws:kms"}) is None
+    )
+    # the part size is needed to recompute a multipart ETag
+    assert verifiable_etag({"ETag": multipart_etag, "ContentLength": 10}) is None
+    assert verifiable_etag(
+        {"ETag": multipart_etag, "ContentLength": 10}, {"ContentLength": 6}
+    ) == (multipart_etag, 6)
+    # a part count that doesn't match the first part's size means parts of
+    # different sizes
+    assert (
+        verifiable_etag(
+            {"ETag": multipart_etag, "ContentLength": 10}, {"ContentLength": 3}
+        )
+        is None
+    )
+
+
+def test_crc32c_requires_native_implementation():
+    try:
+        hasher = checksums.new_hasher("CRC32C")
+    except ImportError:
+        pytest.skip("no CRC32C implementation installed")
+    hasher.update(b"123456789")
+    assert hasher.digest() == bytes.fromhex("e3069283")
@@ -0,0 +1,75 @@
+import io
+from pathlib import Path
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+
+DATA = b"".join(b"2024-01-01 INFO request %d handled\n" % i for i in range(20000))
+
+
+def create_bucket():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    return S3Client()
+
+
+@pytest.mark.parametrize("content_encoding", ["gzip", "zstd"])
+@mock_aws
+def test_upload_compressed_and_download_decompressed(tmpdir, content_encoding):
+    s3_client = create_bucket()
+    path = Path(tmpdir) / "app.log"
+    path.write_bytes(DATA)
+
+    s3_client.upload_file(
+        str(path),
+        "test-bucket",
+        "app.log",
+        content_encoding=content_encoding,
+        compression_threads=2,
+    )
+
+    head = s3_client.head_object("test-bucket", "app.log")
+    assert head["ContentEncoding"] == content_encoding
+    assert head["ContentLength"] < len(DATA) / 5
+
+    save_path = Path(tmpdir) / "downloaded.log"
+    assert s3_client.download("test-bucket", "app.log", save_path, decompress=True)
+    assert save_path.read_bytes() == DATA
+
+    with s3_client.get_streaming_body(
+        "test-bucket", "app.log", decompress=True
+    ) as body:
+        assert body.read() == DATA
+
+
+@mock_aws
+def test_upload_fileobj_compressed_keeps_extra_args():
+    s3_client = create_bucket()
+
+    s3_client.upload_fileobj(
+        io.BytesIO(DATA),
+        "test-bucket",
+        "app.log",
+        content_encoding="gzip",
+        ExtraArgs={"ContentType": "text/plain"},
+    )
+
+    head = s3_client.head_object("test-bucket", "app.log")
+    assert head["ContentType"] == "text/plain"
+    assert head["ContentEncoding"] == "gzip"
+
+
+@mock_aws
+def test_download_decompress_without_content_encoding(tmpdir):
+    s3_client = create_bucket()
+    s3_client.put_object(b"plain", "test-bucket", "plain.txt")
+
+    save_path = Path(tmpdir) / "plain.txt"
+    s3_client.download("test-bucket", "plain.txt", save_path, decompress=True)
+    assert save_path.read_bytes() == b"plain"
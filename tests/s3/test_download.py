@@ -1,11 +1,15 @@
 import os
+from datetime import timedelta
 from pathlib import Path
 from uuid import uuid4
 
 import boto3
+import pytest
+from botocore.exceptions import ClientError
 from moto import mock_aws
 
 from pys3thon.s3.client import S3Client
+from pys3thon.utils import DownloadCache
 
 
 @mock_aws
@@ -128,3 +132,185 @@ def test_download_to_temporary_file_with_specified_file_name(tmpdir):
         assert Path(temp_file_path).exists() is False
     except Exception as e:
         assert False, str(e)
+
+
+@mock_aws
+def test_download_to_temporary_file_with_download_cache(tmpdir, mocker):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client(download_cache=DownloadCache(tmpdir / "cache"))
+    source_bucket = "test-bucket"
+    source_key = f"{str(uuid4())}/Nepean.pdf"
+    s3_client.upload_buffer(b"Hello, world!", source_bucket, source_key)
+    write_body_to_file = mocker.spy(s3_client, "_write_body_to_file")
+
+    for _ in range(2):
+        with s3_client.download_to_temporary_file(
+            source_bucket, source_key
+        ) as temp_file_path:
+            assert Path(temp_file_path).name == "Nepean.pdf"
+            assert Path(temp_file_path).read_bytes() == b"Hello, world!"
+        assert Path(temp_file_path).exists() is False
+    assert write_body_to_file.call_count == 1
+
+    s3_client.upload_buffer(b"Goodbye, world!", source_bucket, source_key)
+    with s3_client.download_to_temporary_file(
+        source_bucket, source_key
+    ) as temp_file_path:
+        assert Path(temp_file_path).read_bytes() == b"Goodbye, world!"
+    assert write_body_to_file.call_count == 2
+
+
+@mock_aws
+def test_download_with_validators_skips_unchanged_objects(tmpdir):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    source_bucket = "test-bucket"
+    source_key = f"{str(uuid4())}/Nepean.pdf"
+    s3_client.upload_buffer(b"Hello, world!", source_bucket, source_key)
+    head = s3_client.head_object(source_bucket, source_key)
+
+    save_path = tmpdir / "Nepean.pdf"
+    assert (
+        s3_client.download(
+            source_bucket, source_key, save_path, if_none_match=head["ETag"]
+        )
+        is False
+    )
+    assert (
+        s3_client.download(
+            source_bucket,
+            source_key,
+            save_path,
+            if_modified_since=head["LastModified"] + timedelta(days=1),
+        )
+        is False
+    )
+    assert save_path.exists() is False
+
+    assert (
+        s3_client.download(
+            source_bucket, source_key, save_path, if_none_match='"other"'
+        )
+        is True
+    )
+    assert save_path.read_bytes() == b"Hello, world!"
+
+
+@mock_aws
+def test_download_with_validators_makes_the_download_conditional(tmpdir, mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    source_key = f"{str(uuid4())}/Nepean.pdf"
+    s3_client.upload_buffer(b"Hello, world!", "test-bucket", source_key)
+    etag = s3_client.head_object("test-bucket", source_key)["ETag"]
+    head_object = mocker.spy(s3_client.client, "head_object")
+    get_object = mocker.spy(s3_client.client, "get_object")
+
+    save_path = Path(tmpdir) / "Nepean.pdf"
+    assert s3_client.download(
+        "test-bucket", source_key, save_path, if_none_match='"other"'
+    )
+
+    assert save_path.read_bytes() == b"Hello, world!"
+    # one conditional HEAD, and GETs of the version it returned
+    assert head_object.call_count == 1
+    assert head_object.call_args.kwargs["IfNoneMatch"] == '"other"'
+    assert all(call.kwargs["IfMatch"] == etag for call in get_object.call_args_list)
+
+
+@mock_aws
+def test_get_streaming_body_with_validators():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    source_bucket = "test-bucket"
+    source_key = f"{str(uuid4())}/Nepean.pdf"
+    s3_client.upload_buffer(b"Hello, world!", source_bucket, source_key)
+    etag = s3_client.head_object(source_bucket, source_key)["ETag"]
+
+    assert (
+        s3_client.get_streaming_body(source_bucket, source_key, if_none_match=etag)
+        is None
+    )
+
+    s3_client.upload_buffer(b"Goodbye, world!", source_bucket, source_key)
+    body = s3_client.get_streaming_body(source_bucket, source_key, if_none_match=etag)
+    assert body.read() == b"Goodbye, world!"
+
+
+@mock_aws
+def test_download_to_temporary_file_with_download_cache_revalidates(tmpdir, mocker):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    download_cache = DownloadCache(tmpdir / "cache")
+    s3_client = S3Client(download_cache=download_cache)
+    source_bucket = "test-bucket"
+    source_key = f"{str(uuid4())}/Nepean.pdf"
+    s3_client.upload_buffer(b"Hello, world!", source_bucket, source_key)
+    etag = s3_client.head_object(source_bucket, source_key)["ETag"]
+
+    with s3_client.download_to_temporary_file(source_bucket, source_key):
+        pass
+    assert download_cache.get_cached_etag(source_bucket, source_key) == etag
+
+    get_object = mocker.spy(s3_client.client, "get_object")
+    with s3_client.download_to_temporary_file(
+        source_bucket, source_key
+    ) as temp_file_path:
+        assert Path(temp_file_path).read_bytes() == b"Hello, world!"
+    get_object.assert_called_once_with(
+        Bucket=source_bucket, Key=source_key, IfNoneMatch=etag
+    )
+
+
+@mock_aws
+def test_download_to_temporary_file_with_download_cache_pins_evicted_etag(
+    tmpdir, mocker
+):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    download_cache = DownloadCache(tmpdir / "cache")
+    s3_client = S3Client(download_cache=download_cache)
+    source_bucket = "test-bucket"
+    source_key = f"{str(uuid4())}/Nepean.pdf"
+    s3_client.upload_buffer(b"Hello, world!", source_bucket, source_key)
+    with s3_client.download_to_temporary_file(source_bucket, source_key):
+        pass
+    etag = download_cache.get_cached_etag(source_bucket, source_key)
+
+    # the conditional GET confirmed the cached copy, then the entry was
+    # evicted and the object overwritten before the cache was populated again
+    mocker.patch.object(s3_client, "_get_object_if_modified", return_value=None)
+    mocker.patch.object(download_cache, "get_cached_etag", return_value=etag)
+    download_cache.clear()
+    s3_client.upload_buffer(b"Goodbye, world!", source_bucket, source_key)
+
+    with pytest.raises(ClientError, match="PreconditionFailed"):
+        with s3_client.download_to_temporary_file(source_bucket, source_key):
+            pass
+    assert not download_cache.contains(source_bucket, source_key, etag)
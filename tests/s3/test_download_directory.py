@@ -0,0 +1,144 @@
+from pathlib import Path
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+from pys3thon.s3.directory_transfer import compute_etag
+
+
+def create_bucket_with_files():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    s3_client.put_object(b"file 1", "test-bucket", "data/file_1.txt")
+    s3_client.put_object(b"file 2", "test-bucket", "data/nested1/file_2.txt")
+    s3_client.put_object(b"file 3", "test-bucket", "data/nested1/nested2/file_3.txt")
+    s3_client.put_object(b"", "test-bucket", "data/empty/")
+    s3_client.put_object(b"other", "test-bucket", "other/file_4.txt")
+    return s3_client
+
+
+@mock_aws
+def test_download_directory(tmpdir):
+    tmpdir = Path(tmpdir)
+    s3_client = create_bucket_with_files()
+
+    report = s3_client.download_directory(
+        "test-bucket", "data/", tmpdir, max_concurrency=2, max_bytes_in_flight=8
+    )
+
+    assert report.succeeded
+    assert sorted(report.transferred) == [
+        "data/file_1.txt",
+        "data/nested1/file_2.txt",
+        "data/nested1/nested2/file_3.txt",
+    ]
+    assert report.bytes_transferred == 18
+    assert (tmpdir / "file_1.txt").read_bytes() == b"file 1"
+    assert (tmpdir / "nested1" / "file_2.txt").read_bytes() == b"file 2"
+    assert (tmpdir / "nested1" / "nested2" / "file_3.txt").read_bytes() == b"file 3"
+    assert not (tmpdir / "other").exists()
+
+
+@mock_aws
+def test_download_directory_skips_existing_files(tmpdir):
+    tmpdir = Path(tmpdir)
+    s3_client = create_bucket_with_files()
+    (tmpdir / "nested1").mkdir()
+    (tmpdir / "file_1.txt").write_bytes(b"file 1")
+    (tmpdir / "nested1" / "file_2.txt").write_bytes(b"FILE 2")
+
+    report = s3_client.download_directory("test-bucket", "data/", tmpdir)
+    assert sorted(report.skipped) == ["data/file_1.txt", "data/nested1/file_2.txt"]
+    assert (tmpdir / "nested1" / "file_2.txt").read_bytes() == b"FILE 2"
+
+    report = s3_client.download_directory(
+        "test-bucket", "data/", tmpdir, skip_existing="etag"
+    )
+    assert sorted(report.skipped) == [
+        "data/file_1.txt",
+        "data/nested1/nested2/file_3.txt",
+    ]
+    assert report.transferred == ["data/nested1/file_2.txt"]
+    assert (tmpdir / "nested1" / "file_2.txt").read_bytes() == b"file 2"
+
+
+@mock_aws
+def test_download_directory_skips_existing_files_by_etag_of_any_part_size(tmpdir):
+    tmpdir = Path(tmpdir)
+    s3_client = create_bucket_with_files()
+    content = b"a" * (11 * 1024 * 1024)
+    (tmpdir / "large.bin").write_bytes(content)
+    s3_client.upload_file(
+        str(tmpdir / "large.bin"),
+        "test-bucket",
+        "large/large.bin",
+        Config=TransferConfig(
+            multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024
+        ),
+    )
+
+    report = s3_client.download_directory(
+        "test-bucket", "large/", tmpdir, skip_existing="etag"
+    )
+
+    assert report.skipped == ["large/large.bin"]
+    assert report.transferred == []
+
+
+@mock_aws
+def test_download_directory_skips_unverifiable_etags_by_size(tmpdir, mocker):
+    tmpdir = Path(tmpdir)
+    s3_client = create_bucket_with_files()
+    (tmpdir / "file_1.txt").write_bytes(b"FILE 1")
+    # e.g. an SSE-KMS object
+    mocker.patch.object(s3_client, "get_verifiable_etag", return_value=None)
+
+    report = s3_client.download_directory(
+        "test-bucket", "data/", tmpdir, skip_existing="etag"
+    )
+
+    assert report.skipped == ["data/file_1.txt"]
+    assert (tmpdir / "file_1.txt").read_bytes() == b"FILE 1"
+
+
+@mock_aws
+def test_download_directory_reports_failures(tmpdir, mocker):
+    tmpdir = Path(tmpdir)
+    s3_client = create_bucket_with_files()
+    download_file = s3_client.client.download_file
+
+    def failing_download_file(bucket, key, *args, **kwargs):
+        if key == "data/nested1/file_2.txt":
+            raise IOError("connection reset")
+        return download_file(bucket, key, *args, **kwargs)
+
+    mocker.patch.object(
+        s3_client.client, "download_file", side_effect=failing_download_file
+    )
+    report = s3_client.download_directory("test-bucket", "data/", tmpdir)
+
+    assert not report.succeeded
+    assert list(report.failed) == ["data/nested1/file_2.txt"]
+    assert isinstance(report.failed["data/nested1/file_2.txt"], IOError)
+    assert len(report.transferred) == 2
+
+
+@mock_aws
+def test_compute_etag_matches_multipart_upload(tmpdir):
+    path = Path(tmpdir) / "file.bin"
+    path.write_bytes(b"a" * (11 * 1024 * 1024))
+    s3_client = create_bucket_with_files()
+    config = TransferConfig(
+        multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024
+    )
+    s3_client.upload_file(str(path), "test-bucket", "file.bin", Config=config)
+
+    etag = s3_client.head_object("test-bucket", "file.bin")["ETag"]
+    assert etag.endswith('-3"')
+    assert compute_etag(path, 5 * 1024 * 1024) == etag
@@ -0,0 +1,66 @@
+import io
+import os
+from pathlib import Path
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+from pys3thon.s3.encrypted_client import EncryptedS3Client
+from pys3thon.utils import EnvelopeEncryption
+
+
+def create_encrypted_client():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    return s3_client, EncryptedS3Client(
+        s3_client, EnvelopeEncryption(os.urandom(32), frame_size=1024)
+    )
+
+
+@mock_aws
+def test_upload_and_download_encrypted(tmpdir):
+    s3_client, encrypted_client = create_encrypted_client()
+    data = os.urandom(10 * 1024 + 7)
+
+    encrypted_client.upload_fileobj(io.BytesIO(data), "test-bucket", "file.bin")
+
+    stored = s3_client.client.get_object(Bucket="test-bucket", Key="file.bin")
+    assert data[:64] not in stored["Body"].read()
+    assert encrypted_client.get_object("test-bucket", "file.bin") == data
+    assert encrypted_client.get_object_size("test-bucket", "file.bin") == len(data)
+
+    save_path = Path(tmpdir) / "file.bin"
+    encrypted_client.download("test-bucket", "file.bin", save_path)
+    assert save_path.read_bytes() == data
+
+
+@mock_aws
+def test_read_range_encrypted(mocker):
+    s3_client, encrypted_client = create_encrypted_client()
+    data = os.urandom(10 * 1024)
+    encrypted_client.put_object(data, "test-bucket", "file.bin")
+    read_range = mocker.spy(s3_client, "read_range")
+
+    assert encrypted_client.read_range("test-bucket", "file.bin", 2100, 100) == (
+        data[2100:2200]
+    )
+    # the header and the single frame holding the range
+    assert read_range.call_count == 2
+    assert read_range.call_args.args[3] == 1024 + 16
+
+
+@mock_aws
+def test_download_removes_file_that_fails_to_decrypt(tmpdir):
+    s3_client, encrypted_client = create_encrypted_client()
+    s3_client.put_object(b"plaintext", "test-bucket", "file.bin")
+
+    save_path = Path(tmpdir) / "file.bin"
+    with pytest.raises(ValueError):
+        encrypted_client.download("test-bucket", "file.bin", save_path)
+    assert not save_path.exists()
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone
+
+import boto3
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+from pys3thon.s3.listing_filter import compile_listing_filter
+
+
+def create_bucket_with_files():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    s3_client.put_object(b"a" * 10, "test-bucket", "data/2024-01.csv")
+    s3_client.put_object(b"a" * 100, "test-bucket", "data/2024-02.csv")
+    s3_client.put_object(b"a" * 1000, "test-bucket", "data/2024-02.json")
+    s3_client.put_object(
+        b"a" * 50, "test-bucket", "data/2023-12.csv", StorageClass="GLACIER"
+    )
+    return s3_client
+
+
+@mock_aws
+def test_get_files_for_bucket_with_prefix_with_filters_and_fields():
+    s3_client = create_bucket_with_files()
+
+    files = s3_client.get_files_for_bucket_with_prefix(
+        "test-bucket", "data/", suffix=".csv", min_size=20, fields=["Key", "Size"]
+    )
+
+    assert files == [
+        {"Key": "data/2023-12.csv", "Size": 50},
+        {"Key": "data/2024-02.csv", "Size": 100},
+    ]
+
+
+@mock_aws
+def test_get_s3_keys_with_glob_and_storage_class():
+    s3_client = create_bucket_with_files()
+
+    assert s3_client.get_s3_keys("test-bucket", "data/", glob="data/2024-02.*") == [
+        "data/2024-02.csv",
+        "data/2024-02.json",
+    ]
+    assert s3_client.get_s3_keys("test-bucket", "data/", storage_class="GLACIER") == [
+        "data/2023-12.csv"
+    ]
+
+
+@mock_aws
+def test_iter_objects_with_filters():
+    s3_client = create_bucket_with_files()
+    now = datetime.now(timezone.utc)
+
+    keys = [
+        content["Key"]
+        for content in s3_client.iter_objects(
+            "test-bucket", "data/", parallel=True, max_size=100, suffix=(".csv",)
+        )
+    ]
+    assert keys == ["data/2023-12.csv", "data/2024-01.csv", "data/2024-02.csv"]
+
+    assert (
+        list(
+            s3_client.iter_objects(
+                "test-bucket", "data/", modified_since=now + timedelta(hours=1)
+            )
+        )
+        == []
+    )
+    assert (
+        len(
+            list(
+                s3_client.iter_objects(
+                    "test-bucket", "data/", modified_since=now - timedelta(hours=1)
+                )
+            )
+        )
+        == 4
+    )
+
+
+def test_compile_listing_filter_without_filters():
+    assert compile_listing_filter() is None
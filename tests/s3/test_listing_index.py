@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import boto3
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+from pys3thon.s3.listing_index import ListingIndex
+
+
+def keys(contents):
+    return [content["Key"] for content in contents]
+
+
+@mock_aws
+def test_scan_prefix_reports_added_removed_and_changed(tmpdir):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    listing_index = ListingIndex(Path(tmpdir) / "listing.db")
+    for name in ["a.txt", "b.txt", "c.txt"]:
+        s3_client.upload_buffer(b"v1", "test-bucket", f"logs/{name}")
+    s3_client.upload_buffer(b"v1", "test-bucket", "other/d.txt")
+
+    changes = s3_client.scan_prefix("test-bucket", "logs/", listing_index)
+    assert keys(changes.added) == ["logs/a.txt", "logs/b.txt", "logs/c.txt"]
+    assert changes.removed == []
+    assert changes.changed == []
+
+    s3_client.delete_object("test-bucket", "logs/a.txt")
+    s3_client.upload_buffer(b"v2", "test-bucket", "logs/b.txt")
+    s3_client.upload_buffer(b"v1", "test-bucket", "logs/d.txt")
+
+    changes = s3_client.scan_prefix("test-bucket", "logs/", listing_index)
+    assert keys(changes.added) == ["logs/d.txt"]
+    assert keys(changes.removed) == ["logs/a.txt"]
+    assert keys(changes.changed) == ["logs/b.txt"]
+
+    assert keys(listing_index.list("test-bucket", "logs/")) == [
+        "logs/b.txt",
+        "logs/c.txt",
+        "logs/d.txt",
+    ]
+    assert listing_index.get("test-bucket", "logs/b.txt")["Size"] == 2
+    assert listing_index.get("test-bucket", "logs/a.txt") is None
+    assert listing_index.list("test-bucket", "other/") == []
+
+
+@mock_aws
+def test_scan_prefix_starting_after_last_key(tmpdir, mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    listing_index = ListingIndex(Path(tmpdir) / "listing.db")
+    for name in ["2024-01-01.log", "2024-01-02.log"]:
+        s3_client.upload_buffer(b"log", "test-bucket", f"logs/{name}")
+    s3_client.scan_prefix("test-bucket", "logs/", listing_index)
+
+    s3_client.upload_buffer(b"log", "test-bucket", "logs/2024-01-03.log")
+    paginator = mocker.spy(s3_client, "_construct_s3_paginator")
+    changes = s3_client.scan_prefix(
+        "test-bucket", "logs/", listing_index, start_after_last_key=True
+    )
+
+    assert keys(changes.added) == ["logs/2024-01-03.log"]
+    paginator.assert_called_once_with(
+        "test-bucket", prefix="logs/", start_after="logs/2024-01-02.log"
+    )
+    assert listing_index.last_key("test-bucket", "logs/") == "logs/2024-01-03.log"
+    assert len(listing_index.list("test-bucket", "logs/")) == 3
+
+
+@mock_aws
+def test_listing_index_persists_between_instances(tmpdir):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    s3_client.upload_buffer(b"v1", "test-bucket", "logs/a.txt")
+
+    listing_index = ListingIndex(Path(tmpdir) / "listing.db")
+    s3_client.scan_prefix("test-bucket", "logs/", listing_index)
+    listing_index.close()
+
+    listing_index = ListingIndex(Path(tmpdir) / "listing.db")
+    changes = s3_client.scan_prefix("test-bucket", "logs/", listing_index)
+    assert changes.added == []
+    assert keys(listing_index.list("test-bucket")) == ["logs/a.txt"]
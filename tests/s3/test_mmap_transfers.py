@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+
+
+@mock_aws
+def test_upload_file_with_mmap(tmpdir):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/large_file.bin"
+    content = os.urandom(12 * 1024 * 1024)
+
+    tmp_file_path = tmpdir / "large_file.bin"
+    tmp_file_path.write_bytes(content)
+
+    config = TransferConfig(
+        multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024
+    )
+    s3_client.upload_file(
+        str(tmp_file_path),
+        "test-bucket",
+        key,
+        Config=config,
+        use_mmap=True,
+        ExtraArgs={"ContentType": "application/octet-stream"},
+    )
+
+    assert s3_client.get_streaming_body("test-bucket", key).read() == content
+    assert s3_client.get_object_type("test-bucket", key) == "application/octet-stream"
+
+
+@mock_aws
+def test_upload_empty_file_with_mmap(tmpdir):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/empty_file.bin"
+
+    tmp_file_path = tmpdir / "empty_file.bin"
+    tmp_file_path.write_bytes(b"")
+
+    s3_client.upload_file(str(tmp_file_path), "test-bucket", key, use_mmap=True)
+
+    assert s3_client.get_object_size("test-bucket", key) == 0
+
+
+@mock_aws
+def test_download_with_mmap(tmpdir):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    content = os.urandom(3 * 1024 * 1024 + 17)
+    s3_client.upload_buffer(content, "test-bucket", key)
+
+    config = TransferConfig(multipart_chunksize=1024 * 1024)
+    save_path = tmpdir / "file.bin"
+    s3_client.download(
+        "test-bucket", key, save_path, show_progress=True, Config=config, use_mmap=True
+    )
+
+    assert save_path.read_bytes() == content
+    assert list(tmpdir.iterdir()) == [save_path]
+
+
+@mock_aws
+def test_download_empty_object_with_mmap(tmpdir):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/empty_file.bin"
+    s3_client.upload_buffer(b"", "test-bucket", key)
+
+    save_path = tmpdir / "empty_file.bin"
+    s3_client.download("test-bucket", key, save_path, use_mmap=True)
+
+    assert save_path.exists()
+    assert save_path.read_bytes() == b""
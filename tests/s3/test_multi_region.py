@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import boto3
+from moto import mock_aws
+
+from pys3thon.s3.multi_region import MultiRegionS3Client
+
+
+def create_buckets():
+    for bucket, region in [
+        ("sydney-bucket", "ap-southeast-2"),
+        ("oregon-bucket", "us-west-2"),
+        ("another-sydney-bucket", "ap-southeast-2"),
+    ]:
+        client = boto3.client("s3", region_name=region)
+        client.create_bucket(
+            Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": region}
+        )
+    boto3.client("s3", region_name="ap-southeast-2").put_object(
+        Bucket="sydney-bucket", Key="data/file.txt", Body=b"hello"
+    )
+
+
+@mock_aws
+def test_routes_buckets_to_clients_in_their_region(mocker):
+    create_buckets()
+    s3_client = MultiRegionS3Client()
+    lookup = mocker.spy(s3_client, "_lookup_bucket_region")
+
+    assert s3_client.get_bucket_region("sydney-bucket") == "ap-southeast-2"
+    assert s3_client.get_bucket_region("oregon-bucket") == "us-west-2"
+    assert s3_client.get_bucket_region("sydney-bucket") == "ap-southeast-2"
+    assert lookup.call_count == 2
+
+    sydney_client = s3_client.client_for_bucket("sydney-bucket")
+    assert sydney_client.region_name == "ap-southeast-2"
+    assert s3_client.client_for_bucket("another-sydney-bucket") is sydney_client
+    assert s3_client.client_for_bucket("oregon-bucket").region_name == "us-west-2"
+
+    assert s3_client.head_object("sydney-bucket", "data/file.txt")["ContentLength"] == 5
+    assert s3_client.get_s3_keys("sydney-bucket", "data/") == ["data/file.txt"]
+
+
+@mock_aws
+def test_copy_and_download_across_regions(tmpdir):
+    create_buckets()
+    s3_client = MultiRegionS3Client()
+
+    result = s3_client.copy_many(
+        [
+            ("sydney-bucket", "data/file.txt", "oregon-bucket", "copy/file.txt"),
+            ("sydney-bucket", "missing.txt", "oregon-bucket", "copy/missing.txt"),
+        ],
+        max_concurrency=2,
+    )
+    assert list(result.results) == [
+        ("sydney-bucket", "data/file.txt", "oregon-bucket", "copy/file.txt")
+    ]
+    assert list(result.failed) == [
+        ("sydney-bucket", "missing.txt", "oregon-bucket", "copy/missing.txt")
+    ]
+
+    save_path = Path(tmpdir) / "file.txt"
+    result = s3_client.download_many([("oregon-bucket", "copy/file.txt", save_path)])
+    assert result.succeeded
+    assert save_path.read_bytes() == b"hello"
+
+    result = s3_client.list_many([("sydney-bucket", "data/"), ("oregon-bucket", "")])
+    assert result.results == {
+        ("sydney-bucket", "data/"): ["data/file.txt"],
+        ("oregon-bucket", ""): ["copy/file.txt"],
+    }
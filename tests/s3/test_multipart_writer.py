@@ -0,0 +1,99 @@
+import os
+from uuid import uuid4
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from pys3thon.s3 import multipart_writer
+from pys3thon.s3.client import S3Client
+
+
+@mock_aws
+def test_multipart_writer_uploads_parts():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/large_file.bin"
+    content = os.urandom(12 * 1024 * 1024)
+
+    with s3_client.open_multipart_writer(
+        "test-bucket", key, part_size=5 * 1024 * 1024, max_parts_in_flight=2
+    ) as writer:
+        for start in range(0, len(content), 1024 * 1024):
+            writer.write(content[start : start + 1024 * 1024])  # noqa: E203
+        assert writer.tell() == len(content)
+
+    assert s3_client.get_streaming_body("test-bucket", key).read() == content
+    assert s3_client.head_object("test-bucket", key)["ETag"].endswith('-3"')
+
+
+@mock_aws
+def test_multipart_writer_uses_single_put_for_small_objects():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.txt"
+
+    with s3_client.open_multipart_writer("test-bucket", key) as writer:
+        writer.write(b"Hello, ")
+        writer.write(bytearray(b"world!"))
+
+    assert s3_client.get_streaming_body("test-bucket", key).read() == b"Hello, world!"
+    assert "-" not in s3_client.head_object("test-bucket", key)["ETag"]
+
+
+@mock_aws
+def test_multipart_writer_aborts_on_exception():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/large_file.bin"
+
+    with pytest.raises(RuntimeError):
+        with s3_client.open_multipart_writer(
+            "test-bucket", key, part_size=5 * 1024 * 1024
+        ) as writer:
+            writer.write(os.urandom(6 * 1024 * 1024))
+            raise RuntimeError("source read failed")
+
+    assert not s3_client.check_if_exists_in_s3("test-bucket", key)
+    uploads = s3_client.client.list_multipart_uploads(Bucket="test-bucket")
+    assert uploads.get("Uploads", []) == []
+
+
+def test_multipart_writer_rejects_parts_below_5mb():
+    with pytest.raises(ValueError):
+        S3Client().open_multipart_writer("test-bucket", "key", part_size=1024 * 1024)
+
+
+@mock_aws
+def test_multipart_writer_fails_before_exceeding_max_parts(mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    mocker.patch.object(multipart_writer, "MAX_PARTS", 2)
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/large_file.bin"
+
+    with pytest.raises(ValueError, match="more than 2 parts"):
+        with s3_client.open_multipart_writer(
+            "test-bucket", key, part_size=5 * 1024 * 1024
+        ) as writer:
+            writer.write(os.urandom(6 * 1024 * 1024))
+            writer.write(os.urandom(5 * 1024 * 1024))
+
+    assert not s3_client.check_if_exists_in_s3("test-bucket", key)
+    uploads = s3_client.client.list_multipart_uploads(Bucket="test-bucket")
+    assert uploads.get("Uploads", []) == []
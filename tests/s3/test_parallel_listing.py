@@ -0,0 +1,74 @@
+import boto3
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+from pys3thon.s3.parallel_listing import alphabet_boundaries, sample_boundaries
+
+KEYS = sorted(
+    [f"flat/{c}{i:03d}.txt" for c in "0aAz" for i in range(30)]
+    + ["flat/-dash.txt", "flat/~tilde.txt", "flat/a", "flat/z"]
+)
+
+
+def create_bucket_with_keys():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    for key in KEYS + ["other/a.txt"]:
+        s3_client.put_object(b"", "test-bucket", key)
+    return s3_client
+
+
+@mock_aws
+def test_iter_keys_sequential():
+    s3_client = create_bucket_with_keys()
+    assert list(s3_client.iter_keys("test-bucket", "flat/")) == KEYS
+
+
+@mock_aws
+def test_iter_keys_parallel_ordered_with_alphabet_boundaries():
+    s3_client = create_bucket_with_keys()
+    keys = list(
+        s3_client.iter_keys("test-bucket", "flat/", parallel=True, max_concurrency=4)
+    )
+    assert keys == KEYS
+
+
+@mock_aws
+def test_iter_keys_parallel_unordered_with_sampled_boundaries():
+    s3_client = create_bucket_with_keys()
+    boundaries = sample_boundaries(KEYS[::7], shards=5)
+    assert len(boundaries) == 4
+
+    keys = list(
+        s3_client.iter_keys(
+            "test-bucket",
+            "flat/",
+            parallel=True,
+            boundaries=boundaries,
+            ordered=False,
+            max_concurrency=3,
+            max_pages_buffered=1,
+        )
+    )
+    assert len(keys) == len(KEYS)
+    assert sorted(keys) == KEYS
+
+
+@mock_aws
+def test_iter_objects_parallel_stops_early():
+    s3_client = create_bucket_with_keys()
+    objects = s3_client.iter_objects(
+        "test-bucket", "flat/", parallel=True, max_pages_buffered=1
+    )
+    first = [next(objects)["Key"] for _ in range(3)]
+    objects.close()
+    assert first == KEYS[:3]
+
+
+def test_alphabet_boundaries():
+    assert alphabet_boundaries("p/", alphabet="ba") == ["p/a", "p/b"]
+    assert sample_boundaries([], shards=4) == []
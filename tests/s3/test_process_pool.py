@@ -0,0 +1,101 @@
+import gzip
+import multiprocessing
+from pathlib import Path
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+
+# worker processes only see the moto mock when forked from the test process
+requires_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="moto state is only shared with forked workers",
+)
+
+
+def create_bucket_with_directory(tmpdir):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    directory = Path(tmpdir) / "output"
+    (directory / "nested").mkdir(parents=True)
+    for i in range(5):
+        (directory / f"file_{i}.txt").write_bytes(b"Hello, world!")
+    (directory / "nested" / "file_5.txt").write_bytes(b"Hello, world!")
+    return S3Client(), directory
+
+
+@mock_aws
+def test_upload_directory_with_thread_backend_and_transform(tmpdir):
+    s3_client, directory = create_bucket_with_directory(tmpdir)
+
+    result = s3_client.upload_directory(
+        directory, "test-bucket", "uploads", backend="thread", transform=gzip.compress
+    )
+
+    assert result.succeeded
+    assert len(result.results) == 6
+    body = s3_client.client.get_object(
+        Bucket="test-bucket", Key="uploads/nested/file_5.txt"
+    )["Body"].read()
+    assert gzip.decompress(body) == b"Hello, world!"
+
+
+@requires_fork
+@mock_aws
+def test_upload_directory_with_process_backend(tmpdir):
+    s3_client, directory = create_bucket_with_directory(tmpdir)
+
+    result = s3_client.upload_directory(
+        directory,
+        "test-bucket",
+        "uploads",
+        backend="process",
+        max_workers=2,
+        chunk_size=2,
+        transform=gzip.compress,
+    )
+
+    assert result.succeeded
+    assert sorted(key for _, _, key in result.results) == [
+        "uploads/file_0.txt",
+        "uploads/file_1.txt",
+        "uploads/file_2.txt",
+        "uploads/file_3.txt",
+        "uploads/file_4.txt",
+        "uploads/nested/file_5.txt",
+    ]
+    assert set(result.results.values()) == {len(gzip.compress(b"Hello, world!"))}
+
+
+@requires_fork
+@mock_aws
+def test_copy_many_reports_failures_from_worker_processes(tmpdir):
+    s3_client, _ = create_bucket_with_directory(tmpdir)
+    s3_client.put_object(b"data", "test-bucket", "source.txt")
+
+    result = s3_client.copy_many(
+        [
+            ("test-bucket", "source.txt", "test-bucket", "copy.txt"),
+            ("test-bucket", "missing.txt", "test-bucket", "copy-missing.txt"),
+        ],
+        backend="process",
+        max_workers=2,
+        chunk_size=1,
+    )
+
+    assert list(result.results) == [
+        ("test-bucket", "source.txt", "test-bucket", "copy.txt")
+    ]
+    assert list(result.failed) == [
+        ("test-bucket", "missing.txt", "test-bucket", "copy-missing.txt")
+    ]
+
+
+def test_copy_many_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        S3Client(region_name="ap-southeast-2").copy_many([], backend="fiber")
@@ -0,0 +1,71 @@
+import os
+from uuid import uuid4
+
+import boto3
+from moto import mock_aws
+
+from pys3thon.opendal.s3.client import OpenDALS3Client
+from pys3thon.s3.client import S3Client
+
+
+@mock_aws
+def test_read_range():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    content = os.urandom(1024)
+    s3_client.upload_buffer(content, "test-bucket", key)
+
+    assert s3_client.read_range("test-bucket", key, 10, 20) == content[10:30]
+    assert s3_client.read_range("test-bucket", key, 1000, 100) == content[1000:]
+    assert s3_client.read_range("test-bucket", key, 10, 0) == b""
+    assert s3_client.read_range("test-bucket", key, 1024, 10) == b""
+    assert s3_client.read_range("test-bucket", key, 2000, 10) == b""
+    assert s3_client.read_ranges("test-bucket", key, [(1020, 10), (4096, 8)]) == [
+        content[1020:],
+        b"",
+    ]
+
+
+@mock_aws
+def test_read_ranges_coalesces_nearby_ranges(mocker):
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    content = os.urandom(4096)
+    s3_client.upload_buffer(content, "test-bucket", key)
+    get_object = mocker.spy(s3_client.client, "get_object")
+
+    results = s3_client.read_ranges(
+        "test-bucket", key, [(4000, 96), (0, 8), (16, 8)], max_gap=16
+    )
+
+    assert results == [content[4000:], content[0:8], content[16:24]]
+    assert get_object.call_count == 2
+
+
+@mock_aws
+def test_opendal_s3_client_read_ranges():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    client = OpenDALS3Client(bucket="test-bucket", region="ap-southeast-2")
+    path = f"{str(uuid4())}/file.bin"
+    content = os.urandom(1024)
+    client.write(path, content)
+
+    assert client.read_range(path, 100, 10) == content[100:110]
+    assert client.read_ranges(path, [(500, 10), (0, 5)]) == [
+        content[500:510],
+        content[0:5],
+    ]
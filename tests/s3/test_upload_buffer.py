@@ -0,0 +1,70 @@
+import mmap
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import boto3
+from moto import mock_aws
+
+from pys3thon.s3.client import S3Client
+
+
+@mock_aws
+def test_upload_buffer_with_small_payloads():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    content = b"Hello, world!"
+
+    for buffer in [content, bytearray(content), memoryview(content)]:
+        key = f"{str(uuid4())}/file.txt"
+        s3_client.upload_buffer(buffer, "test-bucket", key)
+        assert s3_client.get_streaming_body("test-bucket", key).read() == content
+
+
+@mock_aws
+def test_upload_buffer_with_multipart_memoryview():
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/large_file.bin"
+    content = os.urandom(12 * 1024 * 1024)
+
+    s3_client.upload_buffer(
+        memoryview(content),
+        "test-bucket",
+        key,
+        multipart_threshold=5 * 1024 * 1024,
+        part_size=5 * 1024 * 1024,
+    )
+
+    assert s3_client.get_streaming_body("test-bucket", key).read() == content
+    assert s3_client.head_object("test-bucket", key)["ETag"].endswith('-3"')
+
+
+@mock_aws
+def test_upload_buffer_with_mmap(tmpdir):
+    tmpdir = Path(tmpdir)
+    conn = boto3.resource("s3", region_name="ap-southeast-2")
+    conn.create_bucket(
+        Bucket="test-bucket",
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"},
+    )
+    s3_client = S3Client()
+    key = f"{str(uuid4())}/file.bin"
+    content = os.urandom(1024)
+
+    tmp_file_path = tmpdir / "file.bin"
+    tmp_file_path.write_bytes(content)
+
+    with open(tmp_file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            s3_client.upload_buffer(mapped, "test-bucket", key)
+
+    assert s3_client.get_streaming_body("test-bucket", key).read() == content
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET_US = 150_000
+PYS3THON_MODULES = (
+    "import pys3thon.utils, pys3thon.opendal.shared, "
+    "pys3thon.opendal.s3.client, pys3thon.opendal.service"
+)
+LAZY_DEPENDENCIES = [
+    "asgiref",
+    "boto3",
+    "botocore",
+    "cryptography",
+    "opendal",
+    "smart_open",
+    "tqdm",
+]
+
+
+def import_times(statement):
+    """
+    Run `statement` in a fresh interpreter with `-X importtime` and return
+    {module: (cumulative microseconds, is top-level import)}.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        is_top_level = not module[1:].startswith(" ")
+        times[module.strip()] = (int(cumulative), is_top_level)
+    return times
+
+
+def test_heavy_dependencies_are_imported_lazily():
+    times = import_times(PYS3THON_MODULES)
+    assert [module for module in LAZY_DEPENDENCIES if module in times] == []
+
+
+def test_import_time_budget():
+    times = import_times(PYS3THON_MODULES)
+    total = sum(
+        cumulative
+        for module, (cumulative, is_top_level) in times.items()
+        if is_top_level and module.startswith("pys3thon")
+    )
+    assert total <= IMPORT_TIME_BUDGET_US
+
+
+def test_aes256gcm_only_imports_cryptography():
+    times = import_times("from pys3thon.utils import AES256GCM")
+    assert "cryptography" in times
+    assert [
+        module for module in ["boto3", "opendal", "smart_open"] if module in times
+    ] == []
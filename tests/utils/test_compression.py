@@ -0,0 +1,46 @@
+import gzip
+import io
+import os
+
+import pytest
+
+from pys3thon.utils.compression import (
+    compress,
+    compressing_reader,
+    decompress,
+    decompressing_reader,
+    detect_content_encoding,
+)
+
+DATA = b"".join(b'{"line": %d, "payload": "abcabcabc"}\n' % i for i in range(20000))
+
+
+@pytest.mark.parametrize("content_encoding", ["gzip", "zstd"])
+@pytest.mark.parametrize("threads", [0, 4])
+def test_compress_round_trip(content_encoding, threads):
+    compressed = compressing_reader(
+        io.BytesIO(DATA), content_encoding, threads=threads, chunk_size=64 * 1024
+    ).read()
+
+    assert len(compressed) < len(DATA) / 5
+    assert detect_content_encoding(compressed) == content_encoding
+    assert decompressing_reader(io.BytesIO(compressed), content_encoding).read() == DATA
+
+
+def test_parallel_gzip_is_readable_by_gzip():
+    compressed = compress(DATA, "gzip", threads=4)
+    assert gzip.decompress(compressed) == DATA
+    assert decompress(compress(b"", "gzip", threads=4), "gzip") == b""
+
+
+def test_decompress_truncated_gzip_raises():
+    compressed = compress(os.urandom(1024), "gzip")
+    with pytest.raises(EOFError):
+        decompress(compressed[:-10], "gzip")
+
+
+def test_identity_and_unknown_encodings():
+    assert decompress(b"raw", None) == b"raw"
+    assert detect_content_encoding(b"raw") is None
+    with pytest.raises(ValueError):
+        compress(b"raw", "br")
@@ -0,0 +1,138 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from pys3thon.utils import DownloadCache
+
+
+def write_content(content):
+    def download_fn(path):
+        Path(path).write_bytes(content)
+
+    return download_fn
+
+
+def test_link_downloads_once_and_then_hits(tmpdir):
+    cache = DownloadCache(Path(tmpdir) / "cache")
+    downloads = []
+
+    def download_fn(path):
+        downloads.append(path)
+        Path(path).write_bytes(b"Hello, world!")
+
+    with cache.temporary_directory() as temp_directory:
+        assert (
+            cache.link("bucket", "key", '"etag"', temp_directory / "a", download_fn)
+            is False
+        )
+        assert (
+            cache.link("bucket", "key", '"etag"', temp_directory / "b", download_fn)
+            is True
+        )
+        assert (temp_directory / "a").read_bytes() == b"Hello, world!"
+        assert (temp_directory / "b").read_bytes() == b"Hello, world!"
+        assert (
+            os.stat(temp_directory / "a").st_ino == os.stat(temp_directory / "b").st_ino
+        )
+
+    assert len(downloads) == 1
+
+
+def test_link_with_new_etag_downloads_again(tmpdir):
+    cache = DownloadCache(Path(tmpdir) / "cache")
+
+    with cache.temporary_directory() as temp_directory:
+        cache.link("bucket", "key", '"v1"', temp_directory / "a", write_content(b"v1"))
+        cache.link("bucket", "key", '"v2"', temp_directory / "b", write_content(b"v2"))
+        assert (temp_directory / "a").read_bytes() == b"v1"
+        assert (temp_directory / "b").read_bytes() == b"v2"
+
+    assert cache.contains("bucket", "key", '"v1"')
+    assert cache.contains("bucket", "key", '"v2"')
+
+
+def test_evicts_least_recently_used(tmpdir):
+    cache = DownloadCache(Path(tmpdir) / "cache", max_size=20)
+
+    with cache.temporary_directory() as temp_directory:
+        cache.link("bucket", "a", "1", temp_directory / "a", write_content(b"0" * 10))
+        os.utime(cache._entry_path("bucket", "a", "1"), (1, 1))
+        cache.link("bucket", "b", "1", temp_directory / "b", write_content(b"0" * 10))
+        os.utime(cache._entry_path("bucket", "b", "1"), (2, 2))
+        # touching "a" makes "b" the least recently used entry
+        cache.link("bucket", "a", "1", temp_directory / "a2", write_content(b""))
+        cache.link("bucket", "c", "1", temp_directory / "c", write_content(b"0" * 10))
+
+    assert cache.contains("bucket", "a", "1")
+    assert not cache.contains("bucket", "b", "1")
+    assert cache.contains("bucket", "c", "1")
+    assert cache.size() == 20
+
+
+def test_failed_download_is_not_cached(tmpdir):
+    cache = DownloadCache(Path(tmpdir) / "cache")
+
+    def download_fn(path):
+        Path(path).write_bytes(b"partial")
+        raise IOError("connection reset")
+
+    with cache.temporary_directory() as temp_directory:
+        with pytest.raises(IOError):
+            cache.link("bucket", "key", "1", temp_directory / "a", download_fn)
+
+    assert not cache.contains("bucket", "key", "1")
+    assert list((Path(tmpdir) / "cache" / "tmp").iterdir()) == []
+    assert list((Path(tmpdir) / "cache" / "locks").iterdir()) == []
+
+
+def test_lock_files_are_removed_with_their_entries(tmpdir):
+    cache = DownloadCache(Path(tmpdir) / "cache", max_size=10)
+    locks_directory = Path(tmpdir) / "cache" / "locks"
+    # left behind by a process killed while downloading
+    (locks_directory / "orphaned.lock").touch()
+
+    with cache.temporary_directory() as temp_directory:
+        cache.link("bucket", "a", "1", temp_directory / "a", write_content(b"0" * 10))
+        cache.link("bucket", "b", "1", temp_directory / "b", write_content(b"0" * 10))
+
+    entry_name = cache._entry_path("bucket", "b", "1").name
+    assert sorted(path.name for path in locks_directory.iterdir()) == [
+        ".evict.lock",
+        f"{entry_name}.lock",
+    ]
+
+    cache.clear()
+    assert [path.name for path in locks_directory.iterdir()] == [".evict.lock"]
+
+
+def test_validators_are_removed_with_their_entries(tmpdir):
+    cache = DownloadCache(Path(tmpdir) / "cache", max_size=10)
+    validators_directory = Path(tmpdir) / "cache" / "validators"
+
+    with cache.temporary_directory() as temp_directory:
+        cache.link("bucket", "a", "1", temp_directory / "a", write_content(b"0" * 10))
+        cache.link("bucket", "b", "1", temp_directory / "b", write_content(b"0" * 10))
+
+    # the entry of "a" was evicted to make room for "b"
+    assert cache.get_cached_etag("bucket", "a") is None
+    assert [path.name for path in validators_directory.iterdir()] == [
+        cache._validator_path("bucket", "b").name
+    ]
+
+    cache.clear()
+    assert list(validators_directory.iterdir()) == []
+
+
+def test_get_cached_etag_tracks_latest_linked_version(tmpdir):
+    cache = DownloadCache(Path(tmpdir) / "cache", max_size=2)
+
+    assert cache.get_cached_etag("bucket", "key") is None
+    with cache.temporary_directory() as temp_directory:
+        cache.link("bucket", "key", "1", temp_directory / "a", write_content(b"1"))
+        assert cache.get_cached_etag("bucket", "key") == "1"
+        cache.link("bucket", "key", "2", temp_directory / "b", write_content(b"2"))
+        assert cache.get_cached_etag("bucket", "key") == "2"
+
+    cache.clear()
+    assert cache.get_cached_etag("bucket", "key") is None
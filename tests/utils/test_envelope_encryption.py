@@ -0,0 +1,64 @@
+import io
+import os
+
+import pytest
+
+from pys3thon.utils import AES256GCM, EnvelopeEncryption
+
+
+@pytest.mark.parametrize("size", [0, 1, 99, 100, 101, 1050])
+def test_encrypt_decrypt_round_trip(size):
+    encryption = EnvelopeEncryption(os.urandom(32), frame_size=100)
+    data = os.urandom(size)
+
+    encrypted = encryption.encrypt(data)
+
+    assert size < 16 or data not in encrypted
+    assert encryption.decrypt(encrypted) == data
+    assert encryption.encrypting_reader(io.BytesIO(data)).read(5) == b"PYS3E"
+
+
+def test_data_keys_are_wrapped_with_master_key():
+    master_key = AES256GCM(os.urandom(32))
+    data = b"secret" * 100
+    encrypted = EnvelopeEncryption(master_key).encrypt(data)
+
+    assert EnvelopeEncryption(master_key).decrypt(encrypted) == data
+    assert encrypted != EnvelopeEncryption(master_key).encrypt(data)
+    with pytest.raises(ValueError):
+        EnvelopeEncryption(os.urandom(32)).decrypt(encrypted)
+
+
+def test_decrypt_range():
+    encryption = EnvelopeEncryption(os.urandom(32), frame_size=100)
+    data = os.urandom(1050)
+    encrypted = encryption.encrypt(data)
+
+    def read_range(offset, length):
+        end = offset + length
+        return encrypted[offset:end]
+
+    for offset, length in [(0, 1050), (5, 50), (95, 10), (1040, 100), (2000, 10)]:
+        end = offset + length
+        assert (
+            encryption.decrypt_range(read_range, len(encrypted), offset, length)
+            == data[offset:end]
+        )
+    assert encryption.plaintext_size(read_range, len(encrypted)) == 1050
+
+
+def test_truncated_or_tampered_objects_fail_to_decrypt():
+    encryption = EnvelopeEncryption(os.urandom(32), frame_size=100)
+    encrypted = encryption.encrypt(os.urandom(1000))
+
+    with pytest.raises(ValueError):
+        # drop the final frame, leaving only complete frames
+        encryption.decrypt(encrypted[: -(100 + 16)])
+
+    tampered = bytearray(encrypted)
+    tampered[-1] ^= 1
+    with pytest.raises(ValueError):
+        encryption.decrypt(bytes(tampered))
+
+    with pytest.raises(ValueError):
+        encryption.decrypt(b"not encrypted")
@@ -0,0 +1,8 @@
+from pys3thon.utils.keys import relative_key
+
+
+def test_relative_key():
+    assert relative_key("prefix/nested/file.txt", "prefix/") == "nested/file.txt"
+    assert relative_key("prefix/nested/file.txt", "prefix") == "nested/file.txt"
+    assert relative_key("/file.txt", None) == "file.txt"
+    assert relative_key("other/file.txt", "prefix/") == "other/file.txt"
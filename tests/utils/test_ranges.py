@@ -0,0 +1,40 @@
+from pys3thon.utils import coalesce_ranges, read_coalesced_ranges
+
+
+def test_coalesce_ranges_merges_nearby_ranges():
+    assert coalesce_ranges([(100, 10), (0, 10), (15, 5)], max_gap=5) == [
+        (0, 20),
+        (100, 110),
+    ]
+
+
+def test_coalesce_ranges_merges_overlapping_ranges():
+    assert coalesce_ranges([(0, 10), (5, 10), (2, 3)], max_gap=0) == [(0, 15)]
+
+
+def test_coalesce_ranges_respects_max_size():
+    assert coalesce_ranges([(0, 10), (10, 10), (20, 10)], max_gap=0, max_size=20) == [
+        (0, 20),
+        (20, 30),
+    ]
+
+
+def test_read_coalesced_ranges_returns_results_in_request_order():
+    content = bytes(range(256))
+    reads = []
+
+    def read_fn(offset, length):
+        reads.append((offset, length))
+        return content[offset : offset + length]  # noqa: E203
+
+    ranges = [(200, 10), (0, 4), (8, 4), (250, 100), (3, 0)]
+    results = read_coalesced_ranges(ranges, read_fn, max_gap=4)
+
+    assert results == [
+        content[200:210],
+        content[0:4],
+        content[8:12],
+        content[250:],
+        b"",
+    ]
+    assert sorted(reads) == [(0, 12), (200, 10), (250, 100)]